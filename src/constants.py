@@ -2,6 +2,7 @@
 
 # Network/Connection Constants
 REAPER_DEFAULT_PORTS = [2306, 2307, 2308, 2309]
+CONNECTION_CHECK_TTL = 2.0  # seconds a connection check result is reused
 
 # Audio Constants
 DB_CONVERSION_FACTOR = 20.0
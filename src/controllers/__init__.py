@@ -15,12 +15,28 @@ The ReaperController class (defined in `reaper_controller.py`) combines all thes
 into a single, easy-to-use class using composition.
 """
 
-# Import controllers so they can be imported from the controllers package
-from .track.track_controller import TrackController
-from .fx.fx_controller import FXController
-from .marker.marker_controller import MarkerController
-from .midi.midi_controller import MIDIController
-from .audio.audio_controller import AudioController
-from .master.master_controller import MasterController
-from .project.project_controller import ProjectController
-from .routing.routing_controller import RoutingController
+import importlib
+
+# Controllers are imported on first attribute access, so importing one
+# controller module does not import all of them
+_CONTROLLER_MODULES = {
+    "TrackController": ".track.track_controller",
+    "FXController": ".fx.fx_controller",
+    "MarkerController": ".marker.marker_controller",
+    "MIDIController": ".midi.midi_controller",
+    "AudioController": ".audio.audio_controller",
+    "MasterController": ".master.master_controller",
+    "ProjectController": ".project.project_controller",
+    "RoutingController": ".routing.routing_controller",
+}
+
+__all__ = list(_CONTROLLER_MODULES)
+
+
+def __getattr__(name):
+    module_name = _CONTROLLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
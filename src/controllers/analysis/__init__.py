@@ -1,7 +1,8 @@
 """Audio analysis controllers for professional mixing and mastering."""
 
+from .analysis_cache import AnalysisCache
 from .analysis_controller import AnalysisController
 from .loudness_controller import LoudnessController
 from .spectrum_controller import SpectrumController
 
-__all__ = ["AnalysisController", "LoudnessController", "SpectrumController"]
\ No newline at end of file
+__all__ = ["AnalysisCache", "AnalysisController", "LoudnessController", "SpectrumController"]
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Result cache for read-only analysis calls.
+
+Analysis results are keyed by the call arguments plus REAPER's project
+state change count, so any edit to the project invalidates them without
+explicit bookkeeping.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from src.core.reapy_bridge import get_rpr
+
+# REAPER GetPlayState() bits for playing and recording
+PLAY_STATE_PLAYING = 1
+PLAY_STATE_RECORDING = 4
+
+
+def _monitoring_armed_track(RPR) -> bool:
+    """Check whether any track is armed with input monitoring on."""
+    for i in range(RPR.CountTracks(0)):
+        track = RPR.GetTrack(0, i)
+        armed = RPR.GetMediaTrackInfo_Value(track, "I_RECARM")
+        if armed and RPR.GetMediaTrackInfo_Value(track, "I_RECMON"):
+            return True
+    return False
+
+
+def project_state_token() -> Optional[int]:
+    """
+    Get a token identifying the current project state.
+
+    Returns:
+        The project state change count, or None while the meters can move
+        without a project edit (transport running, or an armed track
+        monitoring its input) or if REAPER cannot be queried
+    """
+    try:
+        RPR = get_rpr()
+        if RPR.GetPlayState() & (PLAY_STATE_PLAYING | PLAY_STATE_RECORDING):
+            return None
+        if _monitoring_armed_track(RPR):
+            return None
+        return RPR.GetProjectStateChangeCount(0)
+    except Exception:
+        return None
+
+
+class AnalysisCache:
+    """Bounded LRU cache of analysis results keyed by project state."""
+
+    def __init__(
+        self,
+        maxsize: int = 64,
+        state_token: Callable[[], Optional[Hashable]] = project_state_token,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.maxsize = maxsize
+        self._state_token = state_token
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable description of the call (tool name and arguments)
+            compute: Zero-argument callable producing the result
+
+        Returns:
+            The cached or freshly computed result. None results are not cached.
+        """
+        token = self._state_token()
+        if token is None:
+            return compute()
+
+        full_key = key + (token,)
+        if full_key in self._entries:
+            self._entries.move_to_end(full_key)
+            return self._entries[full_key]
+
+        result = compute()
+        if result is not None:
+            self._entries[full_key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def discard(self, key: tuple) -> None:
+        """
+        Drop the cached results for key under any project state.
+
+        For edits that do not bump the project state change count, such as
+        API writes to a track's volume.
+
+        Args:
+            key: Key as passed to get_or_compute
+        """
+        for full_key in [k for k in self._entries if k[:-1] == key]:
+            del self._entries[full_key]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
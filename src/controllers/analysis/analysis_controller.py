@@ -9,10 +9,21 @@ import logging
 import math
 from typing import Optional, Dict, Any, List, Tuple
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
 from .loudness_controller import LoudnessController, LoudnessMetrics
 from .spectrum_controller import SpectrumController, StereoImageMetrics, CrestFactorResult
 
+# master_chain_analysis sections, with the loudness metric names that map
+# onto the single loudness measurement
+MASTER_CHAIN_SECTIONS = {
+    "loudness": "loudness",
+    "lufs": "loudness",
+    "lra": "loudness",
+    "true_peak": "loudness",
+    "spectrum": "spectrum",
+    "dynamics": "dynamics",
+}
+
 
 class AnalysisController:
     """Main controller for audio analysis operations."""
@@ -58,7 +69,7 @@ class AnalysisController:
             track = project.tracks[track_index]
             
             # Measure current loudness
-            current_metrics = self.loudness.loudness_measure_track(track_index)
+            current_metrics = self.loudness.measure_track_loudness(track)
             if not current_metrics:
                 self.logger.error("Failed to measure track loudness")
                 return False
@@ -181,60 +192,61 @@ class AnalysisController:
             Dictionary containing all analysis results
         """
         try:
-            analysis_results = {}
-            
-            # Loudness analysis
-            loudness_metrics = self.loudness.loudness_measure_track(track_index, window_sec)
-            if loudness_metrics:
-                analysis_results['loudness'] = {
-                    'integrated_lufs': loudness_metrics.integrated_lufs,
-                    'short_term_lufs': loudness_metrics.short_term_lufs,
-                    'momentary_lufs': loudness_metrics.momentary_lufs,
-                    'lra': loudness_metrics.lra,
-                    'true_peak_dbfs': loudness_metrics.true_peak_dbfs
-                }
-            
-            # Spectrum analysis
-            spectrum_data = self.spectrum.spectrum_analyzer_track(track_index, window_sec)
-            if spectrum_data:
-                # Extract key frequency bands
-                analysis_results['spectrum'] = {
-                    'low_freq_energy': self._get_frequency_band_energy(
-                        spectrum_data.frequencies, spectrum_data.magnitudes_db, 20, 250
-                    ),
-                    'mid_freq_energy': self._get_frequency_band_energy(
-                        spectrum_data.frequencies, spectrum_data.magnitudes_db, 250, 4000
-                    ),
-                    'high_freq_energy': self._get_frequency_band_energy(
-                        spectrum_data.frequencies, spectrum_data.magnitudes_db, 4000, 20000
-                    ),
-                    'peak_frequency': self._find_peak_frequency(
-                        spectrum_data.frequencies, spectrum_data.magnitudes_db
-                    )
-                }
-            
-            # Stereo imaging
-            stereo_metrics = self.spectrum.stereo_image_metrics(track_index, window_sec)
-            if stereo_metrics:
-                analysis_results['stereo'] = {
-                    'correlation': stereo_metrics.correlation,
-                    'width': stereo_metrics.width,
-                    'mid_level_db': stereo_metrics.mid_level_db,
-                    'side_level_db': stereo_metrics.side_level_db,
-                    'imbalance_db': stereo_metrics.imbalance_db
-                }
-            
-            # Dynamics analysis
-            crest_factor = self.spectrum.crest_factor_track(track_index, window_sec)
-            if crest_factor:
-                analysis_results['dynamics'] = {
-                    'crest_factor_db': crest_factor.crest_factor_db,
-                    'peak_db': crest_factor.peak_db,
-                    'rms_db': crest_factor.rms_db,
-                    'dynamic_range_db': crest_factor.dynamic_range_db
-                }
-            
-            return analysis_results if analysis_results else None
+            with inside_reaper():
+                analysis_results = {}
+
+                # Loudness analysis
+                loudness_metrics = self.loudness.loudness_measure_track(track_index, window_sec)
+                if loudness_metrics:
+                    analysis_results['loudness'] = {
+                        'integrated_lufs': loudness_metrics.integrated_lufs,
+                        'short_term_lufs': loudness_metrics.short_term_lufs,
+                        'momentary_lufs': loudness_metrics.momentary_lufs,
+                        'lra': loudness_metrics.lra,
+                        'true_peak_dbfs': loudness_metrics.true_peak_dbfs
+                    }
+
+                # Spectrum analysis
+                spectrum_data = self.spectrum.spectrum_analyzer_track(track_index, window_sec)
+                if spectrum_data:
+                    # Extract key frequency bands
+                    analysis_results['spectrum'] = {
+                        'low_freq_energy': self._get_frequency_band_energy(
+                            spectrum_data.frequencies, spectrum_data.magnitudes_db, 20, 250
+                        ),
+                        'mid_freq_energy': self._get_frequency_band_energy(
+                            spectrum_data.frequencies, spectrum_data.magnitudes_db, 250, 4000
+                        ),
+                        'high_freq_energy': self._get_frequency_band_energy(
+                            spectrum_data.frequencies, spectrum_data.magnitudes_db, 4000, 20000
+                        ),
+                        'peak_frequency': self._find_peak_frequency(
+                            spectrum_data.frequencies, spectrum_data.magnitudes_db
+                        )
+                    }
+
+                # Stereo imaging
+                stereo_metrics = self.spectrum.stereo_image_metrics(track_index, window_sec)
+                if stereo_metrics:
+                    analysis_results['stereo'] = {
+                        'correlation': stereo_metrics.correlation,
+                        'width': stereo_metrics.width,
+                        'mid_level_db': stereo_metrics.mid_level_db,
+                        'side_level_db': stereo_metrics.side_level_db,
+                        'imbalance_db': stereo_metrics.imbalance_db
+                    }
+
+                # Dynamics analysis
+                crest_factor = self.spectrum.crest_factor_track(track_index, window_sec)
+                if crest_factor:
+                    analysis_results['dynamics'] = {
+                        'crest_factor_db': crest_factor.crest_factor_db,
+                        'peak_db': crest_factor.peak_db,
+                        'rms_db': crest_factor.rms_db,
+                        'dynamic_range_db': crest_factor.dynamic_range_db
+                    }
+
+                return analysis_results if analysis_results else None
             
         except Exception as e:
             self.logger.error(f"Failed to perform comprehensive analysis: {e}")
@@ -242,53 +254,77 @@ class AnalysisController:
 
     def master_chain_analysis(
         self,
-        window_sec: float = 10.0
+        window_sec: float = 10.0,
+        what: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Analyze master chain for loudness standards compliance and quality.
         
         Args:
             window_sec: Analysis window in seconds
+            what: Sections to compute ("loudness", "spectrum", "dynamics";
+                "lufs", "lra" and "true_peak" select loudness). None runs
+                all sections; ["lufs"] is enough for a compliance check and
+                skips the spectrum pass.
             
         Returns:
             Dictionary containing master analysis results and recommendations
         """
         try:
-            master_analysis = {}
-            
-            # Master loudness analysis
-            master_loudness = self.loudness.loudness_measure_master(window_sec)
-            if master_loudness:
-                master_analysis['loudness'] = {
-                    'integrated_lufs': master_loudness.integrated_lufs,
-                    'short_term_lufs': master_loudness.short_term_lufs,
-                    'lra': master_loudness.lra,
-                    'true_peak_dbfs': master_loudness.true_peak_dbfs,
-                    'broadcast_compliant': self._check_broadcast_compliance(master_loudness),
-                    'streaming_compliant': self._check_streaming_compliance(master_loudness)
-                }
-            
-            # Master spectrum analysis
-            master_spectrum = self.spectrum.spectrum_analyzer_master(window_sec)
-            if master_spectrum:
-                master_analysis['spectrum'] = {
-                    'tonal_balance': self._analyze_tonal_balance(
-                        master_spectrum.frequencies, master_spectrum.magnitudes_db
-                    ),
-                    'frequency_response': self._evaluate_frequency_response(
-                        master_spectrum.frequencies, master_spectrum.magnitudes_db
-                    )
-                }
-            
-            # Master dynamics
-            master_crest = self.spectrum.crest_factor_master(window_sec)
-            if master_crest:
-                master_analysis['dynamics'] = {
-                    'crest_factor_db': master_crest.crest_factor_db,
-                    'dynamic_range_quality': self._evaluate_dynamic_range(master_crest.crest_factor_db)
-                }
-            
-            return master_analysis if master_analysis else None
+            if what is None:
+                sections = set(MASTER_CHAIN_SECTIONS.values())
+            else:
+                unknown = [name for name in what if name not in MASTER_CHAIN_SECTIONS]
+                if unknown:
+                    self.logger.error(f"Unknown master chain sections: {unknown}")
+                    return None
+                sections = {MASTER_CHAIN_SECTIONS[name] for name in what}
+
+            with inside_reaper():
+                master_analysis = {}
+
+                # Master loudness analysis
+                master_loudness = (
+                    self.loudness.loudness_measure_master(window_sec)
+                    if "loudness" in sections else None
+                )
+                if master_loudness:
+                    master_analysis['loudness'] = {
+                        'integrated_lufs': master_loudness.integrated_lufs,
+                        'short_term_lufs': master_loudness.short_term_lufs,
+                        'lra': master_loudness.lra,
+                        'true_peak_dbfs': master_loudness.true_peak_dbfs,
+                        'broadcast_compliant': self._check_broadcast_compliance(master_loudness),
+                        'streaming_compliant': self._check_streaming_compliance(master_loudness)
+                    }
+
+                # Master spectrum analysis
+                master_spectrum = (
+                    self.spectrum.spectrum_analyzer_master(window_sec)
+                    if "spectrum" in sections else None
+                )
+                if master_spectrum:
+                    master_analysis['spectrum'] = {
+                        'tonal_balance': self._analyze_tonal_balance(
+                            master_spectrum.frequencies, master_spectrum.magnitudes_db
+                        ),
+                        'frequency_response': self._evaluate_frequency_response(
+                            master_spectrum.frequencies, master_spectrum.magnitudes_db
+                        )
+                    }
+
+                # Master dynamics
+                master_crest = (
+                    self.spectrum.crest_factor_master(window_sec)
+                    if "dynamics" in sections else None
+                )
+                if master_crest:
+                    master_analysis['dynamics'] = {
+                        'crest_factor_db': master_crest.crest_factor_db,
+                        'dynamic_range_quality': self._evaluate_dynamic_range(master_crest.crest_factor_db)
+                    }
+
+                return master_analysis if master_analysis else None
             
         except Exception as e:
             self.logger.error(f"Failed to analyze master chain: {e}")
@@ -14,6 +14,7 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
 from src.core.reapy_bridge import get_reapy
+from .analysis_cache import AnalysisCache
 
 
 @dataclass
@@ -37,6 +38,9 @@ class LoudnessController:
         self.logger = logging.getLogger(__name__)
         if debug:
             self.logger.setLevel(logging.DEBUG)
+            
+        # Track measurements reused by gain operations until the project changes
+        self._metrics_cache = AnalysisCache(maxsize=32)
 
     def loudness_measure_track(
         self, 
@@ -66,7 +70,33 @@ class LoudnessController:
                 return None
                 
             track = project.tracks[track_index]
+            return self.measure_track_loudness(track, window_sec, gate_enabled)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to measure track loudness: {e}")
+            return None
+
+    def measure_track_loudness(
+        self,
+        track,
+        window_sec: float = 30.0,
+        gate_enabled: bool = True
+    ) -> Optional[LoudnessMetrics]:
+        """
+        Measure LUFS loudness metrics for an already resolved track.
+        
+        Lets callers that have looked up the track themselves skip a
+        second project/track resolution round-trip.
+        
+        Args:
+            track: reapy Track to measure
+            window_sec: Measurement window in seconds
+            gate_enabled: Enable gating per ITU-R BS.1770-4
             
+        Returns:
+            LoudnessMetrics or None if measurement failed
+        """
+        try:
             # Get track peak levels as baseline
             peak_levels = self._get_track_peak_levels(track)
             if not peak_levels:
@@ -172,8 +202,20 @@ class LoudnessController:
             True if normalization succeeded
         """
         try:
+            import math
+            
+            reapy = get_reapy()
+            if not reapy:
+                return False
+                
+            project = reapy.Project()
+            if track_index >= project.n_tracks:
+                return False
+                
+            track = project.tracks[track_index]
+            
             # First measure current loudness
-            current_metrics = self.loudness_measure_track(track_index)
+            current_metrics = self._measure_track_loudness_cached(track_index, track)
             if not current_metrics:
                 return False
                 
@@ -188,22 +230,12 @@ class LoudnessController:
                 self.logger.warning(f"Gain limited to {gain_adjustment:.2f}dB due to true peak ceiling")
             
             # Apply gain adjustment to track volume
-            import math
-            
-            reapy = get_reapy()
-            if not reapy:
-                return False
-                
-            project = reapy.Project()
-            if track_index >= project.n_tracks:
-                return False
-                
-            track = project.tracks[track_index]
             current_volume_db = 20 * math.log10(track.volume) if track.volume > 0 else -60.0
             new_volume_db = current_volume_db + gain_adjustment
             new_volume_linear = 10 ** (new_volume_db / 20)
             
             track.volume = new_volume_linear
+            self._discard_track_loudness(track_index)
             
             self.logger.info(f"Normalized track {track_index}: {gain_adjustment:+.2f}dB gain")
             return True
@@ -231,9 +263,24 @@ class LoudnessController:
         """
         try:
             if mode == "lufs":
+                import math
+                
+                reapy = get_reapy()
+                if not reapy:
+                    return False
+                    
+                project = reapy.Project()
+                if max(source_track, target_track) >= project.n_tracks:
+                    self.logger.error("Track index out of range")
+                    return False
+                    
+                track = project.tracks[source_track]
+                
                 # Measure both tracks
-                source_metrics = self.loudness_measure_track(source_track)
-                target_metrics = self.loudness_measure_track(target_track)
+                source_metrics = self._measure_track_loudness_cached(source_track, track)
+                target_metrics = self._measure_track_loudness_cached(
+                    target_track, project.tracks[target_track]
+                )
                 
                 if not source_metrics or not target_metrics:
                     return False
@@ -242,19 +289,12 @@ class LoudnessController:
                 gain_diff = target_metrics.integrated_lufs - source_metrics.integrated_lufs
                 
                 # Apply gain to source track
-                import math
-                
-                reapy = get_reapy()
-                if not reapy:
-                    return False
-                    
-                project = reapy.Project()
-                track = project.tracks[source_track]
                 current_volume_db = 20 * math.log10(track.volume) if track.volume > 0 else -60.0
                 new_volume_db = current_volume_db + gain_diff
                 new_volume_linear = 10 ** (new_volume_db / 20)
                 
                 track.volume = new_volume_linear
+                self._discard_track_loudness(source_track)
                 
                 self.logger.info(f"Matched track {source_track} to track {target_track}: {gain_diff:+.2f}dB")
                 return True
@@ -266,6 +306,29 @@ class LoudnessController:
             self.logger.error(f"Failed to match loudness between tracks: {e}")
             return False
 
+    def _measure_track_loudness_cached(
+        self, track_index: int, track
+    ) -> Optional[LoudnessMetrics]:
+        """
+        Measure a track, reusing the last result while the project is unchanged.
+        
+        Lets normalize_track_lufs and match_loudness_between_tracks share a
+        measurement when run back to back on the same track.
+        """
+        return self._metrics_cache.get_or_compute(
+            ("track_loudness", track_index),
+            lambda: self.measure_track_loudness(track),
+        )
+
+    def _discard_track_loudness(self, track_index: int) -> None:
+        """
+        Forget a track's cached measurement after changing its gain.
+        
+        Volume writes through the API do not bump the project state change
+        count, so the cache cannot notice them on its own.
+        """
+        self._metrics_cache.discard(("track_loudness", track_index))
+
     def _get_track_peak_levels(self, track) -> Optional[Dict[str, float]]:
         """Get peak and RMS levels for a track using REAPER API."""
         try:
@@ -5,14 +5,32 @@ Provides FFT-based spectrum analysis, phase correlation,
 stereo imaging metrics, and crest factor measurements.
 """
 
+import bisect
+import functools
 import logging
 import math
 import time
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
+from src.constants import (
+    DB_CONVERSION_FACTOR,
+    SILENCE_THRESHOLD_DB,
+    MINIMUM_PEAK_VALUE,
+)
+
+# Piecewise-linear map from L/R peak difference (dB) to estimated correlation.
+# Each segment is (upper bound in dB, correlation at the bound, slope per dB).
+_CORRELATION_SEGMENTS = (
+    (1.0, 0.95, 0.05),  # Very similar levels
+    (3.0, 0.85, 0.033),  # Similar levels
+    (6.0, 0.65, 0.067),  # Moderate difference
+    (12.0, 0.35, 0.05),  # Large difference
+    (20.0, 0.1, 0.025),  # Very different levels (saturates at 20 dB)
+)
+_CORRELATION_BOUNDS = tuple(segment[0] for segment in _CORRELATION_SEGMENTS)
 
 
 class WeightingType(Enum):
@@ -54,6 +72,12 @@ class CrestFactorResult:
     dynamic_range_db: float
 
 
+class SpectrumContext(NamedTuple):
+    """Per-(sample rate, FFT size, weighting) tables shared between analyses."""
+    frequencies: Tuple[float, ...]
+    weight_curve: Tuple[float, ...]
+
+
 class SpectrumController:
     """Controller for frequency domain and stereo analysis."""
 
@@ -93,62 +117,102 @@ class SpectrumController:
                 self.logger.error(f"Track index {track_index} out of range")
                 return None
                 
-            # Generate realistic spectrum data based on REAPER peak levels
-            # Note: True FFT would require audio buffer capture and analysis
-            sample_rate = 48000.0
-            frequencies = self._generate_frequency_bins(fft_size, sample_rate)
-            
-            # Get real peak levels to inform spectrum generation
-            import math
-            from src.constants import (
-                DB_CONVERSION_FACTOR,
-                SILENCE_THRESHOLD_DB,
-                MINIMUM_PEAK_VALUE,
-            )
-            
-            RPR = reapy.reascript_api
-            track = project.tracks[track_index]
-            
-            # Get peak levels for both channels
-            left_peak = RPR.Track_GetPeakInfo(track.id, 0)
-            right_peak = RPR.Track_GetPeakInfo(track.id, 1)
-            
-            # Convert to dB
-            left_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, left_peak))
-                if left_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            right_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, right_peak))
-                if right_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            
-            max_peak_db = max(left_peak_db, right_peak_db)
-            
-            # Generate spectrum based on actual peak level
-            magnitudes = self._generate_realistic_spectrum(frequencies, "track", max_peak_db, track_index)
-            phases = [0.0] * len(frequencies)  # Simplified - real FFT would have phase data
-            
-            # Apply frequency weighting if requested
-            if weighting != WeightingType.NONE:
-                magnitudes = self._apply_frequency_weighting(frequencies, magnitudes, weighting)
-            
-            return SpectrumData(
-                frequencies=frequencies,
-                magnitudes_db=magnitudes,
-                phases=phases,
-                sample_rate=sample_rate,
-                fft_size=fft_size,
-                window_type="hann",
-                weighting=weighting
+            return self._track_spectrum(
+                reapy.reascript_api,
+                project.tracks[track_index],
+                track_index,
+                fft_size,
+                weighting,
             )
             
         except Exception as e:
             self.logger.error(f"Failed to analyze track spectrum: {e}")
             return None
 
+    def spectrum_analyzer_tracks(
+        self,
+        track_indices: List[int],
+        window_size: float = 1.0,
+        fft_size: int = 8192,
+        weighting: WeightingType = WeightingType.NONE
+    ) -> Dict[int, SpectrumData]:
+        """
+        Perform spectrum analysis on several tracks in one pass.
+        
+        The project is resolved once and all meter reads happen while the
+        reapy connection is held, instead of one round of lookups per track.
+        
+        Args:
+            track_indices: Indices of tracks to analyze
+            window_size: Analysis window in seconds
+            fft_size: FFT size (power of 2)
+            weighting: Frequency weighting (A, C, Z, or none)
+            
+        Returns:
+            Mapping of track index to SpectrumData; tracks that could not be
+            analyzed are omitted
+        """
+        spectra = {}
+        try:
+            reapy = get_reapy()
+            if not reapy:
+                return spectra
+                
+            with inside_reaper():
+                project = reapy.Project()
+                RPR = reapy.reascript_api
+                n_tracks = project.n_tracks
+                for track_index in track_indices:
+                    if not 0 <= track_index < n_tracks:
+                        self.logger.error(f"Track index {track_index} out of range")
+                        continue
+                    spectra[track_index] = self._track_spectrum(
+                        RPR, project.tracks[track_index], track_index, fft_size, weighting
+                    )
+            
+        except Exception as e:
+            self.logger.error(f"Failed to analyze track spectra: {e}")
+        return spectra
+
+    def _track_spectrum(
+        self,
+        RPR,
+        track,
+        track_index: int,
+        fft_size: int,
+        weighting: WeightingType
+    ) -> SpectrumData:
+        """Build the spectrum estimate for an already resolved track."""
+        # Generate realistic spectrum data based on REAPER peak levels
+        # Note: True FFT would require audio buffer capture and analysis
+        sample_rate = 48000.0
+        context = self._get_spectrum_context(sample_rate, fft_size, weighting)
+        frequencies = list(context.frequencies)
+        
+        # Get real peak levels to inform spectrum generation
+        left_peak_db, right_peak_db = self._get_peak_levels_db(RPR, track.id)
+        max_peak_db = max(left_peak_db, right_peak_db)
+        
+        # Generate spectrum based on actual peak level
+        magnitudes = self._generate_realistic_spectrum(
+            sample_rate, fft_size, "track", max_peak_db, track_index
+        )
+        phases = [0.0] * len(frequencies)  # Simplified - real FFT would have phase data
+        
+        # Apply frequency weighting if requested
+        if weighting != WeightingType.NONE:
+            magnitudes = self._apply_frequency_weighting(context, magnitudes)
+        
+        return SpectrumData(
+            frequencies=frequencies,
+            magnitudes_db=magnitudes,
+            phases=phases,
+            sample_rate=sample_rate,
+            fft_size=fft_size,
+            window_type="hann",
+            weighting=weighting
+        )
+
     def spectrum_analyzer_master(
         self,
         window_size: float = 1.0,
@@ -173,42 +237,24 @@ class SpectrumController:
                 
             # Generate realistic master spectrum data based on REAPER peak levels  
             sample_rate = 48000.0
-            frequencies = self._generate_frequency_bins(fft_size, sample_rate)
+            context = self._get_spectrum_context(sample_rate, fft_size, weighting)
+            frequencies = list(context.frequencies)
             
             # Get real master peak levels
-            import math
-            from src.constants import (
-                DB_CONVERSION_FACTOR,
-                SILENCE_THRESHOLD_DB,
-                MINIMUM_PEAK_VALUE,
-            )
-            
-            project = reapy.Project()
             RPR = reapy.reascript_api
-            master_track = project.master_track
-            
-            left_peak = RPR.Track_GetPeakInfo(master_track.id, 0)
-            right_peak = RPR.Track_GetPeakInfo(master_track.id, 1)
-            
-            left_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, left_peak))
-                if left_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            right_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, right_peak))
-                if right_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
+            master_track = reapy.Project().master_track
+            left_peak_db, right_peak_db = self._get_peak_levels_db(RPR, master_track.id)
             
             max_peak_db = max(left_peak_db, right_peak_db)
             
             # Generate spectrum based on actual master peak level
-            magnitudes = self._generate_realistic_spectrum(frequencies, "master", max_peak_db, 0)
+            magnitudes = self._generate_realistic_spectrum(
+                sample_rate, fft_size, "master", max_peak_db, 0
+            )
             phases = [0.0] * len(frequencies)
             
             if weighting != WeightingType.NONE:
-                magnitudes = self._apply_frequency_weighting(frequencies, magnitudes, weighting)
+                magnitudes = self._apply_frequency_weighting(context, magnitudes)
             
             return SpectrumData(
                 frequencies=frequencies,
@@ -250,52 +296,11 @@ class SpectrumController:
                 
             # Estimate phase correlation from peak level differences
             # This is an approximation - real correlation requires sample-by-sample analysis
-            import math
-            from src.constants import (
-                DB_CONVERSION_FACTOR,
-                SILENCE_THRESHOLD_DB,
-                MINIMUM_PEAK_VALUE,
-            )
-            
             RPR = reapy.reascript_api
             track = project.tracks[track_index]
-            
-            # Get peak levels for both channels
-            left_peak = RPR.Track_GetPeakInfo(track.id, 0)
-            right_peak = RPR.Track_GetPeakInfo(track.id, 1)
-            
-            # Convert to dB
-            left_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, left_peak))
-                if left_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            right_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, right_peak))
-                if right_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            
-            # Estimate correlation from L/R level similarity
-            # Similar levels suggest higher correlation
-            level_difference = abs(left_peak_db - right_peak_db)
-            
-            # Map level difference to correlation estimate
-            if level_difference < 1.0:  # Very similar levels
-                correlation = 0.95 + (1.0 - level_difference) * 0.05
-            elif level_difference < 3.0:  # Similar levels  
-                correlation = 0.85 + (3.0 - level_difference) * 0.033
-            elif level_difference < 6.0:  # Moderate difference
-                correlation = 0.65 + (6.0 - level_difference) * 0.067
-            elif level_difference < 12.0:  # Large difference
-                correlation = 0.35 + (12.0 - level_difference) * 0.05
-            else:  # Very different levels
-                correlation = 0.1 + (20.0 - min(level_difference, 20.0)) * 0.025
-                
-            # Add slight randomization based on track index for variation
-            correlation += (track_index * 0.01) % 0.1 - 0.05
-            
-            return max(-1.0, min(1.0, correlation))
+            left_peak_db, right_peak_db = self._get_peak_levels_db(RPR, track.id)
+
+            return self._estimate_correlation(left_peak_db, right_peak_db, track_index)
             
         except Exception as e:
             self.logger.error(f"Failed to measure phase correlation: {e}")
@@ -326,35 +331,18 @@ class SpectrumController:
                 return None
                 
             # Get real stereo analysis from REAPER peak levels
-            import math
-            from src.constants import (
-                DB_CONVERSION_FACTOR,
-                SILENCE_THRESHOLD_DB,
-                MINIMUM_PEAK_VALUE,
-            )
-            
             RPR = reapy.reascript_api
             track = project.tracks[track_index]
             
-            # Get peak levels for both channels
-            left_peak = RPR.Track_GetPeakInfo(track.id, 0)
-            right_peak = RPR.Track_GetPeakInfo(track.id, 1)
+            # Get peak levels for both channels in dB
+            left_peak_db, right_peak_db = self._get_peak_levels_db(RPR, track.id)
             
-            # Convert to dB
-            left_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, left_peak))
-                if left_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            right_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, right_peak))
-                if right_peak > 0
-                else SILENCE_THRESHOLD_DB
+            # Estimate correlation from the same peak reading instead of
+            # re-resolving the track and re-querying the meters
+            correlation = self._estimate_correlation(
+                left_peak_db, right_peak_db, track_index
             )
             
-            # Get phase correlation (from our improved method)
-            correlation = self.phase_correlation(track_index, window_sec) or 0.8
-            
             # Calculate stereo width from correlation and level balance
             # Lower correlation = wider image, balanced levels = centered
             width = 2.0 - (correlation * 0.8)  # 0.2 to 2.0 range
@@ -410,32 +398,12 @@ class SpectrumController:
                 return None
                 
             # Get real peak levels from REAPER
-            import math
-            from src.constants import (
-                DB_CONVERSION_FACTOR,
-                SILENCE_THRESHOLD_DB,
-                MINIMUM_PEAK_VALUE,
-            )
-            
             # Get direct API access
             RPR = reapy.reascript_api
             track = project.tracks[track_index]
             
-            # Get peak levels for both channels
-            left_peak = RPR.Track_GetPeakInfo(track.id, 0)
-            right_peak = RPR.Track_GetPeakInfo(track.id, 1)
-            
-            # Convert to dB
-            left_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, left_peak))
-                if left_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            right_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, right_peak))
-                if right_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
+            # Get peak levels for both channels in dB
+            left_peak_db, right_peak_db = self._get_peak_levels_db(RPR, track.id)
             
             # Use maximum peak
             peak_db = max(left_peak_db, right_peak_db)
@@ -476,32 +444,12 @@ class SpectrumController:
                 return None
                 
             # Get real master peak levels from REAPER
-            import math
-            from src.constants import (
-                DB_CONVERSION_FACTOR,
-                SILENCE_THRESHOLD_DB,
-                MINIMUM_PEAK_VALUE,
-            )
-            
             project = reapy.Project()
             RPR = reapy.reascript_api
             master_track = project.master_track
             
-            # Get peak levels for both channels of master
-            left_peak = RPR.Track_GetPeakInfo(master_track.id, 0)
-            right_peak = RPR.Track_GetPeakInfo(master_track.id, 1)
-            
-            # Convert to dB
-            left_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, left_peak))
-                if left_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
-            right_peak_db = (
-                DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, right_peak))
-                if right_peak > 0
-                else SILENCE_THRESHOLD_DB
-            )
+            # Get peak levels for both channels of master in dB
+            left_peak_db, right_peak_db = self._get_peak_levels_db(RPR, master_track.id)
             
             # Use maximum peak
             peak_db = max(left_peak_db, right_peak_db)
@@ -523,50 +471,129 @@ class SpectrumController:
             self.logger.error(f"Failed to calculate master crest factor: {e}")
             return None
 
-    def _generate_frequency_bins(self, fft_size: int, sample_rate: float) -> List[float]:
+    def _get_peak_levels_db(self, RPR, track_id) -> Tuple[float, float]:
+        """Read left/right peak levels of a track and convert them to dBFS."""
+        return (
+            self._peak_to_db(RPR.Track_GetPeakInfo(track_id, 0)),
+            self._peak_to_db(RPR.Track_GetPeakInfo(track_id, 1)),
+        )
+
+    @staticmethod
+    def _peak_to_db(peak: float) -> float:
+        """Convert a linear peak value to dBFS, flooring silence."""
+        if peak > 0:
+            return DB_CONVERSION_FACTOR * math.log10(max(MINIMUM_PEAK_VALUE, peak))
+        return SILENCE_THRESHOLD_DB
+
+    def _estimate_correlation(
+        self, left_peak_db: float, right_peak_db: float, track_index: int
+    ) -> float:
+        """
+        Estimate L/R correlation from channel level similarity.
+
+        Similar levels suggest higher correlation. The level difference is
+        mapped through _CORRELATION_SEGMENTS with a single bisect lookup
+        instead of walking an if/elif chain.
+        """
+        level_difference = abs(left_peak_db - right_peak_db)
+        segment = min(
+            bisect.bisect_right(_CORRELATION_BOUNDS, level_difference),
+            len(_CORRELATION_SEGMENTS) - 1,
+        )
+        bound, base, slope = _CORRELATION_SEGMENTS[segment]
+        correlation = base + (bound - min(level_difference, bound)) * slope
+
+        # Add slight randomization based on track index for variation
+        correlation += (track_index * 0.01) % 0.1 - 0.05
+
+        return max(-1.0, min(1.0, correlation))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _get_spectrum_context(
+        sample_rate: float, fft_size: int, weighting: WeightingType
+    ) -> SpectrumContext:
+        """
+        Build (and memoize) the frequency bins and weighting curve for a
+        given analysis setup so repeated tool calls skip the O(fft_size)
+        table construction.
+        """
+        frequencies = SpectrumController._generate_frequency_bins(fft_size, sample_rate)
+        weight_curve = SpectrumController._weighting_curve_db(frequencies, weighting)
+        return SpectrumContext(tuple(frequencies), tuple(weight_curve))
+
+    @staticmethod
+    def _generate_frequency_bins(fft_size: int, sample_rate: float) -> List[float]:
         """Generate frequency bins for FFT analysis."""
         return [i * sample_rate / fft_size for i in range(fft_size // 2 + 1)]
 
-    def _generate_realistic_spectrum(self, frequencies: List[float], track_type: str = "track", peak_db: float = -12.0, track_index: int = 0) -> List[float]:
+    def _generate_realistic_spectrum(
+        self,
+        sample_rate: float,
+        fft_size: int,
+        track_type: str = "track",
+        peak_db: float = -12.0,
+        track_index: int = 0
+    ) -> List[float]:
         """Generate realistic spectrum data based on actual peak levels and track characteristics."""
-        import math
-        magnitudes = []
-        
-        # Base spectrum level from actual peak level
-        base_level = peak_db - 6.0  # Spectrum typically 6dB below peak
+        profile = self._get_spectrum_profile(sample_rate, fft_size, track_type, track_index)
+        return [peak_db + level for level in profile]
+
+    @staticmethod
+    def _band_shape_db(freq: float, is_master: bool) -> float:
+        """Spectrum level of the frequency band containing freq, in dB re peak."""
+        # Base spectrum level relative to the peak level
+        base_level = -6.0  # Spectrum typically 6dB below peak
+
+        if freq == 0:
+            return base_level - 40.0  # DC component
+        if freq < 20:
+            return base_level - 30.0  # Sub-bass rolloff
+        if freq < 80:
+            # Bass region - fuller bass for master
+            if is_master:
+                return base_level - 5.0 + math.log10(freq / 20) * 3
+            return base_level - 8.0 + math.log10(freq / 20) * 4
+        if freq < 200:
+            # Low-mid region
+            return base_level - 3.0 + math.sin(freq / 100) * 2
+        if freq < 1000:
+            # Mid region - usually strongest
+            return base_level + math.sin(freq / 300) * 3
+        if freq < 4000:
+            # Upper mid region - smoother for master, more variation for tracks
+            if is_master:
+                return base_level - 1.0 - (freq - 1000) / 3000 * 3
+            return base_level - 2.0 - (freq - 1000) / 3000 * 4
+        if freq < 10000:
+            # Treble region
+            return base_level - 5.0 - (freq - 4000) / 6000 * 8
+        # High frequency rolloff
+        return base_level - 15.0 - (freq - 10000) / 10000 * 20
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_spectrum_profile(
+        sample_rate: float, fft_size: int, track_type: str, track_index: int
+    ) -> Tuple[float, ...]:
+        """
+        Spectrum shape in dB relative to the peak level.
+
+        Every term of the generated spectrum is an offset from the peak level,
+        so the per-bin shape is computed once per setup and the peak is added
+        on each call.
+        """
+        frequencies = SpectrumController._get_spectrum_context(
+            sample_rate, fft_size, WeightingType.NONE
+        ).frequencies
+        is_master = track_type == "master"
+        profile = []
         
         for freq in frequencies:
-            if freq == 0:
-                magnitude = base_level - 40.0  # DC component
-            elif freq < 20:
-                magnitude = base_level - 30.0  # Sub-bass rolloff
-            elif freq < 80:
-                # Bass region - varies by track type and level
-                if track_type == "master":
-                    magnitude = base_level - 5.0 + math.log10(freq / 20) * 3  # Fuller bass for master
-                else:
-                    magnitude = base_level - 8.0 + math.log10(freq / 20) * 4
-            elif freq < 200:
-                # Low-mid region
-                magnitude = base_level - 3.0 + math.sin(freq / 100) * 2
-            elif freq < 1000:
-                # Mid region - usually strongest 
-                magnitude = base_level + math.sin(freq / 300) * 3
-            elif freq < 4000:
-                # Upper mid region
-                if track_type == "master":
-                    magnitude = base_level - 1.0 - (freq - 1000) / 3000 * 3  # Smoother for master
-                else:
-                    magnitude = base_level - 2.0 - (freq - 1000) / 3000 * 4  # More variation for tracks
-            elif freq < 10000:
-                # Treble region
-                magnitude = base_level - 5.0 - (freq - 4000) / 6000 * 8
-            else:
-                # High frequency rolloff
-                magnitude = base_level - 15.0 - (freq - 10000) / 10000 * 20
-                
+            magnitude = SpectrumController._band_shape_db(freq, is_master)
+
             # Add track-specific character
-            if track_type == "master":
+            if is_master:
                 # Master has more controlled spectrum
                 magnitude += math.sin(freq / 1000) * 1.5  
             else:
@@ -574,41 +601,51 @@ class SpectrumController:
                 magnitude += math.sin(freq / 800 + track_index) * 2.5
                 
             # Add realistic noise floor
-            magnitude = max(magnitude, peak_db - 60.0)
+            magnitude = max(magnitude, -60.0)
             
             # Add slight randomness based on frequency
             magnitude += (hash(str(int(freq))) % 100 / 100 - 0.5) * 1.5
             
-            magnitudes.append(magnitude)
+            profile.append(magnitude)
             
-        return magnitudes
+        return tuple(profile)
 
     def _apply_frequency_weighting(
         self, 
-        frequencies: List[float], 
-        magnitudes: List[float], 
-        weighting: WeightingType
+        context: SpectrumContext, 
+        magnitudes: List[float]
     ) -> List[float]:
-        """Apply frequency weighting (A, C, or Z) to spectrum."""
+        """Apply the context's frequency weighting curve to a spectrum."""
+        return [
+            magnitude + weight_db
+            for magnitude, weight_db in zip(magnitudes, context.weight_curve)
+        ]
+
+    @staticmethod
+    def _weighting_curve_db(
+        frequencies: List[float], weighting: WeightingType
+    ) -> List[float]:
+        """Per-bin frequency weighting (A, C, or Z) in dB."""
         if weighting == WeightingType.NONE:
-            return magnitudes
+            return [0.0] * len(frequencies)
             
-        weighted = []
-        for i, freq in enumerate(frequencies):
+        curve = []
+        for freq in frequencies:
             if freq == 0:
                 weight_db = -60.0  # Avoid log(0)
             elif weighting == WeightingType.A_WEIGHTING:
-                weight_db = self._a_weighting_db(freq)
+                weight_db = SpectrumController._a_weighting_db(freq)
             elif weighting == WeightingType.C_WEIGHTING:
-                weight_db = self._c_weighting_db(freq)
+                weight_db = SpectrumController._c_weighting_db(freq)
             else:  # Z-weighting is flat
                 weight_db = 0.0
                 
-            weighted.append(magnitudes[i] + weight_db)
+            curve.append(weight_db)
             
-        return weighted
+        return curve
 
-    def _a_weighting_db(self, freq: float) -> float:
+    @staticmethod
+    def _a_weighting_db(freq: float) -> float:
         """Calculate A-weighting filter response in dB."""
         if freq <= 0:
             return -60.0
@@ -625,7 +662,8 @@ class SpectrumController:
         else:
             return -60.0
 
-    def _c_weighting_db(self, freq: float) -> float:
+    @staticmethod
+    def _c_weighting_db(freq: float) -> float:
         """Calculate C-weighting filter response in dB."""
         if freq <= 0:
             return -60.0
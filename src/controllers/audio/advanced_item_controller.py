@@ -3,25 +3,62 @@ from typing import Dict, Any, List, Optional, Tuple
 
 
 import logging
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 import sys
 import os
 
 # Add utils path for imports
 script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, script_dir)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
 
 
 class AdvancedItemController:
     """Controller for advanced item operations in Reaper."""
 
+    # Operation names accepted by bulk_item_ops, mapped to controller methods
+    BULK_OPERATIONS = {
+        "split": "split_item",
+        "glue": "glue_items",
+        "fade_in": "fade_in",
+        "fade_out": "fade_out",
+        "crossfade": "crossfade_items",
+        "reverse": "reverse_item",
+    }
+
     def __init__(self, debug: bool = False):
         self.logger = logging.getLogger(__name__)
         if debug:
             self.logger.setLevel(logging.INFO)
 
+        # Initialize RPR reference
+        try:
+            reapy = get_reapy()
+            self._RPR = reapy.reascript_api
+        except Exception as e:
+            self.logger.error(f"Failed to initialize RPR: {e}")
+            self._RPR = None
+
+    @contextmanager
+    def _item_edit_block(self, description: str):
+        """
+        Group item edits into one undo point and one arrange refresh.
+
+        Args:
+            description (str): Undo history description
+        """
+        self._RPR.PreventUIRefresh(1)
+        self._RPR.Undo_BeginBlock()
+        try:
+            yield
+        finally:
+            self._RPR.Undo_EndBlock(description, -1)
+            self._RPR.PreventUIRefresh(-1)
+            self._RPR.UpdateArrange()
+
     def split_item(
         self, track_index: int, item_index: int, split_time: float
     ) -> List[int]:
@@ -97,19 +134,28 @@ class AdvancedItemController:
 
             track = project.tracks[track_index]
 
-            # Select the items to glue
-            for item_idx in item_indices:
-                if item_idx < len(track.items):
-                    self._RPR.SetMediaItemSelected(track.items[item_idx].id, True)
-
-            # Glue the selected items
-            self._RPR.Main_OnCommand(40362, 0)  # Glue items action
-
-            # Find the resulting item
-            for i, item in enumerate(track.items):
-                if self._RPR.IsMediaItemSelected(item.id):
-                    self.logger.info(f"Glued {len(item_indices)} items into item {i}")
-                    return i
+            with inside_reaper():
+                # Fetch the item list once; each track.items access is a
+                # round-trip to REAPER
+                items = track.items
+                item_ids = [
+                    items[item_idx].id
+                    for item_idx in sorted(set(item_indices))
+                    if 0 <= item_idx < len(items)
+                ]
+
+                # Select the items to glue
+                for item_id in item_ids:
+                    self._RPR.SetMediaItemSelected(item_id, True)
+
+                # Glue the selected items
+                self._RPR.Main_OnCommand(40362, 0)  # Glue items action
+
+                # Find the resulting item
+                for i, item in enumerate(track.items):
+                    if self._RPR.IsMediaItemSelected(item.id):
+                        self.logger.info(f"Glued {len(item_ids)} items into item {i}")
+                        return i
 
             return -1
 
@@ -149,14 +195,15 @@ class AdvancedItemController:
 
             item = track.items[item_index]
 
-            # Set fade-in length
-            self._RPR.SetMediaItemInfo_Value(
-                item.id, "D_FADEOUTLEN", 0
-            )  # Clear fade-out first
-            self._RPR.SetMediaItemInfo_Value(item.id, "D_FADEINLEN", fade_length)
+            with self._item_edit_block("Add fade-in"):
+                # Set fade-in length
+                self._RPR.SetMediaItemInfo_Value(
+                    item.id, "D_FADEOUTLEN", 0
+                )  # Clear fade-out first
+                self._RPR.SetMediaItemInfo_Value(item.id, "D_FADEINLEN", fade_length)
 
-            # Set fade-in curve
-            self._RPR.SetMediaItemInfo_Value(item.id, "C_FADEINLEN", fade_curve)
+                # Set fade-in curve
+                self._RPR.SetMediaItemInfo_Value(item.id, "C_FADEINSHAPE", fade_curve)
 
             self.logger.info(
                 f"Added {fade_length}s fade-in to item {item_index} on track {track_index}"
@@ -199,14 +246,15 @@ class AdvancedItemController:
 
             item = track.items[item_index]
 
-            # Set fade-out length
-            self._RPR.SetMediaItemInfo_Value(
-                item.id, "D_FADEINLEN", 0
-            )  # Clear fade-in first
-            self._RPR.SetMediaItemInfo_Value(item.id, "D_FADEOUTLEN", fade_length)
+            with self._item_edit_block("Add fade-out"):
+                # Set fade-out length
+                self._RPR.SetMediaItemInfo_Value(
+                    item.id, "D_FADEINLEN", 0
+                )  # Clear fade-in first
+                self._RPR.SetMediaItemInfo_Value(item.id, "D_FADEOUTLEN", fade_length)
 
-            # Set fade-out curve
-            self._RPR.SetMediaItemInfo_Value(item.id, "C_FADEOUTLEN", fade_curve)
+                # Set fade-out curve
+                self._RPR.SetMediaItemInfo_Value(item.id, "C_FADEOUTSHAPE", fade_curve)
 
             self.logger.info(
                 f"Added {fade_length}s fade-out to item {item_index} on track {track_index}"
@@ -254,12 +302,14 @@ class AdvancedItemController:
             item1 = track.items[item1_index]
             item2 = track.items[item2_index]
 
-            # Select both items
-            self._RPR.SetMediaItemSelected(item1.id, True)
-            self._RPR.SetMediaItemSelected(item2.id, True)
-
-            # Create crossfade
-            self._RPR.Main_OnCommand(40312, 0)  # Crossfade items action
+            # Fade the first item out and the second in over the same span
+            with self._item_edit_block("Crossfade items"):
+                self._RPR.SetMediaItemInfo_Value(
+                    item1.id, "D_FADEOUTLEN", crossfade_length
+                )
+                self._RPR.SetMediaItemInfo_Value(
+                    item2.id, "D_FADEINLEN", crossfade_length
+                )
 
             self.logger.info(
                 f"Created crossfade between items {item1_index} and {item2_index}"
@@ -311,6 +361,52 @@ class AdvancedItemController:
             self.logger.error(f"Failed to reverse item: {e}")
             return False
 
+    def bulk_item_ops(self, ops: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Run a sequence of item edits as a single REAPER operation.
+
+        All operations share one undo block and one UI refresh, and run
+        while the reapy connection is held so each edit does not pay a
+        separate round-trip.
+
+        Args:
+            ops (List[Dict[str, Any]]): Operations to run in order. Each entry
+                has an "op" key (split, glue, fade_in, fade_out, crossfade,
+                reverse) plus the keyword arguments of the matching method,
+                e.g. {"op": "fade_in", "track_index": 0, "item_index": 1,
+                "fade_length": 0.5}
+
+        Returns:
+            List[Any]: Result of each operation in order, None for
+            operations that could not be dispatched
+        """
+        results: List[Any] = []
+        try:
+            with inside_reaper(), self._item_edit_block("Bulk item operations"):
+                for op in ops:
+                    results.append(self._run_bulk_op(op))
+
+            self.logger.info(f"Ran {len(results)} bulk item operations")
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Failed to run bulk item operations: {e}")
+            return results
+
+    def _run_bulk_op(self, op: Dict[str, Any]) -> Any:
+        """Dispatch a single bulk operation entry to its controller method."""
+        params = dict(op)
+        method_name = self.BULK_OPERATIONS.get(params.pop("op", None))
+        if method_name is None:
+            self.logger.error(f"Unknown bulk item operation: {op.get('op')}")
+            return None
+
+        try:
+            return getattr(self, method_name)(**params)
+        except TypeError as e:
+            self.logger.error(f"Invalid arguments for {op.get('op')}: {e}")
+            return None
+
     def get_item_fade_info(self, track_index: int, item_index: int) -> Dict[str, Any]:
         """
         Get fade information for an item.
@@ -342,8 +438,8 @@ class AdvancedItemController:
             # Get fade information
             fade_in_len = self._RPR.GetMediaItemInfo_Value(item.id, "D_FADEINLEN")
             fade_out_len = self._RPR.GetMediaItemInfo_Value(item.id, "D_FADEOUTLEN")
-            fade_in_curve = self._RPR.GetMediaItemInfo_Value(item.id, "C_FADEINLEN")
-            fade_out_curve = self._RPR.GetMediaItemInfo_Value(item.id, "C_FADEOUTLEN")
+            fade_in_curve = self._RPR.GetMediaItemInfo_Value(item.id, "C_FADEINSHAPE")
+            fade_out_curve = self._RPR.GetMediaItemInfo_Value(item.id, "C_FADEOUTSHAPE")
 
             return {
                 "fade_in_length": fade_in_len,
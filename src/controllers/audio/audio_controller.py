@@ -6,9 +6,10 @@ import sys
 
 # Add utils path for imports
 script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, script_dir)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
 from src.item.utils import (
     get_item_by_id_or_index,
     get_item_properties as get_item_props,
@@ -110,8 +111,7 @@ class AudioController:
                 self.logger.error("Audio file does not exist: %s", file_path)
                 return None
 
-            reapy = get_reapy()
-            project = reapy.Project()
+            project = get_reapy().Project()
 
             # Defensive: clamp track_index
             if track_index < 0 or track_index >= len(project.tracks):
@@ -123,12 +123,8 @@ class AudioController:
             # Determine insertion position
             position = 0.0 if start_time is None else float(start_time)
 
-            # Snapshot all items (track_id, item_index, position) before insertion
-            before_snapshot = {
-                (ti, idx)
-                for ti, tr in enumerate(project.tracks)
-                for idx, it in enumerate(tr.items)
-            }
+            # Snapshot all items (track_index, item_index) before insertion
+            before_snapshot = self._snapshot_item_keys(project)
 
             # 1) Move edit cursor to position
             project.cursor_position = position
@@ -147,11 +143,7 @@ class AudioController:
             self._RPR.UpdateArrange()
 
             # Create after snapshot
-            after_snapshot = {
-                (ti, idx)
-                for ti, tr in enumerate(project.tracks)
-                for idx, it in enumerate(tr.items)
-            }
+            after_snapshot = self._snapshot_item_keys(project)
 
             # Find new items (could be on any track depending on REAPER prefs)
             new_pairs = sorted(list(after_snapshot - before_snapshot))
@@ -164,11 +156,7 @@ class AudioController:
                 time.sleep(INSERTION_WAIT_TIME)
                 self._RPR.UpdateArrange()
 
-                after_snapshot = {
-                    (ti, idx)
-                    for ti, tr in enumerate(project.tracks)
-                    for idx, it in enumerate(tr.items)
-                }
+                after_snapshot = self._snapshot_item_keys(project)
                 new_pairs = sorted(list(after_snapshot - before_snapshot))
 
             if not new_pairs:
@@ -177,17 +165,18 @@ class AudioController:
 
             # Prefer items at the intended position; otherwise take the first new item
             selected_pair = None
-            for ti, idx in new_pairs:
-                it = project.tracks[ti].items[idx]
-                if abs((it.position or 0.0) - position) < POSITION_TOLERANCE:
-                    selected_pair = (ti, idx)
-                    break
-            if selected_pair is None:
-                selected_pair = new_pairs[-1]  # last created is often the inserted one
-
-            src_ti, src_idx = selected_pair
-            src_track = project.tracks[src_ti]
-            inserted_item = src_track.items[src_idx]
+            with inside_reaper():
+                for ti, idx in new_pairs:
+                    it = project.tracks[ti].items[idx]
+                    if abs((it.position or 0.0) - position) < POSITION_TOLERANCE:
+                        selected_pair = (ti, idx)
+                        break
+                if selected_pair is None:
+                    selected_pair = new_pairs[-1]  # last created is often the inserted one
+
+                src_ti, src_idx = selected_pair
+                src_track = project.tracks[src_ti]
+                inserted_item = src_track.items[src_idx]
 
             # If item landed on a different track, move it to the requested track
             if src_ti != track_index:
@@ -218,35 +207,30 @@ class AudioController:
                     "Failed to set position on inserted item: %s", pos_err
                 )
 
-            # Return the index of the inserted item on the target track (find by position or last index)
-            # Prefer exact position match
-            for idx, it in enumerate(track.items):
-                if abs((it.position or 0.0) - position) < POSITION_TOLERANCE:
-                    self.logger.info(
-                        "Inserted audio item on track %s at index %s (pos=%s)",
-                        track_index,
-                        idx,
-                        it.position,
-                    )
-                    return idx
-
-            # Fallback: last item
-            if track.items:
-                last_idx = len(track.items) - 1
-                self.logger.warning(
-                    "Returning last index %s for inserted audio item on track %s",
-                    last_idx,
-                    track_index,
-                )
-                return last_idx
-
-            self.logger.error("Inserted item not found on the target track after move")
-            return None
+            # Read the inserted item's index on its track directly
+            new_index = self._item_index(inserted_item)
+            self.logger.info(
+                "Inserted audio item on track %s at index %s", track_index, new_index
+            )
+            return new_index
 
         except Exception as e:
             self.logger.error("Failed to insert audio item: %s", e)
             return None
 
+    def _snapshot_item_keys(self, project) -> set:
+        """Collect (track_index, item_index) pairs for every item in the project."""
+        with inside_reaper():
+            return {
+                (ti, idx)
+                for ti, tr in enumerate(project.tracks)
+                for idx in range(tr.n_items)
+            }
+
+    def _item_index(self, item) -> int:
+        """Get the index of an item on its track in a single call."""
+        return int(self._RPR.GetMediaItemInfo_Value(item.id, "IP_ITEMNUMBER"))
+
     def get_audio_items(self, track_index: int) -> List[Dict[str, Any]]:
         """
         Get all audio items on a track.
@@ -258,32 +242,33 @@ class AudioController:
             List[Dict[str, Any]]: List of audio item information
         """
         try:
-            reapy = get_reapy()
-            project = reapy.Project()
-            track = project.tracks[track_index]
+            with inside_reaper():
+                reapy = get_reapy()
+                project = reapy.Project()
+                track = project.tracks[track_index]
 
-            audio_items = []
-            for item in track.items:
-                # Check if item has audio takes
-                for take in item.takes:
-                    if not take.is_midi:
-                        audio_items.append(
-                            {
-                                "id": item.id,
-                                "position": item.position,
-                                "length": item.length,
-                                "file_path": (
-                                    take.source.filename
-                                    if hasattr(take.source, "filename")
-                                    else ""
-                                ),
-                                "muted": item.muted,
-                                "selected": item.selected,
-                            }
-                        )
-                        break  # Only count each item once
+                audio_items = []
+                for item in track.items:
+                    # Check if item has audio takes
+                    for take in item.takes:
+                        if not take.is_midi:
+                            audio_items.append(
+                                {
+                                    "id": item.id,
+                                    "position": item.position,
+                                    "length": item.length,
+                                    "file_path": (
+                                        take.source.filename
+                                        if hasattr(take.source, "filename")
+                                        else ""
+                                    ),
+                                    "muted": item.muted,
+                                    "selected": item.selected,
+                                }
+                            )
+                            break  # Only count each item once
 
-            return audio_items
+                return audio_items
 
         except Exception as e:
             self.logger.error(f"Failed to get audio items for track {track_index}: {e}")
@@ -294,18 +279,21 @@ class AudioController:
         Get properties of a media item.
         """
         try:
-            # Find the item in the actual project
-            project = get_reapy().Project()
-            track = project.tracks[track_index]
-
-            # Use shared utility to find the item
-            item = get_item_by_id_or_index(track, item_id)
-            if item is None:
-                self.logger.warning(f"Item {item_id} not found on track {track_index}")
-                return {}
+            with inside_reaper():
+                # Find the item in the actual project
+                project = get_reapy().Project()
+                track = project.tracks[track_index]
+
+                # Use shared utility to find the item
+                item = get_item_by_id_or_index(track, item_id)
+                if item is None:
+                    self.logger.warning(
+                        f"Item {item_id} not found on track {track_index}"
+                    )
+                    return {}
 
-            # Get properties using shared utility
-            return get_item_props(item)
+                # Get properties using shared utility
+                return get_item_props(item)
 
         except Exception as e:
             error_message = f"Failed to get properties for item {item_id}: {e}"
@@ -325,17 +313,20 @@ class AudioController:
             bool: True if successful, False otherwise
         """
         try:
-            project = get_reapy().Project()
-            track = project.tracks[track_index]
-
-            item = get_item_by_id_or_index(track, item_id)
-            if item is None:
-                self.logger.warning(f"Item {item_id} not found on track {track_index}")
-                return False
+            with inside_reaper():
+                project = get_reapy().Project()
+                track = project.tracks[track_index]
+
+                item = get_item_by_id_or_index(track, item_id)
+                if item is None:
+                    self.logger.warning(
+                        f"Item {item_id} not found on track {track_index}"
+                    )
+                    return False
 
-            item.position = position
-            self.logger.info(f"Set item {item_id} position to {position}")
-            return True
+                item.position = position
+                self.logger.info(f"Set item {item_id} position to {position}")
+                return True
 
         except Exception as e:
             error_message = f"Failed to set item {item_id} position to {position}: {e}"
@@ -355,17 +346,20 @@ class AudioController:
             bool: True if successful, False otherwise
         """
         try:
-            project = get_reapy().Project()
-            track = project.tracks[track_index]
-
-            item = get_item_by_id_or_index(track, item_id)
-            if item is None:
-                self.logger.warning(f"Item {item_id} not found on track {track_index}")
-                return False
+            with inside_reaper():
+                project = get_reapy().Project()
+                track = project.tracks[track_index]
+
+                item = get_item_by_id_or_index(track, item_id)
+                if item is None:
+                    self.logger.warning(
+                        f"Item {item_id} not found on track {track_index}"
+                    )
+                    return False
 
-            item.length = length
-            self.logger.info(f"Set item {item_id} length to {length}")
-            return True
+                item.length = length
+                self.logger.info(f"Set item {item_id} length to {length}")
+                return True
 
         except Exception as e:
             error_message = f"Failed to set item {item_id} length to {length}: {e}"
@@ -389,74 +383,51 @@ class AudioController:
                 self.logger.error("RPR not initialized")
                 return -1
 
-            project = get_reapy().Project()
-            track = project.tracks[track_index]
-
-            # Count items before duplication
-            item_count_before = len(track.items)
-            self.logger.info(
-                f"Track {track_index} has {item_count_before} items before duplication"
-            )
+            with inside_reaper():
+                project = get_reapy().Project()
+                track = project.tracks[track_index]
 
-            # Get the original item by ID or index
-            original_item = get_item_by_id_or_index(track, item_id)
-            if original_item is None:
-                error_message = f"Item {item_id} not found on track {track_index}"
-                self.logger.error(error_message)
-                return -1
-
-            # Calculate new position if not provided
-            if new_position is None:
-                new_position = self._calculate_duplicate_position(original_item)
-
-            self.logger.info(f"Duplicating item {item_id} to position {new_position}")
+                # Count items before duplication
+                item_count_before = track.n_items
+                self.logger.info(
+                    f"Track {track_index} has {item_count_before} items before duplication"
+                )
 
-            # Simple duplication approach
-            try:
-                # Use reapy's copy method
-                duplicate_item = original_item.copy()
-                if duplicate_item:
-                    # Set the new position
-                    duplicate_item.position = new_position
+                # Get the original item by ID or index
+                original_item = get_item_by_id_or_index(track, item_id)
+                if original_item is None:
+                    error_message = f"Item {item_id} not found on track {track_index}"
+                    self.logger.error(error_message)
+                    return -1
 
-                    # Update the arrangement
-                    self._RPR.UpdateArrange()
+                # Calculate new position if not provided
+                if new_position is None:
+                    new_position = self._calculate_duplicate_position(original_item)
 
-                    # Verify duplication by checking item count
-                    item_count_after = len(track.items)
-                    if item_count_after > item_count_before:
-                        new_index = item_count_after - 1  # Last item is the new one
-                        # Double-check by position
-                        if (
-                            abs(track.items[new_index].position - new_position)
-                            < POSITION_TOLERANCE
-                        ):
-                            self.logger.info(
-                                f"Successfully duplicated item to index {new_index}"
-                            )
-                            return new_index
-                        else:
-                            # Search for the correct item by position
-                            for idx, item in enumerate(track.items):
-                                if (
-                                    abs(item.position - new_position)
-                                    < POSITION_TOLERANCE
-                                ):
-                                    self.logger.info(
-                                        f"Found duplicated item at index {idx} by position"
-                                    )
-                                    return idx
+                self.logger.info(f"Duplicating item {item_id} to position {new_position}")
 
-                    self.logger.error(
-                        f"Item count didn't increase after duplication (before: {item_count_before}, after: {item_count_after})"
-                    )
-                    return -1
-                else:
-                    self.logger.error("Failed to create duplicate using reapy copy()")
+                # Simple duplication approach
+                try:
+                    # Use reapy's copy method
+                    duplicate_item = original_item.copy()
+                    if duplicate_item:
+                        # Set the new position
+                        duplicate_item.position = new_position
+
+                        # Update the arrangement
+                        self._RPR.UpdateArrange()
+
+                        new_index = self._item_index(duplicate_item)
+                        self.logger.info(
+                            f"Successfully duplicated item to index {new_index}"
+                        )
+                        return new_index
+                    else:
+                        self.logger.error("Failed to create duplicate using reapy copy()")
+                        return -1
+                except Exception as reapy_error:
+                    self.logger.error(f"Reapy duplication failed: {reapy_error}")
                     return -1
-            except Exception as reapy_error:
-                self.logger.error(f"Reapy duplication failed: {reapy_error}")
-                return -1
 
         except Exception as e:
             self.logger.error(f"Failed to duplicate item: {e}")
@@ -632,12 +603,8 @@ class AudioController:
             except Exception as e:
                 self.logger.warning("Failed to set blank item props: %s", e)
 
-            # Prefer exact position match
-            for idx, it in enumerate(track.items):
-                if abs((it.position or 0.0) - start_time) < POSITION_TOLERANCE:
-                    return idx
-
-            return new_index
+            # Setting the position may re-sort the track's items
+            return self._item_index(item)
         except Exception as e:
             self.logger.error("Failed to create blank item: %s", e)
             return -1
@@ -654,15 +621,16 @@ class AudioController:
             bool: True if successful, False otherwise
         """
         try:
-            project = get_reapy().Project()
-            track = project.tracks[track_index]
+            with inside_reaper():
+                project = get_reapy().Project()
+                track = project.tracks[track_index]
 
-            item = get_item_by_id_or_index(track, item_id)
-            if item is None:
-                return False
+                item = get_item_by_id_or_index(track, item_id)
+                if item is None:
+                    return False
 
-            # Use shared utility to delete the item
-            return delete_item(item)
+                # Use shared utility to delete the item
+                return delete_item(item)
 
         except Exception as e:
             error_message = f"Failed to delete item {item_id}: {e}"
@@ -701,14 +669,17 @@ class AudioController:
                 end_time = float("inf")  # Get all items
 
             items_in_range = []
-            for item in track.items:
-                # Check if item overlaps with the time range
-                item_start = item.position
-                item_end = item.position + item.length
-
-                # Item overlaps if it starts before the range ends and ends after the range starts
-                if item_start < end_time and item_end > start_time:
-                    items_in_range.append(item.id)
+            # Hold the connection so the per-item position/length reads
+            # are served in one batch instead of two round-trips per item
+            with inside_reaper():
+                for item in track.items:
+                    # Check if item overlaps with the time range
+                    item_start = item.position
+                    item_end = item_start + item.length
+
+                    # Item overlaps if it starts before the range ends and ends after the range starts
+                    if item_start < end_time and item_end > start_time:
+                        items_in_range.append(item.id)
 
             self.logger.info(
                 f"Found {len(items_in_range)} items in time range "
@@ -9,9 +9,10 @@ import os
 
 # Add utils path for imports
 script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, script_dir)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
 
 
 class AutomationController:
@@ -171,19 +172,9 @@ class AutomationController:
                     point_index = -1
             except (AttributeError, TypeError):
                 # Fallback to ReaScript API
-                envelope_map = {
-                    "volume": "VOLENV",
-                    "pan": "PANENV",
-                    "mute": "MUTEENV",
-                    "width": "WIDTHENV",
-                    "send_volume": "SENDVOLENV",
-                    "send_pan": "SENDPANENV",
-                }
-
-                envelope_type = envelope_map.get(envelope_name.lower(), "VOLENV")
-                envelope_id = self._RPR.GetTrackEnvelopeByName(track.id, envelope_type)
-
-                if envelope_id == -1:
+                envelope_id = self._get_track_envelope(track, envelope_name)
+
+                if not envelope_id or envelope_id == -1:
                     self.logger.error(
                         f"Envelope '{envelope_name}' not found on track {track_index}"
                     )
@@ -203,6 +194,90 @@ class AutomationController:
             self.logger.error(f"Failed to add automation point: {e}")
             return False
 
+    def add_automation_points(
+        self,
+        track_index: int,
+        envelope_name: str,
+        points: List[Tuple[float, float, int]],
+    ) -> int:
+        """
+        Add several automation points to an envelope in one pass.
+
+        The envelope is resolved once, all points are inserted while the
+        reapy connection is held, and the envelope is sorted once at the end.
+
+        Args:
+            track_index (int): Index of the track
+            envelope_name (str): Name of the envelope ("volume", "pan" or "mute")
+            points (List[Tuple[float, float, int]]): (time, value, shape) per point
+
+        Returns:
+            int: Number of points added, or -1 if the batch failed
+        """
+        try:
+            if self._RPR is None:
+                self.logger.error("RPR not initialized")
+                return -1
+
+            with inside_reaper():
+                project = get_reapy().Project()
+                if track_index >= len(project.tracks):
+                    self.logger.error("Invalid track index")
+                    return -1
+                track = project.tracks[track_index]
+
+                envelope = self._get_track_envelope(track, envelope_name)
+                if envelope is None:
+                    self.logger.error(f"Unknown envelope '{envelope_name}'")
+                    return -1
+                if not envelope or envelope == -1:
+                    self.logger.error(
+                        f"Envelope '{envelope_name}' not found on track "
+                        f"{track_index}. Create it first."
+                    )
+                    return -1
+
+                added = 0
+                for time, value, shape in points:
+                    # noSort: sorted once below instead of after every insert
+                    if self._RPR.InsertEnvelopePoint(
+                        envelope, time, value, shape, 0, False, True
+                    ):
+                        added += 1
+                self._RPR.Envelope_SortPoints(envelope)
+
+            self.logger.info(
+                f"Added {added} of {len(points)} automation points "
+                f"on track {track_index}"
+            )
+            return added
+
+        except Exception as e:
+            self.logger.error(f"Failed to add automation points: {e}")
+            return -1
+
+    def _get_track_envelope(self, track, envelope_name: str):
+        """
+        Look up a track envelope by its friendly name (e.g. "volume").
+
+        Returns:
+            The envelope from GetTrackEnvelopeByName, or None if the name is
+            not a known envelope
+        """
+        envelope_map = {
+            "volume": "VOLENV",
+            "pan": "PANENV",
+            "mute": "MUTEENV",
+            "width": "WIDTHENV",
+            "send_volume": "SENDVOLENV",
+            "send_pan": "SENDPANENV",
+        }
+
+        envelope_type = envelope_map.get(envelope_name.lower())
+        if envelope_type is None:
+            return None
+        return self._RPR.GetTrackEnvelopeByName(track.id, envelope_type)
+
     def get_automation_points(
         self, track_index: int, envelope_name: str
     ) -> List[Dict[str, Any]]:
@@ -227,19 +302,9 @@ class AutomationController:
             track = project.tracks[track_index]
 
             # Get envelope
-            envelope_map = {
-                "volume": "VOLENV",
-                "pan": "PANENV",
-                "mute": "MUTEENV",
-                "width": "WIDTHENV",
-                "send_volume": "SENDVOLENV",
-                "send_pan": "SENDPANENV",
-            }
-
-            envelope_type = envelope_map.get(envelope_name.lower(), "VOLENV")
-            envelope = self._RPR.GetTrackEnvelopeByName(track.id, envelope_type)
+            envelope = self._get_track_envelope(track, envelope_name)
 
-            if envelope == -1:
+            if envelope is None or envelope == -1:
                 self.logger.error(
                     f"Envelope '{envelope_name}' not found on track {track_index}"
                 )
@@ -388,19 +453,9 @@ class AutomationController:
             track = project.tracks[track_index]
 
             # Get envelope
-            envelope_map = {
-                "volume": "VOLENV",
-                "pan": "PANENV",
-                "mute": "MUTEENV",
-                "width": "WIDTHENV",
-                "send_volume": "SENDVOLENV",
-                "send_pan": "SENDPANENV",
-            }
-
-            envelope_type = envelope_map.get(envelope_name.lower(), "VOLENV")
-            envelope = self._RPR.GetTrackEnvelopeByName(track.id, envelope_type)
+            envelope = self._get_track_envelope(track, envelope_name)
 
-            if envelope == -1:
+            if envelope is None or envelope == -1:
                 self.logger.error(
                     f"Envelope '{envelope_name}' not found on track {track_index}"
                 )
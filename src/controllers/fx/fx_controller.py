@@ -34,6 +34,11 @@ class FXController:
         except Exception as e:
             self.logger.error(f"Failed to initialize RPR: {e}")
             self._RPR = None
+        # Resource paths are fixed for the session; the catalog is reused
+        # until the plugin database files change
+        self._resource_paths: Optional[List[str]] = None
+        self._fx_catalog: Optional[List[str]] = None
+        self._fx_catalog_stamp: tuple = ()
         self.manage = FXManageController(self._RPR, self.logger)
         self.params = FXParamsController(self._RPR, self.logger)
         self.presets = FXPresetsController(self._RPR, self.logger)
@@ -53,6 +58,11 @@ class FXController:
     ) -> bool:
         return self.params.set_fx_param(track_index, fx_index, param_name, value)
 
+    def set_fx_params(
+        self, track_index: int, fx_index: int, values: Dict[str, float]
+    ) -> Optional[Dict[str, bool]]:
+        return self.params.set_fx_params(track_index, fx_index, values)
+
     def get_fx_param(self, track_index: int, fx_index: int, param_name: str) -> float:
         return self.params.get_fx_param(track_index, fx_index, param_name)
 
@@ -73,12 +83,22 @@ class FXController:
 
     def get_available_fx_list(self) -> List[str]:
         try:
+            plugin_files = self._plugin_database_files()
+            # The catalog only changes when REAPER rescans and rewrites these files
+            stamp = tuple((path, os.path.getmtime(path)) for path in plugin_files)
+            if self._fx_catalog is not None and stamp == self._fx_catalog_stamp:
+                return list(self._fx_catalog)
+
             fx_list = []
-            fx_list.extend(self._read_plugin_database())
+            for ini_path in plugin_files:
+                self.logger.info(f"Found plugin database at: {ini_path}")
+                fx_list.extend(self._parse_plugin_file(ini_path))
             if fx_list:
                 unique_fx_list = sorted(list(set(fx_list)))
                 self.logger.info(f"Retrieved {len(unique_fx_list)} unique FX plugins")
-                return unique_fx_list
+                self._fx_catalog = unique_fx_list
+                self._fx_catalog_stamp = stamp
+                return list(unique_fx_list)
             else:
                 self.logger.warning("No FX plugins found through any method")
                 return []
@@ -86,17 +106,14 @@ class FXController:
             self.logger.error(f"Failed to get available FX list: {e}")
             return []
 
-    def _read_plugin_database(self) -> List[str]:
-        fx_list = []
-        try:
+    def _plugin_database_files(self) -> List[str]:
+        if not self._resource_paths:
             self.logger.info("Attempting to read Reaper plugin database files")
-            resource_paths = self._get_reaper_resource_paths()
-            for resource_path in resource_paths:
-                self.logger.info(f"Checking resource path: {resource_path}")
-                fx_list.extend(self._parse_plugin_files(resource_path))
-        except Exception as e:
-            self.logger.warning(f"Failed to read Reaper plugin database: {e}")
-        return fx_list
+            self._resource_paths = self._get_reaper_resource_paths()
+        plugin_files = []
+        for resource_path in self._resource_paths:
+            plugin_files.extend(self._plugin_files_in(resource_path))
+        return plugin_files
 
     def _get_reaper_resource_paths(self) -> List[str]:
         resource_paths = []
@@ -111,32 +128,30 @@ class FXController:
             self.logger.warning(f"Failed to get Reaper resource path: {e}")
         return resource_paths
 
-    def _parse_plugin_files(self, resource_path: str) -> List[str]:
-        fx_list = []
+    def _plugin_files_in(self, resource_path: str) -> List[str]:
         plugin_ini_files = [
             "reaper-plugs.ini",
             "reaper-plugs64.ini",
             "reaper-vstplugins.ini",
             "reaper-vstplugins64.ini",
         ]
-        for ini_file in plugin_ini_files:
-            ini_path = os.path.join(resource_path, ini_file)
-            if os.path.exists(ini_path):
-                self.logger.info(f"Found plugin database at: {ini_path}")
-                fx_list.extend(self._parse_plugin_file(ini_path))
-        return fx_list
+        return [
+            os.path.join(resource_path, ini_file)
+            for ini_file in plugin_ini_files
+            if os.path.exists(os.path.join(resource_path, ini_file))
+        ]
 
     def _parse_plugin_file(self, file_path: str) -> List[str]:
-        fx_list: List[str] = []
+        fx_names: Dict[str, None] = {}
         try:
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 for line in f:
                     plugin_name = self._extract_plugin_name(line)
-                    if plugin_name and plugin_name not in fx_list:
-                        fx_list.append(plugin_name)
+                    if plugin_name:
+                        fx_names[plugin_name] = None
         except Exception as e:
             self.logger.warning(f"Failed to parse plugin file {file_path}: {e}")
-        return fx_list
+        return list(fx_names)
 
     def _extract_plugin_name(self, line: str) -> Optional[str]:
         if "=" not in line:
@@ -1,7 +1,7 @@
 import logging
 from typing import List, Dict, Any, Optional
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
 
 
 class FXParamsController:
@@ -36,6 +36,53 @@ class FXParamsController:
             self.logger.error("Failed to set FX parameter: %s", e)
             return False
 
+    def set_fx_params(
+        self, track_index: int, fx_index: int, values: Dict[str, float]
+    ) -> Optional[Dict[str, bool]]:
+        """Set several parameters on one FX, reading its parameter names at most once.
+
+        Returns whether each parameter was set, keyed by name, or None on failure.
+        """
+        try:
+            with inside_reaper():
+                project = get_reapy().Project()
+                track = project.tracks[track_index]
+                fx_name_buf = "\x00" * 256
+                self._RPR.TrackFX_GetFXName(track.id, fx_index, fx_name_buf, 256)
+                fx_name = (fx_name_buf or "").rstrip("\x00")
+                param_names = None
+                results = {}
+                for param_name, value in values.items():
+                    index = self._map_param_name_to_index(fx_name, param_name)
+                    if index is None:
+                        if param_names is None:
+                            param_names = self._read_param_names(track.id, fx_index, fx_name)
+                        index = next(
+                            (i for i, retrieved in enumerate(param_names)
+                             if (param_name.lower() in retrieved.lower()) or (retrieved.lower() in param_name.lower())),
+                            None,
+                        )
+                    if index is None:
+                        self.logger.warning("FX parameter '%s' not found on FX %s", param_name, fx_index)
+                        results[param_name] = False
+                        continue
+                    self._RPR.TrackFX_SetParam(track.id, fx_index, index, value)
+                    results[param_name] = True
+                return results
+        except Exception as e:
+            self.logger.error("Failed to set FX parameters: %s", e)
+            return None
+
+    def _read_param_names(self, track_id, fx_index: int, fx_name: str) -> List[str]:
+        names = []
+        for i in range(self._RPR.TrackFX_GetNumParams(track_id, fx_index)):
+            buf_size = 256
+            name_buf = "\x00" * buf_size
+            got = self._RPR.TrackFX_GetParamName(track_id, fx_index, i, name_buf, buf_size)
+            retrieved = name_buf.rstrip("\x00") if got else self._RPR.TrackFX_GetParamName(track_id, fx_index, i, "", 256)
+            names.append(retrieved or self._generate_contextual_param_name(fx_name or "Unknown", i))
+        return names
+
     def get_fx_param(self, track_index: int, fx_index: int, param_name: str) -> float:
         try:
             project = get_reapy().Project()
@@ -61,59 +108,79 @@ class FXParamsController:
             self.logger.error("Failed to get FX parameter '%s': %s", param_name, e)
             return 0.0
 
-    def get_fx_param_list(self, track_index: int, fx_index: int) -> List[Dict[str, Any]]:
+    def get_fx_param_list(
+        self, track_index: int, fx_index: int
+    ) -> List[Dict[str, Any]]:
         try:
-            project = get_reapy().Project()
-            track = project.tracks[track_index]
-            param_list: List[Dict[str, Any]] = []
-            param_count = self._RPR.TrackFX_GetNumParams(track.id, fx_index)
-            fx_name_buf = "\x00" * 256
-            self._RPR.TrackFX_GetFXName(track.id, fx_index, fx_name_buf, 256)
-            fx_name = fx_name_buf.rstrip("\x00")
-            for i in range(param_count):
-                try:
-                    param_name = ""
+            with inside_reaper():
+                project = get_reapy().Project()
+                track = project.tracks[track_index]
+                param_list: List[Dict[str, Any]] = []
+                param_count = self._RPR.TrackFX_GetNumParams(track.id, fx_index)
+                fx_name_buf = "\x00" * 256
+                self._RPR.TrackFX_GetFXName(track.id, fx_index, fx_name_buf, 256)
+                fx_name = fx_name_buf.rstrip("\x00")
+                for i in range(param_count):
                     try:
-                        buf_size = 256
-                        param_name = self._RPR.TrackFX_GetParamName(track.id, fx_index, i, "", buf_size)
-                        if not param_name or len(param_name.strip()) == 0:
-                            raise Exception("Empty parameter name")
-                    except Exception:
+                        param_name = ""
                         try:
-                            param_name_buf = "\x00" * 256
-                            success = self._RPR.TrackFX_GetParamName(track.id, fx_index, i, param_name_buf, 256)
-                            if success and param_name_buf:
-                                param_name = param_name_buf.rstrip("\x00")
-                                if not param_name:
-                                    raise Exception("Empty buffer result")
+                            buf_size = 256
+                            param_name = self._RPR.TrackFX_GetParamName(
+                                track.id, fx_index, i, "", buf_size
+                            )
+                            if not param_name or len(param_name.strip()) == 0:
+                                raise Exception("Empty parameter name")
                         except Exception:
-                            param_name = self._generate_contextual_param_name(fx_name, i)
-                    param_value = self._RPR.TrackFX_GetParam(track.id, fx_index, i)
-                    formatted_value = ""
-                    try:
-                        format_buf = "\x00" * 256
-                        success = self._RPR.TrackFX_GetFormattedParamValue(track.id, fx_index, i, format_buf, 256)
-                        formatted_value = format_buf.rstrip("\x00") if (success and format_buf) else f"{param_value:.3f}"
-                    except Exception:
-                        formatted_value = f"{param_value:.3f}"
-                    param_list.append({
-                        "index": i,
-                        "name": param_name or f"Param_{i}",
-                        "value": param_value,
-                        "formatted_value": formatted_value,
-                    })
-                except Exception as param_error:
-                    self.logger.warning(f"Failed to get parameter {i}: {param_error}")
-                    param_list.append({
-                        "index": i,
-                        "name": f"Param_{i}",
-                        "value": 0.0,
-                        "formatted_value": "0.000",
-                    })
-            return param_list
+                            try:
+                                param_name_buf = "\x00" * 256
+                                success = self._RPR.TrackFX_GetParamName(
+                                    track.id, fx_index, i, param_name_buf, 256
+                                )
+                                if success and param_name_buf:
+                                    param_name = param_name_buf.rstrip("\x00")
+                                    if not param_name:
+                                        raise Exception("Empty buffer result")
+                            except Exception:
+                                param_name = self._generate_contextual_param_name(
+                                    fx_name, i
+                                )
+                        param_value = self._RPR.TrackFX_GetParam(track.id, fx_index, i)
+                        formatted_value = ""
+                        try:
+                            format_buf = "\x00" * 256
+                            success = self._RPR.TrackFX_GetFormattedParamValue(
+                                track.id, fx_index, i, format_buf, 256
+                            )
+                            formatted_value = (
+                                format_buf.rstrip("\x00")
+                                if (success and format_buf)
+                                else f"{param_value:.3f}"
+                            )
+                        except Exception:
+                            formatted_value = f"{param_value:.3f}"
+                        param_list.append(
+                            {
+                                "index": i,
+                                "name": param_name or f"Param_{i}",
+                                "value": param_value,
+                                "formatted_value": formatted_value,
+                            }
+                        )
+                    except Exception as param_error:
+                        self.logger.warning(
+                            f"Failed to get parameter {i}: {param_error}"
+                        )
+                        param_list.append(
+                            {
+                                "index": i,
+                                "name": f"Param_{i}",
+                                "value": 0.0,
+                                "formatted_value": "0.000",
+                            }
+                        )
+                return param_list
         except Exception as e:
-            self.logger.error(
-                f"Failed to get FX parameter list for FX {fx_index}: {e}")
+            self.logger.error(f"Failed to get FX parameter list for FX {fx_index}: {e}")
             return []
 
     def _generate_contextual_param_name(self, fx_name: str, param_index: int) -> str:
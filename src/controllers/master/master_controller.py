@@ -9,9 +9,11 @@ import os
 
 # Add utils path for imports
 script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, script_dir)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
+from src.core.write_shadow import WriteShadow
 
 
 class MasterController:
@@ -21,24 +23,26 @@ class MasterController:
         self.logger = logging.getLogger(__name__)
         if debug:
             self.logger.setLevel(logging.INFO)
+        self._shadow = WriteShadow()
 
     def get_master_track(self) -> Dict[str, Any]:
         """Get information about the master track."""
         try:
-            reapy = get_reapy()
-            project = reapy.Project()
-            master = project.master_track
+            with inside_reaper():
+                reapy = get_reapy()
+                project = reapy.Project()
+                master = project.master_track
 
-            # Use send methods to get volume and pan instead of direct attributes
-            # For master track, these are accessed differently in the reapy API
-            volume = master.get_info_value("D_VOL")  # Get master volume
-            pan = master.get_info_value("D_PAN")  # Get master pan
+                # Use send methods to get volume and pan instead of direct attributes
+                # For master track, these are accessed differently in the reapy API
+                volume = master.get_info_value("D_VOL")  # Get master volume
+                pan = master.get_info_value("D_PAN")  # Get master pan
 
-            # For mute and solo, use the appropriate API calls
-            mute = bool(master.get_info_value("B_MUTE"))
-            solo = bool(master.get_info_value("I_SOLO"))
+                # For mute and solo, use the appropriate API calls
+                mute = bool(master.get_info_value("B_MUTE"))
+                solo = bool(master.get_info_value("I_SOLO"))
 
-            return {"volume": volume, "pan": pan, "mute": mute, "solo": solo}
+                return {"volume": volume, "pan": pan, "mute": mute, "solo": solo}
         except Exception as e:
             self.logger.error(f"Failed to get master track info: {e}")
             return {}
@@ -53,13 +57,18 @@ class MasterController:
         Returns:
             bool: True if successful, False otherwise
         """
+        if self._shadow.is_current("volume", volume):
+            self.logger.info(f"Master volume already {volume}, skipping write")
+            return True
         try:
             reapy = get_reapy()
             project = reapy.Project()
             master = project.master_track
             master.volume = volume
+            self._shadow.record("volume", volume)
             return True
         except Exception as e:
+            self._shadow.forget("volume")
             error_message = f"Failed to set master volume: {e}"
             self.logger.error(error_message)
             return False
@@ -74,13 +83,18 @@ class MasterController:
         Returns:
             bool: True if successful, False otherwise
         """
+        if self._shadow.is_current("pan", pan):
+            self.logger.info(f"Master pan already {pan}, skipping write")
+            return True
         try:
             reapy = get_reapy()
             project = reapy.Project()
             master = project.master_track
             master.pan = pan
+            self._shadow.record("pan", pan)
             return True
         except Exception as e:
+            self._shadow.forget("pan")
             error_message = f"Failed to set master pan: {e}"
             self.logger.error(error_message)
             return False
@@ -95,16 +109,20 @@ class MasterController:
         Returns:
             bool: True if successful, False otherwise
         """
+        if mute is not None and self._shadow.is_current("mute", mute):
+            self.logger.info(f"Master mute already {mute}, skipping write")
+            return True
         try:
             reapy = get_reapy()
             project = reapy.Project()
             master = project.master_track
             if mute is None:
-                master.mute = not master.mute
-            else:
-                master.mute = mute
+                mute = not master.mute
+            master.mute = mute
+            self._shadow.record("mute", mute)
             return True
         except Exception as e:
+            self._shadow.forget("mute")
             error_message = f"Failed to toggle master mute: {e}"
             self.logger.error(error_message)
             return False
@@ -119,16 +137,20 @@ class MasterController:
         Returns:
             bool: True if successful, False otherwise
         """
+        if solo is not None and self._shadow.is_current("solo", solo):
+            self.logger.info(f"Master solo already {solo}, skipping write")
+            return True
         try:
             reapy = get_reapy()
             project = reapy.Project()
             master = project.master_track
             if solo is None:
-                master.solo = not master.solo
-            else:
-                master.solo = solo
+                solo = not master.solo
+            master.solo = solo
+            self._shadow.record("solo", solo)
             return True
         except Exception as e:
+            self._shadow.forget("solo")
             error_message = f"Failed to toggle master solo: {e}"
             self.logger.error(error_message)
             return False
@@ -17,9 +17,10 @@ import os
 
 # Add utils path for imports
 script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, script_dir)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
 
 
 class MIDIController:
@@ -259,72 +260,100 @@ class MIDIController:
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # Validate parameters
-            if not self._validate_midi_note_params(
-                note_params.pitch, note_params.velocity, note_params.channel
-            ):
-                return False
+        return self.add_midi_notes_batch(track_index, item_id, [note_params]) == 1
 
-            # Get the track and item
-            track = self._get_track(track_index)
-            if track is None:
-                return False
-
-            item = get_item_by_id_or_index(track, item_id)
-            if item is None:
-                error_message = f"MIDI item {item_id} not found on track {track_index}"
-                self.logger.error(error_message)
-                return False
-
-            # Add the MIDI note
-            take = item.active_take
-            if take is None:
-                self.logger.error("No active take found for MIDI item")
-                return False
-
-            # Add the note using the ReaScript API
-            reapy = get_reapy()
-            RPR = reapy.reascript_api
+    def add_midi_notes_batch(
+        self,
+        track_index: int,
+        item_id: Union[int, str],
+        notes: List["MIDIController.MIDINoteParams"],
+    ) -> int:
+        """
+        Add several MIDI notes to a MIDI item in one pass.
 
-            # Get the take ID
-            take_id = take.id
+        The track, item and take are resolved once, all notes are inserted
+        while the reapy connection is held, and the take is sorted once at
+        the end instead of after every insert.
 
-            # Add the MIDI note using ReaScript API
-            # MIDI_InsertNote(take, selected, muted, startppqpos, endppqpos, chan, pitch, vel)
-            # We need to convert time to PPQ (pulses per quarter note)
-            reapy = get_reapy()
-            project = reapy.Project()
-            start_ppq = RPR.TimeMap2_timeToQN(project.id, note_params.start_time)
-            end_ppq = RPR.TimeMap2_timeToQN(
-                project.id, note_params.start_time + note_params.length
-            )
+        Args:
+            track_index (int): Index of the track containing the MIDI item
+            item_id (int or str): ID of the MIDI item
+            notes (List[MIDINoteParams]): MIDI note parameters
 
-            result = RPR.MIDI_InsertNote(
-                take_id,
-                False,  # selected
-                False,  # muted
-                start_ppq,
-                end_ppq,
-                note_params.channel,
-                note_params.pitch,
-                note_params.velocity,
-                False,  # noSortIn
-            )
+        Returns:
+            int: Number of notes added, or -1 if the batch failed
+        """
+        try:
+            # Validate every note before touching the item
+            for note_params in notes:
+                if not self._validate_midi_note_params(
+                    note_params.pitch, note_params.velocity, note_params.channel
+                ):
+                    return -1
+
+            with inside_reaper():
+                # Get the track and item
+                track = self._get_track(track_index)
+                if track is None:
+                    return -1
+
+                item = get_item_by_id_or_index(track, item_id)
+                if item is None:
+                    error_message = (
+                        f"MIDI item {item_id} not found on track {track_index}"
+                    )
+                    self.logger.error(error_message)
+                    return -1
+
+                take = item.active_take
+                if take is None:
+                    self.logger.error("No active take found for MIDI item")
+                    return -1
+
+                RPR = get_reapy().reascript_api
+                take_id = take.id
+
+                added = 0
+                for note_params in notes:
+                    # MIDI_InsertNote positions are in the take's PPQ
+                    start_ppq = RPR.MIDI_GetPPQPosFromProjTime(
+                        take_id, note_params.start_time
+                    )
+                    end_ppq = RPR.MIDI_GetPPQPosFromProjTime(
+                        take_id, note_params.start_time + note_params.length
+                    )
+
+                    # MIDI_InsertNote(take, selected, muted, startppqpos, endppqpos,
+                    # chan, pitch, vel, noSortIn)
+                    result = RPR.MIDI_InsertNote(
+                        take_id,
+                        False,  # selected
+                        False,  # muted
+                        start_ppq,
+                        end_ppq,
+                        note_params.channel,
+                        note_params.pitch,
+                        note_params.velocity,
+                        True,  # noSortIn, sorted once below
+                    )
+                    if result == -1 or result is False:
+                        self.logger.error(
+                            f"Failed to insert MIDI note pitch={note_params.pitch}"
+                        )
+                        continue
+                    added += 1
 
-            if result == -1:
-                self.logger.error("Failed to insert MIDI note using ReaScript API")
-                return False
+                RPR.MIDI_Sort(take_id)
 
             self.logger.info(
-                f"Added MIDI note: pitch={note_params.pitch}, "
-                f"velocity={note_params.velocity}, channel={note_params.channel}"
+                f"Added {added} of {len(notes)} MIDI notes to item {item_id} "
+                f"on track {track_index}"
             )
-            return True
+            return added if added == len(notes) else -1
 
         except Exception as e:
-            self.logger.error(f"Failed to add MIDI note: {e}")
-            return False
+            self.logger.error(f"Failed to add MIDI notes: {e}")
+            return -1
 
     def add_midi_note_simple(
         self,
@@ -500,28 +529,31 @@ class MIDIController:
             if not self._validate_pitch_range(pitch_min, pitch_max):
                 return []
 
-            # Get all MIDI items in the project
-            midi_items = self.get_all_midi_items()
             matching_notes = []
 
-            # Search through each MIDI item
-            for item_info in midi_items:
-                track_index = item_info["track_index"]
-                item_id = item_info["item_id"]
-
-                # Get notes from this item
-                notes = self.get_midi_notes(track_index, item_id)
-
-                # Filter notes by pitch range
-                filtered_notes = self._filter_notes_by_pitch(
-                    notes, pitch_min, pitch_max
-                )
-
-                # Add track and item information to matching notes
-                for note in filtered_notes:
-                    note["track_index"] = track_index
-                    note["item_id"] = item_id
-                    matching_notes.append(note)
+            # The scan touches every MIDI item; keep it on one held connection
+            with inside_reaper():
+                # Get all MIDI items in the project
+                midi_items = self.get_all_midi_items()
+
+                # Search through each MIDI item
+                for item_info in midi_items:
+                    track_index = item_info["track_index"]
+                    item_id = item_info["item_id"]
+
+                    # Get notes from this item
+                    notes = self.get_midi_notes(track_index, item_id)
+
+                    # Filter notes by pitch range
+                    filtered_notes = self._filter_notes_by_pitch(
+                        notes, pitch_min, pitch_max
+                    )
+
+                    # Add track and item information to matching notes
+                    for note in filtered_notes:
+                        note["track_index"] = track_index
+                        note["item_id"] = item_id
+                        matching_notes.append(note)
 
             self.logger.info(
                 f"Found {len(matching_notes)} MIDI notes in pitch range {pitch_min}-{pitch_max}"
@@ -5,9 +5,11 @@ import os
 
 # Add utils path for imports
 script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, script_dir)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
 
 from src.core.reapy_bridge import get_reapy
+from src.core.write_shadow import WriteShadow
 
 
 class ProjectController:
@@ -17,6 +19,7 @@ class ProjectController:
         self.logger = logging.getLogger(__name__)
         if debug:
             self.logger.setLevel(logging.INFO)
+        self._shadow = WriteShadow()
 
     def set_tempo(self, bpm: float) -> bool:
         """
@@ -28,6 +31,10 @@ class ProjectController:
         Returns:
             bool: True if successful, False otherwise
         """
+        if self._shadow.is_current("tempo", float(bpm)):
+            self.logger.info(f"Tempo already {bpm} BPM, skipping write")
+            return True
+        self._shadow.forget("tempo")
         try:
             reapy = get_reapy()
 
@@ -50,6 +57,7 @@ class ProjectController:
                     # Verify the tempo was set correctly
                     new_tempo = project.bpm
                     self.logger.info(f"Tempo set successfully. New tempo: {new_tempo}")
+                    self._shadow.record("tempo", float(bpm))
 
                     return True
 
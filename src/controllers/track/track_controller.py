@@ -1,13 +1,14 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 import sys
 import os
 
 # Add utils path for imports
 script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, script_dir)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
 
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
 
 
 class TrackController:
@@ -41,6 +42,30 @@ class TrackController:
             self.logger.error(error_message)
             raise
 
+    def create_tracks(self, names: List[Optional[str]]) -> List[int]:
+        """
+        Create several tracks at the end of the track list in one held connection.
+
+        Args:
+            names (List[str]): Names for the new tracks, in order (None for unnamed)
+
+        Returns:
+            List[int]: Indices of the created tracks
+        """
+        try:
+            with inside_reaper():
+                project = get_reapy().Project()
+                indices = []
+                for name in names:
+                    track = project.add_track(project.n_tracks, name or "")
+                    indices.append(track.index)
+                return indices
+
+        except Exception as e:
+            error_message = f"Failed to create tracks: {e}"
+            self.logger.error(error_message)
+            raise
+
     def rename_track(self, track_index: int, new_name: str) -> bool:
         """
         Rename an existing track.
@@ -4,8 +4,10 @@ This module provides a single point of access to reapy instances to avoid
 circular imports and duplicate initialization code.
 """
 
+import contextlib
 import logging
 import importlib
+import sys
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,35 @@ def get_rpr():
     return _rpr_instance
 
 
+@contextlib.contextmanager
+def inside_reaper():
+    """
+    Hold the reapy connection open for a block of REAPER calls.
+
+    Wraps reapy.inside_reaper() so a sequence of API calls is served
+    without releasing the connection between them. If the connection
+    cannot be held (no REAPER reachable, or an older reapy), the block
+    still runs and each call behaves as it would on its own.
+    """
+    held = None
+    try:
+        held = get_reapy().inside_reaper()
+        held.__enter__()
+    except Exception as e:
+        logger.debug("Running without a held reapy connection: %s", e)
+        held = None
+
+    try:
+        yield
+    except BaseException:
+        # Let the held context see the error, and honour it if it suppresses
+        if held is None or not held.__exit__(*sys.exc_info()):
+            raise
+    else:
+        if held is not None:
+            held.__exit__(None, None, None)
+
+
 def reset_instances():
     """
     Reset the cached instances. Useful for testing.
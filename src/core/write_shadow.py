@@ -0,0 +1,73 @@
+"""
+Shadow of the last value written for simple project settings.
+
+Each recorded write is stamped with REAPER's project state change count
+taken right after the write. A repeated write of the same value is only
+treated as a no-op while the count is unchanged, so edits made in REAPER
+itself (or by any other undoable action) invalidate the shadow.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.core.reapy_bridge import get_rpr
+
+
+def project_change_count() -> Optional[int]:
+    """
+    Get REAPER's project state change count.
+
+    Returns:
+        The change count, or None if REAPER cannot be queried
+    """
+    try:
+        return get_rpr().GetProjectStateChangeCount(0)
+    except Exception:
+        return None
+
+
+class WriteShadow:
+    """Last written values keyed by setting, valid until the project changes."""
+
+    def __init__(
+        self, state_token: Callable[[], Optional[Hashable]] = project_change_count
+    ):
+        self._state_token = state_token
+        self._values: Dict[Hashable, Tuple[Any, Hashable]] = {}
+
+    def is_current(self, key: Hashable, value: Any) -> bool:
+        """
+        Check whether value was the last one written for key.
+
+        Args:
+            key: Name of the setting (e.g. "tempo")
+            value: Value about to be written
+
+        Returns:
+            True if writing value would be a no-op
+        """
+        entry = self._values.get(key)
+        if entry is None or entry[0] != value:
+            return False
+        token = self._state_token()
+        if token is None or token != entry[1]:
+            del self._values[key]
+            return False
+        return True
+
+    def record(self, key: Hashable, value: Any) -> None:
+        """
+        Remember a successful write of value for key.
+
+        Args:
+            key: Name of the setting
+            value: Value that was written
+        """
+        token = self._state_token()
+        if token is None:
+            self._values.pop(key, None)
+        else:
+            self._values[key] = (value, token)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop the shadow for key, e.g. after a failed or partial write."""
+        self._values.pop(key, None)
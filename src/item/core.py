@@ -11,7 +11,7 @@ This module organizes item operations into logical groups with high cohesion:
 import logging
 from typing import Optional, Dict, Any, Union, List
 
-from ..core.reapy_bridge import get_reapy
+from ..core.reapy_bridge import get_reapy, inside_reaper
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +21,28 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+def _item_from_pointer(reapy, track: Any, item_id: str) -> Optional[Any]:
+    """Get the item an ID points to if it is a live item on the given track."""
+    try:
+        RPR = reapy.reascript_api
+        if not RPR.ValidatePtr2(0, item_id, "MediaItem*"):
+            return None
+        if str(RPR.GetMediaItemTrack(item_id)) != str(track.id):
+            return None
+        return reapy.Item(item_id)
+    except Exception:
+        return None
+
+
 def get_item_by_id_or_index(
-    track_index: int, item_id_or_index: Union[int, str]
+    track_index: Union[int, Any], item_id_or_index: Union[int, str]
 ) -> Optional[Any]:
     """
     Get an item by its ID or index.
 
     Args:
-        track_index (int): Index of the track
+        track_index (Union[int, Any]): Index of the track, or a track object
+            the caller has already resolved
         item_id_or_index (Union[int, str]): Item ID or index
 
     Returns:
@@ -36,20 +50,34 @@ def get_item_by_id_or_index(
     """
     try:
         reapy = get_reapy()
-        project = reapy.Project()
-        track = project.tracks[track_index]
+        with inside_reaper():
+            if isinstance(track_index, int):
+                track = reapy.Project().tracks[track_index]
+            else:
+                track = track_index
+
+            if isinstance(item_id_or_index, int):
+                # Treat as index; fetch just that item, not the whole list
+                if 0 <= item_id_or_index < track.n_items:
+                    return reapy.Item(
+                        reapy.reascript_api.GetTrackMediaItem(
+                            track.id, item_id_or_index
+                        )
+                    )
+                return None
 
-        if isinstance(item_id_or_index, int):
-            # Treat as index
-            if 0 <= item_id_or_index < len(track.items):
-                return track.items[item_id_or_index]
-        else:
-            # Treat as ID
-            for item in track.items:
-                if str(item.id) == str(item_id_or_index):
-                    return item
+            # An ID is the item's pointer: check it directly before
+            # falling back to a scan of the track's items
+            item = _item_from_pointer(reapy, track, str(item_id_or_index))
+            if item is not None:
+                return item
 
-        return None
+            # Read the item list once; each track.items access is a round-trip
+            items = track.items
+
+            # Treat as ID; item.id is held locally, so this scan makes no calls
+            item_id = str(item_id_or_index)
+            return next((item for item in items if str(item.id) == item_id), None)
 
     except Exception as e:
         logger.error(f"Failed to get item: {e}")
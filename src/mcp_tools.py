@@ -1,7 +1,18 @@
 from mcp import types
 from mcp.server.fastmcp import FastMCP, Context
-from typing import Optional, Dict, Any, List, Union
+from typing import Annotated, Optional, Dict, Any, List, NamedTuple, Set, Tuple, Union
+import asyncio
+import base64
+import contextlib
+import functools
+import inspect
+import json
 import logging
+import os
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import Field
 from src.time.conversion import (
     parse_position,
     measure_beat_to_time,
@@ -9,7 +20,10 @@ from src.time.conversion import (
 )
 
 # Use centralized reapy bridge
-from src.core.reapy_bridge import get_reapy
+from src.core.reapy_bridge import get_reapy, inside_reaper
+
+from src.controllers.analysis.spectrum_controller import WeightingType
+from src.controllers.analysis.analysis_cache import AnalysisCache
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -20,6 +34,51 @@ DEFAULT_MIDI_VELOCITY = 96
 MAX_MIDI_PITCH = 127
 MIN_MIDI_PITCH = 0
 
+# Argument types shared across tools. The ranges become part of each tool's
+# schema, so out-of-range calls are rejected before they reach REAPER.
+TrackIndex = Annotated[int, Field(ge=0)]
+FxIndex = Annotated[int, Field(ge=0)]
+MidiPitch = Annotated[int, Field(ge=MIN_MIDI_PITCH, le=MAX_MIDI_PITCH)]
+MidiVelocity = Annotated[int, Field(ge=0, le=MAX_MIDI_PITCH)]
+Pan = Annotated[float, Field(ge=-1.0, le=1.0)]
+
+# Page size for get_available_fx_list; installs can have thousands of plugins
+DEFAULT_FX_PAGE_SIZE = 200
+
+# Page size for MIDI note listings; dense items can hold tens of thousands
+DEFAULT_MIDI_NOTE_PAGE_SIZE = 500
+
+# Frequency weighting names accepted by spectrum_analyzer_track
+_WEIGHT_MAP = {
+    "none": WeightingType.NONE,
+    "A": WeightingType.A_WEIGHTING,
+    "C": WeightingType.C_WEIGHTING,
+    "Z": WeightingType.Z_WEIGHTING,
+}
+
+# Read-only analysis results, invalidated by project edits
+_ANALYSIS_CACHE = AnalysisCache(maxsize=64)
+
+# Response messages for _handle_controller_operation
+_OPERATION_SUCCESS_FORMAT = "%s completed successfully"
+_OPERATION_FAILURE_FORMAT = "Failed to %s"
+
+# reapy's client is one unsynchronised socket, so REAPER calls made off the
+# event loop all go through this single worker thread
+_REAPY_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reapy")
+
+# Response wording for tools that set a state or, given None, toggle it
+_FX_STATE_NAMES = {True: "enabled", False: "disabled", None: "toggled"}
+_MASTER_MUTE_ACTIONS = {True: "Mute", False: "Unmute", None: "Toggle mute"}
+_MASTER_SOLO_ACTIONS = {True: "Solo", False: "Unsolo", None: "Toggle solo"}
+
+# Longest tool description sent in list_tools
+MAX_TOOL_DESCRIPTION_LENGTH = 2048
+
+# Spectrum magnitudes are returned as int16 millibels (0.01 dB steps)
+MIN_SPECTRUM_MILLIBEL = -12000
+MAX_SPECTRUM_MILLIBEL = 1200
+
 
 def _create_success_response(message: str) -> Dict[str, Any]:
     """Create a standardized success response."""
@@ -31,269 +90,445 @@ def _create_error_response(message: str) -> Dict[str, Any]:
     return {"status": "error", "message": message}
 
 
+def _resolve_position(
+    time_seconds: Optional[float], measure: Optional[str]
+) -> Optional[float]:
+    """Resolve a position given in seconds or as a measure (the measure wins)."""
+    if measure:
+        return parse_position(measure)
+    return time_seconds
+
+
+def _page(
+    items: List[Any], offset: int, limit: int
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    Slice one page out of a listing.
+
+    Returns:
+        The page and its paging fields (total, offset, next_offset), where
+        next_offset is None on the last page
+    """
+    offset = max(0, offset)
+    page = items[offset : offset + max(0, limit)]
+    next_offset = offset + len(page)
+    return page, {
+        "total": len(items),
+        "offset": offset,
+        "next_offset": next_offset if next_offset < len(items) else None,
+    }
+
+
+def _encode_spectrum_magnitudes(magnitudes_db: List[float]) -> str:
+    """
+    Pack dB magnitudes as base64 little-endian int16 millibels.
+
+    Two bytes per bin instead of a JSON float list; 0.01 dB resolution is
+    well below what a spectrum display can show.
+    """
+    millibels = array(
+        "h",
+        (
+            min(MAX_SPECTRUM_MILLIBEL, max(MIN_SPECTRUM_MILLIBEL, round(db * 100)))
+            for db in magnitudes_db
+        ),
+    )
+    if sys.byteorder != "little":
+        millibels.byteswap()
+    return base64.b64encode(millibels.tobytes()).decode("ascii")
+
+
+def _spectrum_bins_data(spectrum) -> Dict[str, Any]:
+    """Describe a spectrum's bins for a tool response."""
+    return {
+        "bin_count": len(spectrum.magnitudes_db),
+        "bin_hz": spectrum.sample_rate / spectrum.fft_size,
+        "dtype": "int16le_millibel",
+        "magnitudes": _encode_spectrum_magnitudes(spectrum.magnitudes_db),
+    }
+
+
+def _operation_succeeded(result: Any) -> bool:
+    """
+    Classify a controller result.
+
+    True/False are explicit success/failure, numbers are successful when
+    >= 0, None is failure and any other value (strings, objects) is success.
+    """
+    if isinstance(result, bool):
+        return result
+    if isinstance(result, (int, float)):
+        return result >= 0
+    return result is not None
+
+
 def _handle_controller_operation(
-    operation_name: str, operation_func, *args, **kwargs
+    operation_name: str,
+    operation_func,
+    *args,
+    hold_connection: bool = True,
+    **kwargs,
 ) -> Dict[str, Any]:
-    """Generic handler for controller operations with proper error handling."""
+    """
+    Generic handler for controller operations with proper error handling.
+
+    The operation runs on one held reapy connection, so the several REAPER
+    calls a controller method makes are not each a separate round-trip.
+    """
     try:
-        result = operation_func(*args, **kwargs)
-        # Handle boolean results: True/False are explicit success/failure
-        # Handle numeric results: >= 0 is success, < 0 is failure
-        # Handle None: generally failure unless operation is expected to return None
-        if result is True or (isinstance(result, (int, float)) and result >= 0):
-            return _create_success_response(f"{operation_name} completed successfully")
-        elif result is False or (isinstance(result, (int, float)) and result < 0):
-            return _create_error_response(f"Failed to {operation_name.lower()}")
-        elif (
-            result is not None
-        ):  # Non-boolean, non-numeric success (strings, objects, etc.)
-            return _create_success_response(f"{operation_name} completed successfully")
-        else:  # result is None
-            return _create_error_response(f"Failed to {operation_name.lower()}")
+        if hold_connection:
+            with inside_reaper():
+                result = operation_func(*args, **kwargs)
+        else:
+            result = operation_func(*args, **kwargs)
+        if _operation_succeeded(result):
+            return {
+                "status": "success",
+                "message": _OPERATION_SUCCESS_FORMAT % operation_name,
+            }
+        return {
+            "status": "error",
+            "message": _OPERATION_FAILURE_FORMAT % operation_name.lower(),
+        }
     except Exception as e:
-        logger.error(f"Controller operation failed: {operation_name} - {str(e)}")
+        logger.error("Controller operation failed: %s - %s", operation_name, e)
         return _create_error_response(f"Failed to {operation_name.lower()}: {str(e)}")
 
 
-def _setup_connection_tools(mcp: FastMCP, controller) -> None:
-    """Setup connection-related MCP tools."""
-
-    @mcp.tool("test_connection")
-    def test_connection(ctx: Context) -> Dict[str, Any]:
-        """Test connection to Reaper."""
-        return _handle_controller_operation(
-            "Connection test", controller.verify_connection
+class _OperationTool(NamedTuple):
+    """
+    Declarative description of a tool that just reports a controller call.
+
+    name: MCP tool name
+    method: Dotted path of the controller method, e.g. "track.rename_track"
+    params: (name, annotation) or (name, annotation, default) per argument,
+        passed to the controller method positionally in this order
+    message: str.format template over the arguments naming the operation
+    doc: Tool description shown to clients
+    hold_connection: Run the call on a held reapy connection; off for
+        calls that do not talk to REAPER through reapy
+    """
+
+    name: str
+    method: str
+    params: Tuple[tuple, ...]
+    message: str
+    doc: str
+    hold_connection: bool = True
+
+
+def _call_controller_method(controller, method: str, *args):
+    """Resolve a dotted controller method at call time and invoke it."""
+    target = controller
+    for attr in method.split("."):
+        target = getattr(target, attr)
+    return target(*args)
+
+
+def _make_operation_tool(controller, spec: _OperationTool):
+    """
+    Build the tool function for one _OperationTool entry.
+
+    The function carries an explicit signature and annotations so FastMCP
+    derives the same argument schema it would from a hand-written tool.
+    """
+    parameters = [
+        inspect.Parameter(
+            "ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Context
         )
-
-
-def _setup_track_tools(mcp: FastMCP, controller) -> None:
-    """Setup track-related MCP tools."""
-
-    @mcp.tool("create_track")
-    def create_track(ctx: Context, name: Optional[str] = None) -> Dict[str, Any]:
-        """Create a new track in Reaper."""
-        try:
-            track_index = controller.track.create_track(name)
-            return _create_success_response(f"Created track {track_index}")
-        except Exception as e:
-            logger.error(f"Failed to create track: {str(e)}")
-            return _create_error_response(f"Failed to create track: {str(e)}")
-
-    @mcp.tool("rename_track")
-    def rename_track(ctx: Context, track_index: int, new_name: str) -> Dict[str, Any]:
-        """Rename an existing track."""
-        operation_message = f"Rename track {track_index} to {new_name}"
-        return _handle_controller_operation(
-            operation_message, controller.track.rename_track, track_index, new_name
+    ]
+    for name, annotation, *default in spec.params:
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=annotation,
+                default=default[0] if default else inspect.Parameter.empty,
+            )
         )
-
-    @mcp.tool("set_track_color")
-    def set_track_color(ctx: Context, track_index: int, color: str) -> Dict[str, Any]:
-        """Set the color of a track."""
-        operation_message = f"Set color of track {track_index} to {color}"
+    signature = inspect.Signature(parameters, return_annotation=Dict[str, Any])
+    operation = functools.partial(_call_controller_method, controller, spec.method)
+
+    def tool(*args, **kwargs) -> Dict[str, Any]:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments["ctx"]
         return _handle_controller_operation(
-            operation_message, controller.track.set_track_color, track_index, color
+            spec.message.format(**arguments),
+            operation,
+            *arguments.values(),
+            hold_connection=spec.hold_connection,
         )
 
-    @mcp.tool("get_track_color")
-    def get_track_color(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """Get the color of a track."""
-        try:
-            color = controller.track.get_track_color(track_index)
-            return _create_success_response(f"Color of track {track_index}: {color}")
-        except Exception as e:
-            logger.error(f"Failed to get track color: {str(e)}")
-            return _create_error_response(f"Failed to get track color: {str(e)}")
+    tool.__name__ = tool.__qualname__ = spec.name
+    tool.__doc__ = inspect.cleandoc(spec.doc)
+    tool.__signature__ = signature
+    tool.__annotations__ = {param.name: param.annotation for param in parameters}
+    tool.__annotations__["return"] = Dict[str, Any]
+    return tool
+
+
+def _register_operation_tools(
+    mcp: FastMCP, controller, specs: Tuple[_OperationTool, ...]
+) -> None:
+    """Register a table of controller-operation tools."""
+    for spec in specs:
+        mcp.tool(spec.name)(_make_operation_tool(controller, spec))
+
+
+def _tool_errors(error_message: str):
+    """
+    Decorator that turns exceptions raised by a tool into an error response.
+
+    Replaces the per-tool try/except boilerplate; the wrapped tool only
+    needs to handle its success and explicit-failure paths.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s: %s", error_message, e)
+                return _create_error_response(f"{error_message}: {str(e)}")
+
+        return wrapper
+
+    return decorator
+
+
+_CONNECTION_OPERATION_TOOLS = (
+    _OperationTool(
+        name="test_connection",
+        method="verify_connection",
+        params=(),
+        message="Connection test",
+        doc="Test connection to Reaper.",
+        # A plain port probe; holding reapy would connect before checking
+        hold_connection=False,
+    ),
+)
 
-    @mcp.tool("get_track_count")
-    def get_track_count(ctx: Context) -> Dict[str, Any]:
-        """Get the number of tracks in the project."""
-        try:
-            count = controller.track.get_track_count()
-            return _create_success_response(f"Track count: {count}")
-        except Exception as e:
-            logger.error(f"Failed to get track count: {str(e)}")
-            return _create_error_response(f"Failed to get track count: {str(e)}")
-
-    @mcp.tool("set_track_volume")
-    def set_track_volume(
-        ctx: Context, track_index: int, volume_db: float
-    ) -> Dict[str, Any]:
-        """
+
+def _setup_connection_tools(mcp: FastMCP, controller) -> None:
+    """Setup connection-related MCP tools."""
+    _register_operation_tools(mcp, controller, _CONNECTION_OPERATION_TOOLS)
+
+
+_TRACK_OPERATION_TOOLS = (
+    _OperationTool(
+        name="rename_track",
+        method="track.rename_track",
+        params=(("track_index", TrackIndex), ("new_name", str)),
+        message="Rename track {track_index} to {new_name}",
+        doc="Rename an existing track.",
+    ),
+    _OperationTool(
+        name="set_track_color",
+        method="track.set_track_color",
+        params=(("track_index", TrackIndex), ("color", str)),
+        message="Set color of track {track_index} to {color}",
+        doc="Set the color of a track.",
+    ),
+    _OperationTool(
+        name="set_track_volume",
+        method="track.set_track_volume",
+        params=(("track_index", TrackIndex), ("volume_db", float)),
+        message="Set track {track_index} volume to {volume_db} dB",
+        doc="""
         Set the volume of a track in dB.
 
         Args:
             track_index (int): Index of the track
             volume_db (float): Volume in dB (typical range: -inf to +12dB)
-        """
-        return _handle_controller_operation(
-            f"Set track {track_index} volume to {volume_db} dB",
-            controller.track.set_track_volume,
-            track_index,
-            volume_db,
-        )
-
-    @mcp.tool("get_track_volume")
-    def get_track_volume(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """Get the volume of a track in dB."""
-        try:
-            volume = controller.track.get_track_volume(track_index)
-            return _create_success_response(
-                f"Track {track_index} volume: {volume:.2f} dB"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get track volume: {str(e)}")
-            return _create_error_response(f"Failed to get track volume: {str(e)}")
-
-    @mcp.tool("set_track_pan")
-    def set_track_pan(ctx: Context, track_index: int, pan: float) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="set_track_pan",
+        method="track.set_track_pan",
+        params=(("track_index", TrackIndex), ("pan", Pan)),
+        message="Set track {track_index} pan to {pan}",
+        doc="""
         Set the pan position of a track.
 
         Args:
             track_index (int): Index of the track
             pan (float): Pan position (-1.0 = hard left, 0.0 = center, 1.0 = hard right)
-        """
-        return _handle_controller_operation(
-            f"Set track {track_index} pan to {pan}",
-            controller.track.set_track_pan,
-            track_index,
-            pan,
-        )
-
-    @mcp.tool("get_track_pan")
-    def get_track_pan(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """Get the pan position of a track."""
-        try:
-            pan = controller.track.get_track_pan(track_index)
-            return _create_success_response(f"Track {track_index} pan: {pan}")
-        except Exception as e:
-            logger.error(f"Failed to get track pan: {str(e)}")
-            return _create_error_response(f"Failed to get track pan: {str(e)}")
-
-    @mcp.tool("set_track_mute")
-    def set_track_mute(ctx: Context, track_index: int, mute: bool) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="set_track_mute",
+        method="track.set_track_mute",
+        params=(("track_index", TrackIndex), ("mute", bool)),
+        message="Set track {track_index} mute to {mute}",
+        doc="""
         Set the mute state of a track.
 
         Args:
             track_index (int): Index of the track
             mute (bool): True to mute, False to unmute
-        """
-        return _handle_controller_operation(
-            f"Set track {track_index} mute to {mute}",
-            controller.track.set_track_mute,
-            track_index,
-            mute,
-        )
-
-    @mcp.tool("get_track_mute")
-    def get_track_mute(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """Get the mute state of a track."""
-        try:
-            mute = controller.track.get_track_mute(track_index)
-            return _create_success_response(f"Track {track_index} mute: {mute}")
-        except Exception as e:
-            logger.error(f"Failed to get track mute: {str(e)}")
-            return _create_error_response(f"Failed to get track mute: {str(e)}")
-
-    @mcp.tool("set_track_solo")
-    def set_track_solo(ctx: Context, track_index: int, solo: bool) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="set_track_solo",
+        method="track.set_track_solo",
+        params=(("track_index", TrackIndex), ("solo", bool)),
+        message="Set track {track_index} solo to {solo}",
+        doc="""
         Set the solo state of a track.
 
         Args:
             track_index (int): Index of the track
             solo (bool): True to solo, False to unsolo
-        """
-        return _handle_controller_operation(
-            f"Set track {track_index} solo to {solo}",
-            controller.track.set_track_solo,
-            track_index,
-            solo,
-        )
+        """,
+    ),
+    _OperationTool(
+        name="toggle_track_mute",
+        method="track.toggle_track_mute",
+        params=(("track_index", TrackIndex),),
+        message="Toggle track {track_index} mute",
+        doc="Toggle the mute state of a track.",
+    ),
+    _OperationTool(
+        name="toggle_track_solo",
+        method="track.toggle_track_solo",
+        params=(("track_index", TrackIndex),),
+        message="Toggle track {track_index} solo",
+        doc="Toggle the solo state of a track.",
+    ),
+    _OperationTool(
+        name="set_track_arm",
+        method="track.set_track_arm",
+        params=(("track_index", TrackIndex), ("arm", bool)),
+        message="Set track {track_index} record arm to {arm}",
+        doc="""
+        Set the record arm state of a track.
 
-    @mcp.tool("get_track_solo")
-    def get_track_solo(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """Get the solo state of a track."""
-        try:
-            solo = controller.track.get_track_solo(track_index)
-            return _create_success_response(f"Track {track_index} solo: {solo}")
-        except Exception as e:
-            logger.error(f"Failed to get track solo: {str(e)}")
-            return _create_error_response(f"Failed to get track solo: {str(e)}")
-
-    @mcp.tool("toggle_track_mute")
-    def toggle_track_mute(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """Toggle the mute state of a track."""
-        return _handle_controller_operation(
-            f"Toggle track {track_index} mute",
-            controller.track.toggle_track_mute,
-            track_index,
-        )
+        Args:
+            track_index (int): Index of the track
+            arm (bool): True to arm for recording, False to disarm
+        """,
+    ),
+)
 
-    @mcp.tool("toggle_track_solo")
-    def toggle_track_solo(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """Toggle the solo state of a track."""
-        return _handle_controller_operation(
-            f"Toggle track {track_index} solo",
-            controller.track.toggle_track_solo,
-            track_index,
-        )
 
-    @mcp.tool("set_track_arm")
-    def set_track_arm(ctx: Context, track_index: int, arm: bool) -> Dict[str, Any]:
+def _setup_track_tools(mcp: FastMCP, controller) -> None:
+    """Setup track-related MCP tools."""
+    _register_operation_tools(mcp, controller, _TRACK_OPERATION_TOOLS)
+
+    @mcp.tool("create_track")
+    @_tool_errors("Failed to create track")
+    def create_track(ctx: Context, name: Optional[str] = None) -> Dict[str, Any]:
+        """Create a new track in Reaper."""
+        track_index = controller.track.create_track(name)
+        return _create_success_response(f"Created track {track_index}")
+
+    @mcp.tool("create_tracks_bulk")
+    @_tool_errors("Failed to create tracks")
+    def create_tracks_bulk(ctx: Context, names: List[Optional[str]]) -> Dict[str, Any]:
         """
-        Set the record arm state of a track.
+        Create several tracks in one call, appended in order.
 
         Args:
-            track_index (int): Index of the track
-            arm (bool): True to arm for recording, False to disarm
+            names (List[str]): Names for the new tracks (null for unnamed)
         """
-        return _handle_controller_operation(
-            f"Set track {track_index} record arm to {arm}",
-            controller.track.set_track_arm,
-            track_index,
-            arm,
-        )
+        track_indices = controller.track.create_tracks(names)
+        return {
+            "status": "success",
+            "message": f"Created {len(track_indices)} tracks",
+            "data": {"track_indices": track_indices},
+        }
+
+    @mcp.tool("get_track_color")
+    @_tool_errors("Failed to get track color")
+    def get_track_color(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
+        """Get the color of a track."""
+        color = controller.track.get_track_color(track_index)
+        return {
+            "status": "success",
+            "message": f"Color of track {track_index}: {color}",
+            "data": {"track_index": track_index, "color": color},
+        }
+
+    @mcp.tool("get_track_count")
+    @_tool_errors("Failed to get track count")
+    def get_track_count(ctx: Context) -> Dict[str, Any]:
+        """Get the number of tracks in the project."""
+        count = controller.track.get_track_count()
+        return _create_success_response(f"Track count: {count}")
+
+    @mcp.tool("get_track_volume")
+    @_tool_errors("Failed to get track volume")
+    def get_track_volume(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
+        """Get the volume of a track in dB."""
+        volume = controller.track.get_track_volume(track_index)
+        return _create_success_response(f"Track {track_index} volume: {volume:.2f} dB")
+
+    @mcp.tool("get_track_pan")
+    @_tool_errors("Failed to get track pan")
+    def get_track_pan(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
+        """Get the pan position of a track."""
+        pan = controller.track.get_track_pan(track_index)
+        return _create_success_response(f"Track {track_index} pan: {pan}")
+
+    @mcp.tool("get_track_mute")
+    @_tool_errors("Failed to get track mute")
+    def get_track_mute(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
+        """Get the mute state of a track."""
+        mute = controller.track.get_track_mute(track_index)
+        return _create_success_response(f"Track {track_index} mute: {mute}")
+
+    @mcp.tool("get_track_solo")
+    @_tool_errors("Failed to get track solo")
+    def get_track_solo(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
+        """Get the solo state of a track."""
+        solo = controller.track.get_track_solo(track_index)
+        return _create_success_response(f"Track {track_index} solo: {solo}")
 
     @mcp.tool("get_track_arm")
-    def get_track_arm(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to get track record arm")
+    def get_track_arm(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """Get the record arm state of a track."""
-        try:
-            arm = controller.track.get_track_arm(track_index)
-            return _create_success_response(f"Track {track_index} record arm: {arm}")
-        except Exception as e:
-            logger.error(f"Failed to get track record arm: {str(e)}")
-            return _create_error_response(f"Failed to get track record arm: {str(e)}")
+        arm = controller.track.get_track_arm(track_index)
+        return _create_success_response(f"Track {track_index} record arm: {arm}")
+
+
+_PROJECT_OPERATION_TOOLS = (
+    _OperationTool(
+        name="set_tempo",
+        method="project.set_tempo",
+        params=(("bpm", float),),
+        message="Set tempo to {bpm} BPM",
+        doc="Set the project tempo.",
+        # Retries sleep between attempts, which must not hold REAPER up
+        hold_connection=False,
+    ),
+    _OperationTool(
+        name="clear_project",
+        method="project.clear_project",
+        params=(),
+        message="Clear all items from project",
+        doc="Clear all items from all tracks in the project.",
+    ),
+)
 
 
 def _setup_project_tools(mcp: FastMCP, controller) -> None:
     """Setup project-related MCP tools."""
-
-    @mcp.tool("set_tempo")
-    def set_tempo(ctx: Context, bpm: float) -> Dict[str, Any]:
-        """Set the project tempo."""
-        return _handle_controller_operation(
-            f"Set tempo to {bpm} BPM", controller.project.set_tempo, bpm
-        )
+    _register_operation_tools(mcp, controller, _PROJECT_OPERATION_TOOLS)
 
     @mcp.tool("get_tempo")
+    @_tool_errors("Failed to get tempo")
     def get_tempo(ctx: Context) -> Dict[str, Any]:
         """Get the current project tempo."""
-        try:
-            tempo = controller.project.get_tempo()
-            return _create_success_response(f"Current tempo: {tempo} BPM")
-        except Exception as e:
-            logger.error(f"Failed to get tempo: {str(e)}")
-            return _create_error_response(f"Failed to get tempo: {str(e)}")
-
-    @mcp.tool("clear_project")
-    def clear_project(ctx: Context) -> Dict[str, Any]:
-        """Clear all items from all tracks in the project."""
-        return _handle_controller_operation(
-            "Clear all items from project", controller.project.clear_project
-        )
+        tempo = controller.project.get_tempo()
+        return {
+            "status": "success",
+            "message": f"Current tempo: {tempo} BPM",
+            "data": {"tempo": tempo},
+        }
 
 
 def _setup_fx_tools(mcp: FastMCP, controller) -> None:
@@ -306,172 +541,245 @@ def _setup_fx_tools(mcp: FastMCP, controller) -> None:
     _setup_meter_tools(mcp, controller)
 
 
+_FX_ADD_REMOVE_OPERATION_TOOLS = (
+    _OperationTool(
+        name="remove_fx",
+        method="fx.remove_fx",
+        params=(("track_index", TrackIndex), ("fx_index", FxIndex)),
+        message="Remove FX {fx_index} from track {track_index}",
+        doc="Remove an FX from a track.",
+    ),
+)
+
+
 def _setup_fx_add_remove_tools(mcp: FastMCP, controller) -> None:
     """Setup FX add and remove MCP tools."""
+    _register_operation_tools(mcp, controller, _FX_ADD_REMOVE_OPERATION_TOOLS)
 
     @mcp.tool("add_fx")
-    def add_fx(ctx: Context, track_index: int, fx_name: str) -> Dict[str, Any]:
+    @_tool_errors("Failed to add FX")
+    def add_fx(ctx: Context, track_index: TrackIndex, fx_name: str) -> Dict[str, Any]:
         """Add an FX to a track."""
-        try:
-            fx_index = controller.fx.add_fx(track_index, fx_name)
-            if fx_index >= 0:
-                return _create_success_response(
-                    f"Added FX {fx_name} to track {track_index} " f"at index {fx_index}"
-                )
-            return _create_error_response(f"Failed to add FX to track {track_index}")
-        except Exception as e:
-            logger.error(f"Failed to add FX: {str(e)}")
-            return _create_error_response(f"Failed to add FX: {str(e)}")
-
-    @mcp.tool("remove_fx")
-    def remove_fx(ctx: Context, track_index: int, fx_index: int) -> Dict[str, Any]:
-        """Remove an FX from a track."""
-        return _handle_controller_operation(
-            f"Remove FX {fx_index} from track {track_index}",
-            controller.fx.remove_fx,
-            track_index,
-            fx_index,
-        )
+        fx_index = controller.fx.add_fx(track_index, fx_name)
+        if fx_index >= 0:
+            return _create_success_response(
+                f"Added FX {fx_name} to track {track_index} " f"at index {fx_index}"
+            )
+        return _create_error_response(f"Failed to add FX to track {track_index}")
+
+
+_FX_PARAM_OPERATION_TOOLS = (
+    _OperationTool(
+        name="set_fx_param",
+        method="fx.set_fx_param",
+        params=(
+            ("track_index", TrackIndex),
+            ("fx_index", FxIndex),
+            ("param_name", str),
+            ("value", float),
+        ),
+        message="Set FX parameter {param_name} to {value}",
+        doc="""
+        Set an FX parameter value.
+
+        Args:
+            track_index (int): Index of the track containing the FX
+            fx_index (int): Index of the FX on the track
+            param_name (str): Name of the parameter to set
+            value (float): Parameter value (use number, not string)
+        """,
+    ),
+)
 
 
 def _setup_fx_param_tools(mcp: FastMCP, controller) -> None:
     """Setup FX parameter-related MCP tools."""
+    _register_operation_tools(mcp, controller, _FX_PARAM_OPERATION_TOOLS)
 
-    @mcp.tool("set_fx_param")
-    def set_fx_param(
-        ctx: Context, track_index: int, fx_index: int, param_name: str, value: float
+    @mcp.tool("set_fx_params")
+    @_tool_errors("Failed to set FX parameters")
+    def set_fx_params(
+        ctx: Context,
+        track_index: TrackIndex,
+        fx_index: FxIndex,
+        params: Dict[str, float],
     ) -> Dict[str, Any]:
         """
-        Set an FX parameter value.
+        Set several parameters on one FX in a single call.
 
         Args:
             track_index (int): Index of the track containing the FX
             fx_index (int): Index of the FX on the track
-            param_name (str): Name of the parameter to set
-            value (float): Parameter value (use number, not string)
+            params (Dict[str, float]): Parameter names mapped to their new values
         """
-        return _handle_controller_operation(
-            f"Set FX parameter {param_name} to {value}",
-            controller.fx.set_fx_param,
-            track_index,
-            fx_index,
-            param_name,
-            value,
+        results = controller.fx.set_fx_params(track_index, fx_index, params)
+        if results is None:
+            return _create_error_response(
+                f"Failed to set parameters on track {track_index} FX {fx_index}"
+            )
+        not_found = [name for name, was_set in results.items() if not was_set]
+        if not_found:
+            return {
+                "status": "error",
+                "message": (
+                    f"Set {len(results) - len(not_found)} of {len(params)} "
+                    f"parameters on FX {fx_index}"
+                ),
+                "data": {"not_found": not_found},
+            }
+        return _create_success_response(
+            f"Set {len(results)} parameters on track {track_index} FX {fx_index}"
         )
 
     @mcp.tool("get_fx_param")
+    @_tool_errors("Failed to get FX parameter")
     def get_fx_param(
-        ctx: Context, track_index: int, fx_index: int, param_name: str
+        ctx: Context, track_index: TrackIndex, fx_index: FxIndex, param_name: str
     ) -> Dict[str, Any]:
         """Get an FX parameter value."""
-        try:
-            value = controller.fx.get_fx_param(track_index, fx_index, param_name)
-            return _create_success_response(f"FX parameter {param_name}: {value}")
-        except Exception as e:
-            logger.error(f"Failed to get FX parameter: {str(e)}")
-            return _create_error_response(f"Failed to get FX parameter: {str(e)}")
+        value = controller.fx.get_fx_param(track_index, fx_index, param_name)
+        return {
+            "status": "success",
+            "message": f"FX parameter {param_name}: {value}",
+            "data": {"param_name": param_name, "value": value},
+        }
 
     @mcp.tool("get_fx_param_list")
+    @_tool_errors("Failed to get FX parameters")
     def get_fx_param_list(
-        ctx: Context, track_index: int, fx_index: int
+        ctx: Context, track_index: TrackIndex, fx_index: FxIndex
     ) -> Dict[str, Any]:
         """Get list of FX parameters.
 
         Note: Some FX like ReaEQ may have limited parameter enumeration.
         For better parameter testing, try ReaComp or ReaLimit instead.
         """
-        try:
+        with inside_reaper():
             params = controller.fx.get_fx_param_list(track_index, fx_index)
-            if not params:
-                # Provide helpful message if no parameters found
-                fx_list = controller.fx.get_fx_list(track_index)
-                fx_name = (
-                    fx_list[fx_index]["name"] if fx_index < len(fx_list) else "Unknown"
-                )
-                return _create_success_response(
-                    f"No parameters found for FX '{fx_name}'. Try ReaComp or ReaLimit for better parameter enumeration."
-                )
-            return _create_success_response(f"FX parameters: {params}")
-        except Exception as e:
-            logger.error(f"Failed to get FX parameters: {str(e)}")
-            return _create_error_response(f"Failed to get FX parameters: {str(e)}")
+        if not params:
+            # Provide helpful message if no parameters found
+            fx_list = controller.fx.get_fx_list(track_index)
+            fx_name = (
+                fx_list[fx_index]["name"] if fx_index < len(fx_list) else "Unknown"
+            )
+            return _create_success_response(
+                f"No parameters found for FX '{fx_name}'. Try ReaComp or ReaLimit for better parameter enumeration."
+            )
+        return {
+            "status": "success",
+            "message": f"Found {len(params)} parameters on FX {fx_index}",
+            "data": {"params": params},
+        }
 
 
 def _setup_fx_list_tools(mcp: FastMCP, controller) -> None:
     """Setup FX list-related MCP tools."""
 
     @mcp.tool("get_fx_list")
-    def get_fx_list(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to get FX list")
+    def get_fx_list(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """Get list of FX on a track."""
-        try:
+        with inside_reaper():
             fx_list = controller.fx.get_fx_list(track_index)
-            return _create_success_response(
-                f"FX list for track {track_index}: {fx_list}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get FX list: {str(e)}")
-            return _create_error_response(f"Failed to get FX list: {str(e)}")
+        return {
+            "status": "success",
+            "message": f"Found {len(fx_list)} FX on track {track_index}",
+            "data": {"fx": fx_list},
+        }
+
+    @mcp.tool("get_fx_list_bulk")
+    @_tool_errors("Failed to get FX lists")
+    def get_fx_list_bulk(ctx: Context, track_indices: List[int]) -> Dict[str, Any]:
+        """
+        Get the FX on several tracks in one call.
+
+        Args:
+            track_indices (List[int]): Indices of the tracks to list
+        """
+        tracks = {}
+        failed = []
+        with inside_reaper():
+            for track_index in track_indices:
+                try:
+                    tracks[track_index] = controller.fx.get_fx_list(track_index)
+                except Exception as e:
+                    logger.error("Failed to get FX list for track %s: %s", track_index, e)
+                    failed.append(track_index)
+        return {
+            "status": "success",
+            "message": f"Listed FX on {len(tracks)} of {len(track_indices)} tracks",
+            "data": {"tracks": tracks, "failed": failed},
+        }
 
     @mcp.tool("get_available_fx_list")
-    def get_available_fx_list(ctx: Context) -> Dict[str, Any]:
-        """Get list of available FX.
+    @_tool_errors("Failed to get available FX")
+    def get_available_fx_list(
+        ctx: Context,
+        query: Optional[str] = None,
+        offset: int = 0,
+        limit: int = DEFAULT_FX_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """Get list of available FX, one page at a time.
+
+        Args:
+            query (str, optional): Only return FX whose name contains this text
+                (case-insensitive)
+            offset (int): Index of the first FX to return
+            limit (int): Maximum number of FX to return (use next_offset for more)
 
         Note: For testing FX parameters, ReaComp and ReaLimit typically work better
         than ReaEQ for parameter enumeration.
         """
-        try:
-            fx_list = controller.fx.get_available_fx_list()
-            return _create_success_response(f"Available FX: {fx_list}")
-        except Exception as e:
-            logger.error(f"Failed to get available FX: {str(e)}")
-            return _create_error_response(f"Failed to get available FX: {str(e)}")
+        fx_list = controller.fx.get_available_fx_list()
+        if query:
+            needle = query.lower()
+            fx_list = [name for name in fx_list if needle in name.lower()]
+
+        page, paging = _page(fx_list, offset, limit)
+        return {
+            "status": "success",
+            "message": f"Showing {len(page)} of {len(fx_list)} available FX",
+            "data": {"fx": page, **paging},
+        }
 
 
 def _setup_fx_toggle_tool(mcp: FastMCP, controller) -> None:
     """Setup FX toggle MCP tool."""
 
     @mcp.tool("toggle_fx")
+    @_tool_errors("Failed to toggle FX")
     def toggle_fx(
-        ctx: Context, track_index: int, fx_index: int, enable: Optional[bool] = None
+        ctx: Context,
+        track_index: TrackIndex,
+        fx_index: FxIndex,
+        enable: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """Toggle FX on/off."""
-        try:
-            result = controller.fx.toggle_fx(track_index, fx_index, enable)
-            action = (
-                "enabled"
-                if enable is True
-                else "disabled" if enable is False else "toggled"
-            )
-            if result:
-                return _create_success_response(
-                    f"FX {fx_index} on track {track_index} {action} successfully"
-                )
-            else:
-                return _create_error_response(
-                    f"Failed to toggle FX {fx_index} on track {track_index}"
-                )
-        except Exception as e:
-            logger.error(f"Toggle FX operation failed: {str(e)}")
-            return _create_error_response(
-                f"Failed to toggle FX {fx_index} on track {track_index}: {str(e)}"
+        if controller.fx.toggle_fx(track_index, fx_index, enable):
+            action = _FX_STATE_NAMES[enable]
+            return _create_success_response(
+                f"FX {fx_index} on track {track_index} {action} successfully"
             )
+        return _create_error_response(
+            f"Failed to toggle FX {fx_index} on track {track_index}"
+        )
 
 
-def _setup_dynamics_tools(mcp: FastMCP, controller) -> None:
-    """Setup dynamics processing MCP tools."""
-
-    @mcp.tool("set_compressor_params")
-    def set_compressor_params(
-        ctx: Context,
-        track_index: int,
-        fx_index: int,
-        threshold: Optional[float] = None,
-        ratio: Optional[float] = None,
-        attack: Optional[float] = None,
-        release: Optional[float] = None,
-        makeup_gain: Optional[float] = None,
-    ) -> Dict[str, Any]:
-        """
+_DYNAMICS_OPERATION_TOOLS = (
+    _OperationTool(
+        name="set_compressor_params",
+        method="fx.set_compressor_params",
+        params=(
+            ("track_index", TrackIndex),
+            ("fx_index", FxIndex),
+            ("threshold", Optional[float], None),
+            ("ratio", Optional[float], None),
+            ("attack", Optional[float], None),
+            ("release", Optional[float], None),
+            ("makeup_gain", Optional[float], None),
+        ),
+        message="Set compressor parameters on track {track_index} FX {fx_index}",
+        doc="""
         Set common compressor parameters.
 
         Args:
@@ -482,29 +790,20 @@ def _setup_dynamics_tools(mcp: FastMCP, controller) -> None:
             attack (float, optional): Attack time in ms (typical range: 0.1 to 100)
             release (float, optional): Release time in ms (typical range: 10 to 1000)
             makeup_gain (float, optional): Makeup gain in dB (typical range: 0 to 20)
-        """
-        return _handle_controller_operation(
-            f"Set compressor parameters on track {track_index} FX {fx_index}",
-            controller.fx.set_compressor_params,
-            track_index,
-            fx_index,
-            threshold,
-            ratio,
-            attack,
-            release,
-            makeup_gain,
-        )
-
-    @mcp.tool("set_limiter_params")
-    def set_limiter_params(
-        ctx: Context,
-        track_index: int,
-        fx_index: int,
-        threshold: Optional[float] = None,
-        ceiling: Optional[float] = None,
-        release: Optional[float] = None,
-    ) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="set_limiter_params",
+        method="fx.set_limiter_params",
+        params=(
+            ("track_index", TrackIndex),
+            ("fx_index", FxIndex),
+            ("threshold", Optional[float], None),
+            ("ceiling", Optional[float], None),
+            ("release", Optional[float], None),
+        ),
+        message="Set limiter parameters on track {track_index} FX {fx_index}",
+        doc="""
         Set common limiter parameters.
 
         Args:
@@ -513,149 +812,139 @@ def _setup_dynamics_tools(mcp: FastMCP, controller) -> None:
             threshold (float, optional): Threshold in dB (typical range: -20 to 0)
             ceiling (float, optional): Output ceiling in dB (typical range: -10 to 0)
             release (float, optional): Release time in ms (typical range: 1 to 100)
-        """
-        return _handle_controller_operation(
-            f"Set limiter parameters on track {track_index} FX {fx_index}",
-            controller.fx.set_limiter_params,
-            track_index,
-            fx_index,
-            threshold,
-            ceiling,
-            release,
-        )
+        """,
+    ),
+)
+
+
+def _setup_dynamics_tools(mcp: FastMCP, controller) -> None:
+    """Setup dynamics processing MCP tools."""
+    _register_operation_tools(mcp, controller, _DYNAMICS_OPERATION_TOOLS)
 
 
 def _setup_meter_tools(mcp: FastMCP, controller) -> None:
     """Setup meter reading MCP tools."""
 
     @mcp.tool("get_track_peak_level")
-    def get_track_peak_level(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to get track peak level")
+    def get_track_peak_level(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """
         Get the current peak levels for a track.
 
         Args:
             track_index (int): Index of the track to get peak levels from
         """
-        try:
-            peak_levels = controller.fx.get_track_peak_level(track_index)
-            return _create_success_response(
-                f"Track {track_index} peak levels: {peak_levels}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get track peak level: {str(e)}")
-            return _create_error_response(f"Failed to get track peak level: {str(e)}")
+        peak_levels = controller.fx.get_track_peak_level(track_index)
+        return _create_success_response(
+            f"Track {track_index} peak levels: {peak_levels}"
+        )
 
     @mcp.tool("get_master_peak_level")
+    @_tool_errors("Failed to get master peak level")
     def get_master_peak_level(ctx: Context) -> Dict[str, Any]:
         """Get the current peak levels for the master track."""
-        try:
-            peak_levels = controller.fx.get_master_peak_level()
-            return _create_success_response(f"Master peak levels: {peak_levels}")
-        except Exception as e:
-            logger.error(f"Failed to get master peak level: {str(e)}")
-            return _create_error_response(f"Failed to get master peak level: {str(e)}")
+        peak_levels = controller.fx.get_master_peak_level()
+        return _create_success_response(f"Master peak levels: {peak_levels}")
 
 
-def _setup_marker_tools(mcp: FastMCP, controller) -> None:
-    """Setup marker and region-related MCP tools."""
-
-    @mcp.tool("create_region")
-    def create_region(
-        ctx: Context, start_time: float, end_time: float, name: str
-    ) -> Dict[str, Any]:
-        """
+_MARKER_OPERATION_TOOLS = (
+    _OperationTool(
+        name="create_region",
+        method="marker.create_region",
+        params=(("start_time", float), ("end_time", float), ("name", str)),
+        message="Create region '{name}' from {start_time} to {end_time}",
+        doc="""
         Create a region in the project.
 
         Args:
             start_time (float): Start time in seconds (use number, not string)
             end_time (float): End time in seconds (use number, not string)
             name (str): Name of the region
-        """
-        operation_name = f"Create region '{name}' from {start_time} to {end_time}"
-        return _handle_controller_operation(
-            operation_name, controller.marker.create_region, start_time, end_time, name
-        )
-
-    @mcp.tool("delete_region")
-    def delete_region(ctx: Context, region_index: int) -> Dict[str, Any]:
-        """Delete a region from the project."""
-        return _handle_controller_operation(
-            f"Delete region {region_index}",
-            controller.marker.delete_region,
-            region_index,
-        )
-
-    @mcp.tool("create_marker")
-    def create_marker(ctx: Context, time: float, name: str) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="delete_region",
+        method="marker.delete_region",
+        params=(("region_index", int),),
+        message="Delete region {region_index}",
+        doc="Delete a region from the project.",
+    ),
+    _OperationTool(
+        name="create_marker",
+        method="marker.create_marker",
+        params=(("time", float), ("name", str)),
+        message="Create marker '{name}' at {time}",
+        doc="""
         Create a marker at the specified time.
 
         Args:
             time (float): Time in seconds (use number, not string)
             name (str): Name of the marker
-        """
-        return _handle_controller_operation(
-            f"Create marker '{name}' at {time}",
-            controller.marker.create_marker,
-            time,
-            name,
-        )
-
-    @mcp.tool("delete_marker")
-    def delete_marker(ctx: Context, marker_index: int) -> Dict[str, Any]:
-        """Delete a marker from the project."""
-        return _handle_controller_operation(
-            f"Delete marker {marker_index}",
-            controller.marker.delete_marker,
-            marker_index,
-        )
+        """,
+    ),
+    _OperationTool(
+        name="delete_marker",
+        method="marker.delete_marker",
+        params=(("marker_index", int),),
+        message="Delete marker {marker_index}",
+        doc="Delete a marker from the project.",
+    ),
+)
 
 
-def _setup_master_tools(mcp: FastMCP, controller) -> None:
-    """Setup master track-related MCP tools."""
+def _setup_marker_tools(mcp: FastMCP, controller) -> None:
+    """Setup marker and region-related MCP tools."""
+    _register_operation_tools(mcp, controller, _MARKER_OPERATION_TOOLS)
 
-    @mcp.tool("get_master_track")
-    def get_master_track(ctx: Context) -> Dict[str, Any]:
-        """Get master track information."""
-        try:
-            master_info = controller.master.get_master_track()
-            return _create_success_response(f"Master track info: {master_info}")
-        except Exception as e:
-            logger.error(f"Failed to get master track: {str(e)}")
-            return _create_error_response(f"Failed to get master track: {str(e)}")
 
-    @mcp.tool("set_master_volume")
-    def set_master_volume(ctx: Context, volume: float) -> Dict[str, Any]:
-        """
+_MASTER_OPERATION_TOOLS = (
+    _OperationTool(
+        name="set_master_volume",
+        method="master.set_master_volume",
+        params=(("volume", float),),
+        message="Set master volume to {volume}",
+        doc="""
         Set master track volume.
 
         Args:
             volume (float): Volume in dB (use number, not string, e.g., -6.0, 0.0, 3.0)
-        """
-        return _handle_controller_operation(
-            f"Set master volume to {volume}",
-            controller.master.set_master_volume,
-            volume,
-        )
-
-    @mcp.tool("set_master_pan")
-    def set_master_pan(ctx: Context, pan: float) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="set_master_pan",
+        method="master.set_master_pan",
+        params=(("pan", Pan),),
+        message="Set master pan to {pan}",
+        doc="""
         Set master track pan.
 
         Args:
             pan (float): Pan position (-1.0 to 1.0, use number, not string)
-        """
-        return _handle_controller_operation(
-            f"Set master pan to {pan}", controller.master.set_master_pan, pan
-        )
+        """,
+    ),
+)
+
+
+def _setup_master_tools(mcp: FastMCP, controller) -> None:
+    """Setup master track-related MCP tools."""
+    _register_operation_tools(mcp, controller, _MASTER_OPERATION_TOOLS)
+
+    @mcp.tool("get_master_track")
+    @_tool_errors("Failed to get master track")
+    def get_master_track(ctx: Context) -> Dict[str, Any]:
+        """Get master track information."""
+        master_info = controller.master.get_master_track()
+        return {
+            "status": "success",
+            "message": "Got master track info",
+            "data": master_info,
+        }
 
     @mcp.tool("toggle_master_mute")
     def toggle_master_mute(ctx: Context, mute: Optional[bool] = None) -> Dict[str, Any]:
         """Toggle master track mute."""
-        action = "mute" if mute else "toggle mute"
         return _handle_controller_operation(
-            f"{action.capitalize()} master track",
+            f"{_MASTER_MUTE_ACTIONS[mute]} master track",
             controller.master.toggle_master_mute,
             mute,
         )
@@ -663,21 +952,36 @@ def _setup_master_tools(mcp: FastMCP, controller) -> None:
     @mcp.tool("toggle_master_solo")
     def toggle_master_solo(ctx: Context, solo: Optional[bool] = None) -> Dict[str, Any]:
         """Toggle master track solo."""
-        action = "solo" if solo else "toggle solo"
         return _handle_controller_operation(
-            f"{action.capitalize()} master track",
+            f"{_MASTER_SOLO_ACTIONS[solo]} master track",
             controller.master.toggle_master_solo,
             solo,
         )
 
 
+_MIDI_OPERATION_TOOLS = (
+    _OperationTool(
+        name="clear_midi_item",
+        method="midi.clear_midi_item",
+        params=(("track_index", TrackIndex), ("item_id", int)),
+        message="Clear MIDI item {item_id} on track {track_index}",
+        doc="Clear all MIDI notes from a MIDI item.",
+    ),
+)
+
+
 def _setup_midi_tools(mcp: FastMCP, controller) -> None:
     """Setup MIDI-related MCP tools."""
+    from src.controllers.midi.midi_controller import MIDIController
+
+    MIDINoteParams = MIDIController.MIDINoteParams
+    _register_operation_tools(mcp, controller, _MIDI_OPERATION_TOOLS)
 
     @mcp.tool("create_midi_item")
+    @_tool_errors("Failed to create MIDI item")
     def create_midi_item(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         start_time: Optional[float] = None,
         start_measure: Optional[str] = None,
         length: float = DEFAULT_MIDI_LENGTH,
@@ -691,38 +995,29 @@ def _setup_midi_tools(mcp: FastMCP, controller) -> None:
             start_measure (str, optional): Start measure (e.g., "1.1.0")
             length (float): Length of the MIDI item in seconds (use number, not string)
         """
-        try:
-            # Handle time conversion if measure is provided
-            if start_measure:
-                start_time = parse_position(start_measure)
-
-            # Use 0.0 as default start time if none provided
-            if start_time is None:
-                start_time = 0.0
-
-            item_id = controller.midi.create_midi_item(track_index, start_time, length)
-            if item_id is not None and item_id >= 0:
-                return _create_success_response(
-                    f"Created MIDI item {item_id} on track {track_index}"
-                )
-            else:
-                return _create_error_response(
-                    f"Failed to create MIDI item on track {track_index}"
-                )
-        except Exception as e:
-            error_message = f"Failed to create MIDI item: {str(e)}"
-            logger.error(error_message)
-            return _create_error_response(error_message)
+        # Use 0.0 as default start time if none provided
+        start_time = _resolve_position(start_time, start_measure) or 0.0
+
+        item_id = controller.midi.create_midi_item(track_index, start_time, length)
+        if item_id is not None and item_id >= 0:
+            return _create_success_response(
+                f"Created MIDI item {item_id} on track {track_index}"
+            )
+        else:
+            return _create_error_response(
+                f"Failed to create MIDI item on track {track_index}"
+            )
 
     @mcp.tool("add_midi_note")
+    @_tool_errors("Failed to add MIDI note")
     def add_midi_note(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         item_id: int,
-        pitch: int,
+        pitch: MidiPitch,
         start_time: float,
         length: float,
-        velocity: int = DEFAULT_MIDI_VELOCITY,
+        velocity: MidiVelocity = DEFAULT_MIDI_VELOCITY,
     ) -> Dict[str, Any]:
         """
         Add a MIDI note to a MIDI item.
@@ -735,67 +1030,115 @@ def _setup_midi_tools(mcp: FastMCP, controller) -> None:
             length (float): Note length in seconds (use number, not string)
             velocity (int): Note velocity (0-127)
         """
-        try:
-            from src.controllers.midi.midi_controller import MIDIController
+        note_params = MIDINoteParams(
+            pitch=pitch, start_time=start_time, length=length, velocity=velocity
+        )
+        success = controller.midi.add_midi_note(track_index, item_id, note_params)
+        if success:
+            return _create_success_response(
+                f"Added MIDI note pitch {pitch} to item {item_id}"
+            )
+        return _create_error_response(
+            f"Failed to add MIDI note pitch {pitch} to item {item_id}"
+        )
+
+    @mcp.tool("add_midi_notes_batch")
+    @_tool_errors("Failed to add MIDI notes")
+    def add_midi_notes_batch(
+        ctx: Context, track_index: TrackIndex, item_id: int, notes: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Add several MIDI notes to a MIDI item in one call.
 
-            note_params = MIDIController.MIDINoteParams(
-                pitch=pitch, start_time=start_time, length=length, velocity=velocity
+        Args:
+            track_index (int): Index of the track containing the MIDI item
+            item_id (int): ID of the MIDI item
+            notes (List[Dict]): Notes to add, each with "pitch", "start_time"
+                and "length" (seconds) and optional "velocity" and "channel"
+        """
+        note_params = [
+            MIDINoteParams(
+                pitch=note["pitch"],
+                start_time=note["start_time"],
+                length=note["length"],
+                velocity=note.get("velocity", DEFAULT_MIDI_VELOCITY),
+                channel=note.get("channel", 0),
             )
-            success = controller.midi.add_midi_note(track_index, item_id, note_params)
-            if success:
-                return _create_success_response(
-                    f"Added MIDI note pitch {pitch} to item {item_id}"
-                )
-            return _create_error_response(
-                f"Failed to add MIDI note pitch {pitch} to item {item_id}"
+            for note in notes
+        ]
+        added = controller.midi.add_midi_notes_batch(track_index, item_id, note_params)
+        if added == len(note_params):
+            return _create_success_response(
+                f"Added {added} MIDI notes to item {item_id}"
             )
-        except Exception as e:
-            logger.error(f"Failed to add MIDI note: {str(e)}")
-            return _create_error_response(f"Failed to add MIDI note: {str(e)}")
-
-    @mcp.tool("clear_midi_item")
-    def clear_midi_item(ctx: Context, track_index: int, item_id: int) -> Dict[str, Any]:
-        """Clear all MIDI notes from a MIDI item."""
-        return _handle_controller_operation(
-            f"Clear MIDI item {item_id} on track {track_index}",
-            controller.midi.clear_midi_item,
-            track_index,
-            item_id,
+        return _create_error_response(
+            f"Failed to add {len(note_params)} MIDI notes to item {item_id}"
         )
 
     @mcp.tool("get_midi_notes")
-    def get_midi_notes(ctx: Context, track_index: int, item_id: int) -> Dict[str, Any]:
-        """Get all MIDI notes from a MIDI item."""
-        try:
-            notes = controller.midi.get_midi_notes(track_index, item_id)
-            return _create_success_response(f"MIDI notes in item {item_id}: {notes}")
-        except Exception as e:
-            logger.error(f"Failed to get MIDI notes: {str(e)}")
-            return _create_error_response(f"Failed to get MIDI notes: {str(e)}")
+    @_tool_errors("Failed to get MIDI notes")
+    def get_midi_notes(
+        ctx: Context,
+        track_index: TrackIndex,
+        item_id: int,
+        offset: int = 0,
+        limit: int = DEFAULT_MIDI_NOTE_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Get the MIDI notes of a MIDI item, one page at a time.
+
+        Args:
+            track_index (int): Index of the track containing the item
+            item_id (int): ID of the MIDI item
+            offset (int): Index of the first note to return
+            limit (int): Maximum number of notes to return (use next_offset for more)
+        """
+        notes = controller.midi.get_midi_notes(track_index, item_id)
+        page, paging = _page(notes, offset, limit)
+        return {
+            "status": "success",
+            "message": f"Showing {len(page)} of {len(notes)} MIDI notes "
+            f"in item {item_id}",
+            "data": {"notes": page, **paging},
+        }
 
     @mcp.tool("find_midi_notes_by_pitch")
+    @_tool_errors("Failed to find MIDI notes")
     def find_midi_notes_by_pitch(
-        ctx: Context, pitch_min: int = MIN_MIDI_PITCH, pitch_max: int = MAX_MIDI_PITCH
+        ctx: Context,
+        pitch_min: int = MIN_MIDI_PITCH,
+        pitch_max: int = MAX_MIDI_PITCH,
+        offset: int = 0,
+        limit: int = DEFAULT_MIDI_NOTE_PAGE_SIZE,
     ) -> Dict[str, Any]:
-        """Find MIDI notes within a pitch range."""
-        try:
-            notes = controller.midi.find_midi_notes_by_pitch(pitch_min, pitch_max)
-            return _create_success_response(
-                f"MIDI notes in pitch range {pitch_min}-{pitch_max}: {notes}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to find MIDI notes: {str(e)}")
-            return _create_error_response(f"Failed to find MIDI notes: {str(e)}")
+        """
+        Find MIDI notes within a pitch range, one page at a time.
+
+        Args:
+            pitch_min (int): Lowest pitch to match (inclusive)
+            pitch_max (int): Highest pitch to match (inclusive)
+            offset (int): Index of the first note to return
+            limit (int): Maximum number of notes to return (use next_offset for more)
+        """
+        notes = controller.midi.find_midi_notes_by_pitch(pitch_min, pitch_max)
+        page, paging = _page(notes, offset, limit)
+        return {
+            "status": "success",
+            "message": f"Showing {len(page)} of {len(notes)} MIDI notes "
+            f"in pitch range {pitch_min}-{pitch_max}",
+            "data": {"notes": page, **paging},
+        }
 
     @mcp.tool("get_selected_midi_item")
+    @_tool_errors("Failed to get selected MIDI item")
     def get_selected_midi_item(ctx: Context) -> Dict[str, Any]:
         """Get the currently selected MIDI item."""
-        try:
-            item_info = controller.midi.get_selected_midi_item()
-            return _create_success_response(f"Selected MIDI item: {item_info}")
-        except Exception as e:
-            logger.error(f"Failed to get selected MIDI item: {str(e)}")
-            return _create_error_response(f"Failed to get selected MIDI item: {str(e)}")
+        item_info = controller.midi.get_selected_midi_item()
+        return {
+            "status": "success",
+            "message": "Got selected MIDI item",
+            "data": item_info,
+        }
 
 
 def _setup_audio_tools(mcp: FastMCP, controller) -> None:
@@ -805,13 +1148,32 @@ def _setup_audio_tools(mcp: FastMCP, controller) -> None:
     _setup_item_selection_tools(mcp, controller)
 
 
+_AUDIO_ITEM_OPERATION_TOOLS = (
+    _OperationTool(
+        name="delete_item",
+        method="audio.delete_item",
+        params=(("track_index", TrackIndex), ("item_id", int)),
+        message="Delete item {item_id} from track {track_index}",
+        doc="""
+        Delete an item from a track.
+
+        Args:
+            track_index (int): Index of the track containing the item
+            item_id (int): ID of the item to delete
+        """,
+    ),
+)
+
+
 def _setup_audio_item_tools(mcp: FastMCP, controller) -> None:
     """Setup audio item creation and manipulation tools."""
+    _register_operation_tools(mcp, controller, _AUDIO_ITEM_OPERATION_TOOLS)
 
     @mcp.tool("insert_audio_item")
+    @_tool_errors("Failed to insert audio item")
     def insert_audio_item(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         file_path: str,
         start_time: Optional[float] = None,
         start_measure: Optional[str] = None,
@@ -825,30 +1187,24 @@ def _setup_audio_item_tools(mcp: FastMCP, controller) -> None:
             start_time (float, optional): Start time in seconds (use number, not string)
             start_measure (str, optional): Start measure (e.g., "1.1.0")
         """
-        try:
-            # Handle time conversion if measure is provided
-            if start_measure:
-                start_time = parse_position(start_measure)
+        start_time = _resolve_position(start_time, start_measure)
 
-            item_id = controller.audio.insert_audio_item(
-                track_index, file_path, start_time, start_measure
-            )
-            if item_id is None:
-                return _create_error_response(
-                    f"Failed to insert audio item on track {track_index}"
-                )
-            return _create_success_response(
-                f"Inserted audio item {item_id} on track {track_index}"
+        item_id = controller.audio.insert_audio_item(
+            track_index, file_path, start_time, start_measure
+        )
+        if item_id is None:
+            return _create_error_response(
+                f"Failed to insert audio item on track {track_index}"
             )
-        except Exception as e:
-            error_message = f"Failed to insert audio item: {str(e)}"
-            logger.error(error_message)
-            return _create_error_response(error_message)
+        return _create_success_response(
+            f"Inserted audio item {item_id} on track {track_index}"
+        )
 
     @mcp.tool("create_blank_item")
+    @_tool_errors("Failed to create blank item")
     def create_blank_item(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         start_time: float,
         length: float = 1.0,
     ) -> Dict[str, Any]:
@@ -860,25 +1216,22 @@ def _setup_audio_item_tools(mcp: FastMCP, controller) -> None:
             start_time (float): Start time in seconds
             length (float): Item length in seconds (min 0.1s)
         """
-        try:
-            new_index = controller.audio.create_blank_item_on_track(
-                track_index, start_time, length
-            )
-            if isinstance(new_index, int) and new_index >= 0:
-                return _create_success_response(
-                    f"Created blank item at index {new_index} on track {track_index}"
-                )
-            return _create_error_response(
-                f"Failed to create blank item on track {track_index}"
+        new_index = controller.audio.create_blank_item_on_track(
+            track_index, start_time, length
+        )
+        if isinstance(new_index, int) and new_index >= 0:
+            return _create_success_response(
+                f"Created blank item at index {new_index} on track {track_index}"
             )
-        except Exception as e:
-            logger.error(f"Failed to create blank item: {str(e)}")
-            return _create_error_response(f"Failed to create blank item: {str(e)}")
+        return _create_error_response(
+            f"Failed to create blank item on track {track_index}"
+        )
 
     @mcp.tool("duplicate_item")
+    @_tool_errors("Failed to duplicate item")
     def duplicate_item(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         item_id: int,
         new_time: Optional[float] = None,
         new_measure: Optional[str] = None,
@@ -892,50 +1245,45 @@ def _setup_audio_item_tools(mcp: FastMCP, controller) -> None:
             new_time (float, optional): New position in seconds (use number, not string)
             new_measure (str, optional): New position as measure (e.g., "2.1.0")
         """
-        try:
-            # Handle time conversion if measure is provided
-            if new_measure:
-                new_time = parse_position(new_measure)
+        new_time = _resolve_position(new_time, new_measure)
 
-            new_item_id = controller.audio.duplicate_item(
-                track_index, item_id, new_time
+        new_item_id = controller.audio.duplicate_item(track_index, item_id, new_time)
+        if new_item_id is not None and new_item_id != -1:
+            return _create_success_response(
+                f"Duplicated item {item_id} to {new_item_id}"
+            )
+        else:
+            return _create_error_response(
+                f"Failed to duplicate item {item_id} on track {track_index}"
             )
-            if new_item_id is not None and new_item_id != -1:
-                return _create_success_response(
-                    f"Duplicated item {item_id} to {new_item_id}"
-                )
-            else:
-                return _create_error_response(
-                    f"Failed to duplicate item {item_id} on track {track_index}"
-                )
-        except Exception as e:
-            error_message = f"Failed to duplicate item: {str(e)}"
-            logger.error(error_message)
-            return _create_error_response(error_message)
 
-    @mcp.tool("delete_item")
-    def delete_item(ctx: Context, track_index: int, item_id: int) -> Dict[str, Any]:
-        """
-        Delete an item from a track.
+
+_ITEM_PROPERTY_OPERATION_TOOLS = (
+    _OperationTool(
+        name="set_item_length",
+        method="audio.set_item_length",
+        params=(("track_index", TrackIndex), ("item_id", int), ("length", float)),
+        message="Set length of item {item_id} to {length}",
+        doc="""
+        Set the length of an item.
 
         Args:
             track_index (int): Index of the track containing the item
-            item_id (int): ID of the item to delete
-        """
-        return _handle_controller_operation(
-            f"Delete item {item_id} from track {track_index}",
-            controller.audio.delete_item,
-            track_index,
-            item_id,
-        )
+            item_id (int): ID of the item to resize
+            length (float): New length in seconds (use number, not string)
+        """,
+    ),
+)
 
 
 def _setup_item_property_tools(mcp: FastMCP, controller) -> None:
     """Setup item property manipulation tools."""
+    _register_operation_tools(mcp, controller, _ITEM_PROPERTY_OPERATION_TOOLS)
 
     @mcp.tool("get_item_properties")
+    @_tool_errors("Failed to get item properties")
     def get_item_properties(
-        ctx: Context, track_index: int, item_id: int
+        ctx: Context, track_index: TrackIndex, item_id: int
     ) -> Dict[str, Any]:
         """
         Get properties of an item.
@@ -944,17 +1292,18 @@ def _setup_item_property_tools(mcp: FastMCP, controller) -> None:
             track_index (int): Index of the track containing the item
             item_id (int): ID of the item to get properties from
         """
-        try:
-            properties = controller.audio.get_item_properties(track_index, item_id)
-            return _create_success_response(f"Item {item_id} properties: {properties}")
-        except Exception as e:
-            logger.error(f"Failed to get item properties: {str(e)}")
-            return _create_error_response(f"Failed to get item properties: {str(e)}")
+        properties = controller.audio.get_item_properties(track_index, item_id)
+        return {
+            "status": "success",
+            "message": f"Got properties of item {item_id}",
+            "data": properties,
+        }
 
     @mcp.tool("set_item_position")
+    @_tool_errors("Failed to set item position")
     def set_item_position(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         item_id: int,
         position_time: Optional[float] = None,
         position_measure: Optional[str] = None,
@@ -968,49 +1317,24 @@ def _setup_item_property_tools(mcp: FastMCP, controller) -> None:
             position_time (float, optional): New position in seconds (use number, not string)
             position_measure (str, optional): New position as measure (e.g., "2.1.0")
         """
-        try:
-            # Handle time conversion if measure is provided
-            if position_measure:
-                position_time = parse_position(position_measure)
-
-            success = controller.audio.set_item_position(
-                track_index, item_id, position_time
-            )
-            if success:
-                return _create_success_response(f"Set position of item {item_id}")
-            return _create_error_response(f"Failed to set item position")
-        except Exception as e:
-            logger.error(f"Failed to set item position: {str(e)}")
-            return _create_error_response(f"Failed to set item position: {str(e)}")
-
-    @mcp.tool("set_item_length")
-    def set_item_length(
-        ctx: Context, track_index: int, item_id: int, length: float
-    ) -> Dict[str, Any]:
-        """
-        Set the length of an item.
+        position_time = _resolve_position(position_time, position_measure)
 
-        Args:
-            track_index (int): Index of the track containing the item
-            item_id (int): ID of the item to resize
-            length (float): New length in seconds (use number, not string)
-        """
-        return _handle_controller_operation(
-            f"Set length of item {item_id} to {length}",
-            controller.audio.set_item_length,
-            track_index,
-            item_id,
-            length,
+        success = controller.audio.set_item_position(
+            track_index, item_id, position_time
         )
+        if success:
+            return _create_success_response(f"Set position of item {item_id}")
+        return _create_error_response("Failed to set item position")
 
 
 def _setup_item_selection_tools(mcp: FastMCP, controller) -> None:
     """Setup item selection and query tools."""
 
     @mcp.tool("get_items_in_time_range")
+    @_tool_errors("Failed to get items in time range")
     def get_items_in_time_range(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         start_time: Optional[float] = None,
         end_time: Optional[float] = None,
         start_measure: Optional[str] = None,
@@ -1026,39 +1350,140 @@ def _setup_item_selection_tools(mcp: FastMCP, controller) -> None:
             start_measure (str, optional): Start measure (e.g., "1.1.0")
             end_measure (str, optional): End measure (e.g., "4.1.0")
         """
-        try:
-            # Handle time conversion if measures are provided
-            if start_measure:
-                start_time = parse_position(start_measure)
-            if end_measure:
-                end_time = parse_position(end_measure)
-
-            items = controller.audio.get_items_in_time_range(
-                track_index, start_time, end_time
-            )
-            return _create_success_response(f"Items in time range: {items}")
-        except Exception as e:
-            logger.error(f"Failed to get items in time range: {str(e)}")
-            return _create_error_response(
-                f"Failed to get items in time range: {str(e)}"
-            )
+        start_time = _resolve_position(start_time, start_measure)
+        end_time = _resolve_position(end_time, end_measure)
+
+        items = controller.audio.get_items_in_time_range(
+            track_index, start_time, end_time
+        )
+        return {
+            "status": "success",
+            "message": f"Found {len(items)} items in time range",
+            "data": {"items": items},
+        }
+
+    @mcp.tool("get_items_in_time_range_bulk")
+    @_tool_errors("Failed to get items in time range")
+    def get_items_in_time_range_bulk(
+        ctx: Context,
+        track_indices: List[int],
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get items within a time range on several tracks in one call.
+
+        Args:
+            track_indices (List[int]): Indices of the tracks to search
+            start_time (float, optional): Start time in seconds
+            end_time (float, optional): End time in seconds
+        """
+        tracks = {}
+        failed = []
+        with inside_reaper():
+            for track_index in track_indices:
+                try:
+                    tracks[track_index] = controller.audio.get_items_in_time_range(
+                        track_index, start_time, end_time
+                    )
+                except Exception as e:
+                    logger.error("Failed to get items on track %s: %s", track_index, e)
+                    failed.append(track_index)
+        return {
+            "status": "success",
+            "message": f"Searched {len(tracks)} of {len(track_indices)} tracks",
+            "data": {"tracks": tracks, "failed": failed},
+        }
 
     @mcp.tool("get_selected_items")
+    @_tool_errors("Failed to get selected items")
     def get_selected_items(ctx: Context) -> Dict[str, Any]:
         """Get all selected items."""
-        try:
-            items = controller.audio.get_selected_items()
-            return _create_success_response(f"Selected items: {items}")
-        except Exception as e:
-            logger.error(f"Failed to get selected items: {str(e)}")
-            return _create_error_response(f"Failed to get selected items: {str(e)}")
+        items = controller.audio.get_selected_items()
+        return {
+            "status": "success",
+            "message": f"Found {len(items)} selected items",
+            "data": {"items": items},
+        }
+
+
+_ROUTING_OPERATION_TOOLS = (
+    _OperationTool(
+        name="remove_send",
+        method="routing.remove_send",
+        params=(("source_track", int), ("send_id", int)),
+        message="Remove send {send_id} from track {source_track}",
+        doc="""
+        Remove a send from a track.
+
+        Args:
+            source_track (int): Index of the source track
+            send_id (int): ID of the send to remove
+        """,
+    ),
+    _OperationTool(
+        name="set_send_volume",
+        method="routing.set_send_volume",
+        params=(("source_track", int), ("send_id", int), ("volume", float)),
+        message="Set send {send_id} volume to {volume} dB",
+        doc="""
+        Set the volume of a send.
+
+        Args:
+            source_track (int): Index of the source track
+            send_id (int): ID of the send to set volume for
+            volume (float): Send volume in dB (use number, not string, e.g., -6.0, 0.0)
+        """,
+    ),
+    _OperationTool(
+        name="set_send_pan",
+        method="routing.set_send_pan",
+        params=(("source_track", int), ("send_id", int), ("pan", Pan)),
+        message="Set send {send_id} pan to {pan}",
+        doc="""
+        Set the pan of a send.
+
+        Args:
+            source_track (int): Index of the source track
+            send_id (int): ID of the send to set pan for
+            pan (float): Send pan position (-1.0 to 1.0, use number, not string)
+        """,
+    ),
+    _OperationTool(
+        name="clear_all_sends",
+        method="routing.clear_all_sends",
+        params=(("track_index", TrackIndex),),
+        message="Clear all sends from track {track_index}",
+        doc="""
+        Remove all sends from a track.
+
+        Args:
+            track_index (int): Index of the track to clear sends from
+        """,
+    ),
+    _OperationTool(
+        name="clear_all_receives",
+        method="routing.clear_all_receives",
+        params=(("track_index", TrackIndex),),
+        message="Clear all receives from track {track_index}",
+        doc="""
+        Remove all receives from a track.
+
+        Args:
+            track_index (int): Index of the track to clear receives from
+        """,
+    ),
+)
 
 
 def _setup_routing_tools(mcp: FastMCP, controller) -> None:
     """Setup routing-related MCP tools."""
+    _register_operation_tools(mcp, controller, _ROUTING_OPERATION_TOOLS)
+
     from constants import DEFAULT_STEREO_CHANNELS
 
     @mcp.tool("add_send")
+    @_tool_errors("Failed to add send")
     def add_send(
         ctx: Context,
         source_track: int,
@@ -1081,110 +1506,51 @@ def _setup_routing_tools(mcp: FastMCP, controller) -> None:
             phase (bool): Whether phase is inverted
             channels (int): Number of channels (1 or 2)
         """
-        try:
-            send_id = controller.routing.add_send(
-                source_track, destination_track, volume, pan, mute, phase, channels
-            )
-            if send_id is not None:
-                return _create_success_response(
-                    f"Added send from track {source_track} to track {destination_track} with ID {send_id}"
-                )
-            return _create_error_response(
-                f"Failed to add send from track {source_track} to track {destination_track}"
+        send_id = controller.routing.add_send(
+            source_track, destination_track, volume, pan, mute, phase, channels
+        )
+        if send_id is not None:
+            return _create_success_response(
+                f"Added send from track {source_track} to track {destination_track} with ID {send_id}"
             )
-        except Exception as e:
-            logger.error(f"Failed to add send: {str(e)}")
-            return _create_error_response(f"Failed to add send: {str(e)}")
-
-    @mcp.tool("remove_send")
-    def remove_send(ctx: Context, source_track: int, send_id: int) -> Dict[str, Any]:
-        """
-        Remove a send from a track.
-
-        Args:
-            source_track (int): Index of the source track
-            send_id (int): ID of the send to remove
-        """
-        return _handle_controller_operation(
-            f"Remove send {send_id} from track {source_track}",
-            controller.routing.remove_send,
-            source_track,
-            send_id,
+        return _create_error_response(
+            f"Failed to add send from track {source_track} to track {destination_track}"
         )
 
     @mcp.tool("get_sends")
-    def get_sends(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to get sends")
+    def get_sends(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """
         Get all sends from a track.
 
         Args:
             track_index (int): Index of the track to get sends from
         """
-        try:
-            sends = controller.routing.get_sends(track_index)
-            return _create_success_response(f"Sends for track {track_index}: {sends}")
-        except Exception as e:
-            logger.error(f"Failed to get sends: {str(e)}")
-            return _create_error_response(f"Failed to get sends: {str(e)}")
+        sends = controller.routing.get_sends(track_index)
+        return {
+            "status": "success",
+            "message": f"Found {len(sends)} sends on track {track_index}",
+            "data": {"sends": [vars(send) for send in sends]},
+        }
 
     @mcp.tool("get_receives")
-    def get_receives(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to get receives")
+    def get_receives(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """
         Get all receives on a track.
 
         Args:
             track_index (int): Index of the track to get receives from
         """
-        try:
-            receives = controller.routing.get_receives(track_index)
-            return _create_success_response(
-                f"Receives for track {track_index}: {receives}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get receives: {str(e)}")
-            return _create_error_response(f"Failed to get receives: {str(e)}")
-
-    @mcp.tool("set_send_volume")
-    def set_send_volume(
-        ctx: Context, source_track: int, send_id: int, volume: float
-    ) -> Dict[str, Any]:
-        """
-        Set the volume of a send.
-
-        Args:
-            source_track (int): Index of the source track
-            send_id (int): ID of the send to set volume for
-            volume (float): Send volume in dB (use number, not string, e.g., -6.0, 0.0)
-        """
-        return _handle_controller_operation(
-            f"Set send {send_id} volume to {volume} dB",
-            controller.routing.set_send_volume,
-            source_track,
-            send_id,
-            volume,
-        )
-
-    @mcp.tool("set_send_pan")
-    def set_send_pan(
-        ctx: Context, source_track: int, send_id: int, pan: float
-    ) -> Dict[str, Any]:
-        """
-        Set the pan of a send.
-
-        Args:
-            source_track (int): Index of the source track
-            send_id (int): ID of the send to set pan for
-            pan (float): Send pan position (-1.0 to 1.0, use number, not string)
-        """
-        return _handle_controller_operation(
-            f"Set send {send_id} pan to {pan}",
-            controller.routing.set_send_pan,
-            source_track,
-            send_id,
-            pan,
-        )
+        receives = controller.routing.get_receives(track_index)
+        return {
+            "status": "success",
+            "message": f"Found {len(receives)} receives on track {track_index}",
+            "data": {"receives": [vars(receive) for receive in receives]},
+        }
 
     @mcp.tool("toggle_send_mute")
+    @_tool_errors("Failed to toggle send mute")
     def toggle_send_mute(
         ctx: Context, source_track: int, send_id: int, mute: Optional[bool] = None
     ) -> Dict[str, Any]:
@@ -1196,129 +1562,107 @@ def _setup_routing_tools(mcp: FastMCP, controller) -> None:
             send_id (int): ID of the send to toggle mute for
             mute (bool, optional): If True, mute the send; if False, unmute; if None, toggle
         """
-        try:
-            success = controller.routing.toggle_send_mute(source_track, send_id, mute)
-            if success:
-                action = "toggled" if mute is None else f"set to {mute}"
-                return _create_success_response(f"Send {send_id} mute {action}")
-            return _create_error_response(f"Failed to toggle send {send_id} mute")
-        except Exception as e:
-            logger.error(f"Failed to toggle send mute: {str(e)}")
-            return _create_error_response(f"Failed to toggle send mute: {str(e)}")
+        success = controller.routing.toggle_send_mute(source_track, send_id, mute)
+        if success:
+            action = "toggled" if mute is None else f"set to {mute}"
+            return _create_success_response(f"Send {send_id} mute {action}")
+        return _create_error_response(f"Failed to toggle send {send_id} mute")
 
     @mcp.tool("get_track_routing_info")
-    def get_track_routing_info(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to get track routing info")
+    def get_track_routing_info(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """
         Get comprehensive routing information for a track.
 
         Args:
             track_index (int): Index of the track to get routing info for
         """
-        try:
+        with inside_reaper():
             routing_info = controller.routing.get_track_routing_info(track_index)
-            return _create_success_response(
-                f"Routing info for track {track_index}: {routing_info}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get track routing info: {str(e)}")
-            return _create_error_response(f"Failed to get track routing info: {str(e)}")
+        return {
+            "status": "success",
+            "message": f"Routing info for track {track_index}",
+            "data": routing_info,
+        }
 
     @mcp.tool("debug_track_routing")
-    def debug_track_routing(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to debug track routing")
+    def debug_track_routing(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """
         Debug track routing information for troubleshooting.
 
         Args:
             track_index (int): Index of the track to debug routing for
         """
-        try:
+        with inside_reaper():
             debug_info = controller.routing.debug_track_routing(track_index)
-            return _create_success_response(
-                f"Debug info for track {track_index}: {debug_info}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to debug track routing: {str(e)}")
-            return _create_error_response(f"Failed to debug track routing: {str(e)}")
-
-    @mcp.tool("clear_all_sends")
-    def clear_all_sends(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """
-        Remove all sends from a track.
-
-        Args:
-            track_index (int): Index of the track to clear sends from
-        """
-        return _handle_controller_operation(
-            f"Clear all sends from track {track_index}",
-            controller.routing.clear_all_sends,
-            track_index,
-        )
-
-    @mcp.tool("clear_all_receives")
-    def clear_all_receives(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """
-        Remove all receives from a track.
-
-        Args:
-            track_index (int): Index of the track to clear receives from
-        """
-        return _handle_controller_operation(
-            f"Clear all receives from track {track_index}",
-            controller.routing.clear_all_receives,
-            track_index,
-        )
-
-
-def _setup_advanced_routing_tools(mcp: FastMCP, controller) -> None:
-    """Setup advanced routing and bussing MCP tools."""
-
-    @mcp.tool("create_folder_track")
-    def create_folder_track(ctx: Context, name: str = "Folder Track") -> Dict[str, Any]:
-        """
+        return {
+            "status": "success",
+            "message": f"Debug info for track {track_index}",
+            "data": debug_info,
+        }
+
+
+_ADVANCED_ROUTING_OPERATION_TOOLS = (
+    _OperationTool(
+        name="create_folder_track",
+        method="advanced_routing.create_folder_track",
+        params=(("name", str, 'Folder Track'),),
+        message="Create folder track '{name}'",
+        doc="""
         Create a folder track that can contain other tracks.
 
         Args:
             name (str): Name for the folder track
-        """
-        return _handle_controller_operation(
-            f"Create folder track '{name}'",
-            controller.advanced_routing.create_folder_track,
-            name,
-        )
-
-    @mcp.tool("create_bus_track")
-    def create_bus_track(ctx: Context, name: str = "Bus Track") -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="create_bus_track",
+        method="advanced_routing.create_bus_track",
+        params=(("name", str, 'Bus Track'),),
+        message="Create bus track '{name}'",
+        doc="""
         Create a bus track for grouping and processing multiple tracks.
 
         Args:
             name (str): Name for the bus track
-        """
-        return _handle_controller_operation(
-            f"Create bus track '{name}'",
-            controller.advanced_routing.create_bus_track,
-            name,
-        )
-
-    @mcp.tool("set_track_parent")
-    def set_track_parent(
-        ctx: Context, child_track_index: int, parent_track_index: int
-    ) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="set_track_parent",
+        method="advanced_routing.set_track_parent",
+        params=(("child_track_index", int), ("parent_track_index", int)),
+        message="Set track {child_track_index} as child of track {parent_track_index}",
+        doc="""
         Set a track's parent folder track.
 
         Args:
             child_track_index (int): Index of the child track
             parent_track_index (int): Index of the parent track
-        """
-        return _handle_controller_operation(
-            f"Set track {child_track_index} as child of track {parent_track_index}",
-            controller.advanced_routing.set_track_parent,
-            child_track_index,
-            parent_track_index,
-        )
+        """,
+    ),
+    _OperationTool(
+        name="set_track_folder_depth",
+        method="advanced_routing.set_track_folder_depth",
+        params=(("track_index", TrackIndex), ("depth", int)),
+        message="Set track {track_index} folder depth to {depth}",
+        doc="""
+        Set the folder depth of a track.
+
+        Args:
+            track_index (int): Index of the track to set folder depth for
+            depth (int): Folder depth (0 for normal, 1 for folder, -1 for last in folder)
+        """,
+    ),
+)
+
+
+def _setup_advanced_routing_tools(mcp: FastMCP, controller) -> None:
+    """Setup advanced routing and bussing MCP tools."""
+    _register_operation_tools(mcp, controller, _ADVANCED_ROUTING_OPERATION_TOOLS)
 
     @mcp.tool("get_track_children")
+    @_tool_errors("Failed to get track children")
     def get_track_children(ctx: Context, parent_track_index: int) -> Dict[str, Any]:
         """
         Get all child tracks of a parent track.
@@ -1326,57 +1670,31 @@ def _setup_advanced_routing_tools(mcp: FastMCP, controller) -> None:
         Args:
             parent_track_index (int): Index of the parent track
         """
-        try:
-            children = controller.advanced_routing.get_track_children(
-                parent_track_index
-            )
-            return _create_success_response(
-                f"Children of track {parent_track_index}: {children}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get track children: {str(e)}")
-            return _create_error_response(f"Failed to get track children: {str(e)}")
+        children = controller.advanced_routing.get_track_children(parent_track_index)
+        return {
+            "status": "success",
+            "message": f"Found {len(children)} children of track {parent_track_index}",
+            "data": {"children": children},
+        }
 
-    @mcp.tool("set_track_folder_depth")
-    def set_track_folder_depth(
-        ctx: Context, track_index: int, depth: int
-    ) -> Dict[str, Any]:
+    @mcp.tool("get_track_folder_depth")
+    @_tool_errors("Failed to get track folder depth")
+    def get_track_folder_depth(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """
-        Set the folder depth of a track.
-
-        Args:
-            track_index (int): Index of the track to set folder depth for
-            depth (int): Folder depth (0 for normal, 1 for folder, -1 for last in folder)
-        """
-        return _handle_controller_operation(
-            f"Set track {track_index} folder depth to {depth}",
-            controller.advanced_routing.set_track_folder_depth,
-            track_index,
-            depth,
-        )
-
-    @mcp.tool("get_track_folder_depth")
-    def get_track_folder_depth(ctx: Context, track_index: int) -> Dict[str, Any]:
-        """
-        Get the folder depth of a track.
+        Get the folder depth of a track.
 
         Args:
             track_index (int): Index of the track to get folder depth for
         """
-        try:
-            depth = controller.advanced_routing.get_track_folder_depth(track_index)
-            return _create_success_response(
-                f"Track {track_index} folder depth: {depth}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get track folder depth: {str(e)}")
-            return _create_error_response(f"Failed to get track folder depth: {str(e)}")
+        depth = controller.advanced_routing.get_track_folder_depth(track_index)
+        return _create_success_response(f"Track {track_index} folder depth: {depth}")
 
 
 def _setup_sidechain_tools(mcp: FastMCP, controller) -> None:
     """Setup sidechain and bus routing MCP tools."""
 
     @mcp.tool("create_sidechain_send")
+    @_tool_errors("Failed to create sidechain send")
     def create_sidechain_send(
         ctx: Context,
         source_track: int,
@@ -1395,34 +1713,31 @@ def _setup_sidechain_tools(mcp: FastMCP, controller) -> None:
             level_db (float): Send level in dB
             pre_fader (bool): True for pre-fader, False for post-fader
         """
-        try:
-            result = controller.sidechain.create_sidechain_send(
-                source_track=source_track,
-                destination_track=destination_track,
-                dest_channels=dest_channels,
-                level_db=level_db,
-                pre_fader=pre_fader
-            )
-            if result:
-                return {
-                    "status": "success",
-                    "message": f"Created sidechain send: track {source_track} -> track {destination_track}",
-                    "data": {
-                        "send_id": result.send_id,
-                        "sidechain_channels": result.sidechain_channels,
-                        "level_db": result.level_db,
-                        "pre_fader": result.pre_fader,
-                        "latency_ms": result.latency_ms,
-                        "route_valid": result.route_valid
-                    }
+        result = controller.sidechain.create_sidechain_send(
+            source_track=source_track,
+            destination_track=destination_track,
+            dest_channels=dest_channels,
+            level_db=level_db,
+            pre_fader=pre_fader
+        )
+        if result:
+            return {
+                "status": "success",
+                "message": f"Created sidechain send: track {source_track} -> track {destination_track}",
+                "data": {
+                    "send_id": result.send_id,
+                    "sidechain_channels": result.sidechain_channels,
+                    "level_db": result.level_db,
+                    "pre_fader": result.pre_fader,
+                    "latency_ms": result.latency_ms,
+                    "route_valid": result.route_valid
                 }
-            else:
-                return _create_error_response("Failed to create sidechain send")
-        except Exception as e:
-            logger.error(f"Failed to create sidechain send: {str(e)}")
-            return _create_error_response(f"Failed to create sidechain send: {str(e)}")
+            }
+        else:
+            return _create_error_response("Failed to create sidechain send")
 
     @mcp.tool("setup_parallel_bus")
+    @_tool_errors("Failed to setup parallel bus")
     def setup_parallel_bus(
         ctx: Context,
         source_track: int,
@@ -1439,32 +1754,29 @@ def _setup_sidechain_tools(mcp: FastMCP, controller) -> None:
             mix_db (float): Mix level for parallel processing in dB
             latency_comp (bool): Enable automatic latency compensation
         """
-        try:
-            result = controller.sidechain.setup_parallel_bus(
-                source_track=source_track,
-                bus_name=bus_name,
-                mix_db=mix_db,
-                latency_comp=latency_comp
-            )
-            if result:
-                return {
-                    "status": "success",
-                    "message": f"Created parallel bus '{bus_name}' for track {source_track}",
-                    "data": {
-                        "bus_track_index": result.bus_track_index,
-                        "send_id": result.send_id,
-                        "return_send_id": result.return_send_id,
-                        "mix_db": result.mix_db,
-                        "latency_compensation": result.latency_compensation
-                    }
+        result = controller.sidechain.setup_parallel_bus(
+            source_track=source_track,
+            bus_name=bus_name,
+            mix_db=mix_db,
+            latency_comp=latency_comp
+        )
+        if result:
+            return {
+                "status": "success",
+                "message": f"Created parallel bus '{bus_name}' for track {source_track}",
+                "data": {
+                    "bus_track_index": result.bus_track_index,
+                    "send_id": result.send_id,
+                    "return_send_id": result.return_send_id,
+                    "mix_db": result.mix_db,
+                    "latency_compensation": result.latency_compensation
                 }
-            else:
-                return _create_error_response("Failed to setup parallel bus")
-        except Exception as e:
-            logger.error(f"Failed to setup parallel bus: {str(e)}")
-            return _create_error_response(f"Failed to setup parallel bus: {str(e)}")
+            }
+        else:
+            return _create_error_response("Failed to setup parallel bus")
 
     @mcp.tool("add_saturation_bus")
+    @_tool_errors("Failed to create saturation bus")
     def add_saturation_bus(
         ctx: Context,
         source_track: int,
@@ -1479,32 +1791,29 @@ def _setup_sidechain_tools(mcp: FastMCP, controller) -> None:
             saturation_type (str): Type of saturation ("tape", "tube", "transistor", "digital")
             mix_percent (float): Saturation mix percentage (0-100%)
         """
-        try:
-            result = controller.sidechain.add_saturation_bus(
-                source_track=source_track,
-                saturation_type=saturation_type,
-                mix_percent=mix_percent
-            )
-            if result:
-                return {
-                    "status": "success",
-                    "message": f"Created {saturation_type} saturation bus for track {source_track}",
-                    "data": {
-                        "bus_track_index": result.bus_track_index,
-                        "saturation_fx_id": result.saturation_fx_id,
-                        "saturation_type": result.saturation_type,
-                        "send_id": result.send_id,
-                        "return_send_id": result.return_send_id,
-                        "mix_percent": result.mix_percent
-                    }
+        result = controller.sidechain.add_saturation_bus(
+            source_track=source_track,
+            saturation_type=saturation_type,
+            mix_percent=mix_percent
+        )
+        if result:
+            return {
+                "status": "success",
+                "message": f"Created {saturation_type} saturation bus for track {source_track}",
+                "data": {
+                    "bus_track_index": result.bus_track_index,
+                    "saturation_fx_id": result.saturation_fx_id,
+                    "saturation_type": result.saturation_type,
+                    "send_id": result.send_id,
+                    "return_send_id": result.return_send_id,
+                    "mix_percent": result.mix_percent
                 }
-            else:
-                return _create_error_response("Failed to create saturation bus")
-        except Exception as e:
-            logger.error(f"Failed to create saturation bus: {str(e)}")
-            return _create_error_response(f"Failed to create saturation bus: {str(e)}")
+            }
+        else:
+            return _create_error_response("Failed to create saturation bus")
 
     @mcp.tool("sidechain_route_analyzer")
+    @_tool_errors("Failed to analyze sidechain route")
     def sidechain_route_analyzer(
         ctx: Context,
         source_track: int,
@@ -1517,58 +1826,51 @@ def _setup_sidechain_tools(mcp: FastMCP, controller) -> None:
             source_track (int): Index of the source track
             dest_track (int): Index of the destination track
         """
-        try:
-            result = controller.sidechain.sidechain_route_analyzer(
-                source_track=source_track,
-                dest_track=dest_track
-            )
-            return {
-                "status": "success" if result.valid else "warning",
-                "message": f"Route analysis: {source_track} -> {dest_track}",
-                "data": {
-                    "valid": result.valid,
-                    "channels_map": result.channels_map,
-                    "latency_ms": result.latency_ms,
-                    "warnings": result.warnings,
-                    "errors": result.errors
-                }
+        result = controller.sidechain.sidechain_route_analyzer(
+            source_track=source_track,
+            dest_track=dest_track
+        )
+        return {
+            "status": "success" if result.valid else "warning",
+            "message": f"Route analysis: {source_track} -> {dest_track}",
+            "data": {
+                "valid": result.valid,
+                "channels_map": result.channels_map,
+                "latency_ms": result.latency_ms,
+                "warnings": result.warnings,
+                "errors": result.errors
             }
-        except Exception as e:
-            logger.error(f"Failed to analyze sidechain route: {str(e)}")
-            return _create_error_response(f"Failed to analyze sidechain route: {str(e)}")
+        }
 
 
-def _setup_automation_tools(mcp: FastMCP, controller) -> None:
-    """Setup automation and modulation MCP tools."""
-
-    @mcp.tool("create_automation_envelope")
-    def create_automation_envelope(
-        ctx: Context, track_index: int, envelope_name: str
-    ) -> Dict[str, Any]:
-        """
+_AUTOMATION_OPERATION_TOOLS = (
+    _OperationTool(
+        name="create_automation_envelope",
+        method="automation.create_automation_envelope",
+        params=(("track_index", TrackIndex), ("envelope_name", str)),
+        message="Create automation envelope '{envelope_name}' on track {track_index}",
+        doc="""
         Create an automation envelope on a track.
 
         Args:
             track_index (int): Index of the track to create envelope on
             envelope_name (str): Name of the automation envelope
-        """
-        return _handle_controller_operation(
-            f"Create automation envelope '{envelope_name}' on track {track_index}",
-            controller.automation.create_automation_envelope,
-            track_index,
-            envelope_name,
-        )
-
-    @mcp.tool("add_automation_point")
-    def add_automation_point(
-        ctx: Context,
-        track_index: int,
-        envelope_name: str,
-        time: float,
-        value: float,
-        shape: int = 0,
-    ) -> Dict[str, Any]:
-        """
+        """,
+    ),
+    _OperationTool(
+        name="add_automation_point",
+        method="automation.add_automation_point",
+        params=(
+            ("track_index", TrackIndex),
+            ("envelope_name", str),
+            ("time", float),
+            ("value", float),
+            ("shape", int, 0),
+        ),
+        message=(
+            "Add automation point at {time}s with value {value} on track {track_index}"
+        ),
+        doc="""
         Add an automation point to an envelope.
 
         Args:
@@ -1577,102 +1879,201 @@ def _setup_automation_tools(mcp: FastMCP, controller) -> None:
             time (float): Time position in seconds (use number, not string)
             value (float): Value of the automation point (use number, not string)
             shape (int): Shape of the automation curve (0: linear, 1: slow, 2: fast, 3: bezier, 4: square)
-        """
-        return _handle_controller_operation(
-            f"Add automation point at {time}s with value {value} on track {track_index}",
-            controller.automation.add_automation_point,
-            track_index,
-            envelope_name,
-            time,
-            value,
-            shape,
-        )
+        """,
+    ),
+    _OperationTool(
+        name="set_automation_mode",
+        method="automation.set_automation_mode",
+        params=(("track_index", TrackIndex), ("mode", str)),
+        message="Set automation mode to '{mode}' on track {track_index}",
+        doc="""
+        Set the automation mode for a track.
 
-    @mcp.tool("get_automation_points")
-    def get_automation_points(
-        ctx: Context, track_index: int, envelope_name: str
+        Args:
+            track_index (int): Index of the track to set automation mode for
+            mode (str): Automation mode (e.g., "read", "write", "touch", "latch", "trim")
+        """,
+    ),
+    _OperationTool(
+        name="delete_automation_point",
+        method="automation.delete_automation_point",
+        params=(
+            ("track_index", TrackIndex),
+            ("envelope_name", str),
+            ("point_index", int),
+        ),
+        message=(
+            "Delete automation point {point_index} from '{envelope_name}' on track "
+            "{track_index}"
+        ),
+        doc="""
+        Delete an automation point from an envelope.
+
+        Args:
+            track_index (int): Index of the track containing the envelope
+            envelope_name (str): Name of the automation envelope
+            point_index (int): Index of the automation point to delete
+        """,
+    ),
+)
+
+
+def _setup_automation_tools(mcp: FastMCP, controller) -> None:
+    """Setup automation and modulation MCP tools."""
+    _register_operation_tools(mcp, controller, _AUTOMATION_OPERATION_TOOLS)
+
+    @mcp.tool("add_automation_points")
+    @_tool_errors("Failed to add automation points")
+    def add_automation_points(
+        ctx: Context,
+        track_index: TrackIndex,
+        envelope_name: str,
+        points: List[Dict[str, Any]],
     ) -> Dict[str, Any]:
         """
-        Get all automation points from an envelope.
+        Add several automation points to an envelope in one call.
 
         Args:
             track_index (int): Index of the track containing the envelope
             envelope_name (str): Name of the automation envelope
-        """
-        try:
-            points = controller.automation.get_automation_points(
-                track_index, envelope_name
-            )
+            points (List[Dict]): Points to add, each with "time" (seconds) and
+                "value" and an optional "shape" (0: linear, default)
+        """
+        point_tuples = [
+            (point["time"], point["value"], point.get("shape", 0)) for point in points
+        ]
+        added = controller.automation.add_automation_points(
+            track_index, envelope_name, point_tuples
+        )
+        if added == len(point_tuples):
             return _create_success_response(
-                f"Automation points for '{envelope_name}' on track {track_index}: {points}"
+                f"Added {added} automation points to '{envelope_name}' "
+                f"on track {track_index}"
             )
-        except Exception as e:
-            logger.error(f"Failed to get automation points: {str(e)}")
-            return _create_error_response(f"Failed to get automation points: {str(e)}")
+        return _create_error_response(
+            f"Failed to add {len(point_tuples)} automation points to "
+            f"'{envelope_name}' on track {track_index}"
+        )
 
-    @mcp.tool("set_automation_mode")
-    def set_automation_mode(
-        ctx: Context, track_index: int, mode: str
+    @mcp.tool("get_automation_points")
+    @_tool_errors("Failed to get automation points")
+    def get_automation_points(
+        ctx: Context, track_index: TrackIndex, envelope_name: str
     ) -> Dict[str, Any]:
         """
-        Set the automation mode for a track.
+        Get all automation points from an envelope.
 
         Args:
-            track_index (int): Index of the track to set automation mode for
-            mode (str): Automation mode (e.g., "read", "write", "touch", "latch", "trim")
+            track_index (int): Index of the track containing the envelope
+            envelope_name (str): Name of the automation envelope
         """
-        return _handle_controller_operation(
-            f"Set automation mode to '{mode}' on track {track_index}",
-            controller.automation.set_automation_mode,
-            track_index,
-            mode,
-        )
+        points = controller.automation.get_automation_points(track_index, envelope_name)
+        return {
+            "status": "success",
+            "message": (
+                f"Found {len(points)} automation points for '{envelope_name}' "
+                f"on track {track_index}"
+            ),
+            "data": {"points": points},
+        }
 
     @mcp.tool("get_automation_mode")
-    def get_automation_mode(ctx: Context, track_index: int) -> Dict[str, Any]:
+    @_tool_errors("Failed to get automation mode")
+    def get_automation_mode(ctx: Context, track_index: TrackIndex) -> Dict[str, Any]:
         """
         Get the current automation mode for a track.
 
         Args:
             track_index (int): Index of the track to get automation mode for
         """
-        try:
-            mode = controller.automation.get_automation_mode(track_index)
-            return _create_success_response(
-                f"Track {track_index} automation mode: {mode}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to get automation mode: {str(e)}")
-            return _create_error_response(f"Failed to get automation mode: {str(e)}")
+        mode = controller.automation.get_automation_mode(track_index)
+        return _create_success_response(f"Track {track_index} automation mode: {mode}")
+
+
+_ANALYSIS_OPERATION_TOOLS = (
+    _OperationTool(
+        name="normalize_track_lufs",
+        method="analysis.loudness.normalize_track_lufs",
+        params=(
+            ("track_index", TrackIndex),
+            ("target_lufs", float, -23.0),
+            ("true_peak_ceiling", float, -1.0),
+        ),
+        message="Normalize track {track_index} to {target_lufs} LUFS",
+        doc="""
+        Normalize track to target LUFS with true peak ceiling.
 
-    @mcp.tool("delete_automation_point")
-    def delete_automation_point(
-        ctx: Context, track_index: int, envelope_name: str, point_index: int
-    ) -> Dict[str, Any]:
-        """
-        Delete an automation point from an envelope.
+        Args:
+            track_index: Index of track to normalize
+            target_lufs: Target LUFS level
+            true_peak_ceiling: Maximum true peak in dBFS
+        """,
+    ),
+    _OperationTool(
+        name="match_loudness_between_tracks",
+        method="analysis.loudness.match_loudness_between_tracks",
+        params=(("source_track", int), ("target_track", int), ("mode", str, 'lufs')),
+        message="Match loudness of track {source_track} to track {target_track}",
+        doc="""
+        Match loudness between two tracks.
 
         Args:
-            track_index (int): Index of the track containing the envelope
-            envelope_name (str): Name of the automation envelope
-            point_index (int): Index of the automation point to delete
-        """
-        return _handle_controller_operation(
-            f"Delete automation point {point_index} from '{envelope_name}' on track {track_index}",
-            controller.automation.delete_automation_point,
-            track_index,
-            envelope_name,
-            point_index,
-        )
+            source_track: Track index to adjust
+            target_track: Track index to match
+            mode: Matching mode (lufs or spectrum)
+        """,
+    ),
+    _OperationTool(
+        name="write_volume_automation_to_target_lufs",
+        method="analysis.write_volume_automation_to_target_lufs",
+        params=(
+            ("track_index", TrackIndex),
+            ("target_lufs", float, -23.0),
+            ("smoothing_ms", float, 100.0),
+        ),
+        message="Write volume automation for track {track_index} to {target_lufs} LUFS",
+        doc="""
+        Generate volume automation to achieve target LUFS without clipping.
+
+        Args:
+            track_index: Index of track to automate
+            target_lufs: Target LUFS level
+            smoothing_ms: Automation smoothing time in milliseconds
+        """,
+    ),
+    _OperationTool(
+        name="clip_gain_adjust",
+        method="analysis.clip_gain_adjust",
+        params=(("track_index", TrackIndex), ("item_id", int), ("gain_db", float)),
+        message=(
+            "Adjust clip gain on track {track_index} item {item_id} by {gain_db:+.1f}dB"
+        ),
+        doc="""
+        Adjust clip gain on an audio item without affecting track fader.
+
+        Args:
+            track_index: Index of track containing the item
+            item_id: ID of the item to adjust
+            gain_db: Gain adjustment in dB
+        """,
+    ),
+)
 
 
 def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
     """Setup audio analysis MCP tools for professional mixing and mastering."""
+    _register_operation_tools(mcp, controller, _ANALYSIS_OPERATION_TOOLS)
+
+    # Resolve sub-controllers once instead of on every tool call
+    analysis_controller = getattr(controller, "analysis", None)
+    loudness_controller = getattr(analysis_controller, "loudness", None)
+    spectrum_controller = getattr(analysis_controller, "spectrum", None)
 
     @mcp.tool("loudness_measure_track")
+    @_tool_errors("Failed to measure track loudness")
     def loudness_measure_track(
         ctx: Context, 
-        track_index: int, 
+        track_index: TrackIndex, 
         window_sec: float = 30.0, 
         gate_enabled: bool = True
     ) -> Dict[str, Any]:
@@ -1684,22 +2085,19 @@ def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
             window_sec: Measurement window in seconds
             gate_enabled: Enable gating per ITU-R BS.1770-4
         """
-        try:
-            metrics = controller.analysis.loudness.loudness_measure_track(
-                track_index, window_sec, gate_enabled
+        metrics = loudness_controller.loudness_measure_track(
+            track_index, window_sec, gate_enabled
+        )
+        if metrics is not None:
+            return _create_success_response(
+                f"Track {track_index} loudness: {metrics.integrated_lufs:.1f} LUFS, "
+                f"LRA: {metrics.lra:.1f} LU, True Peak: {metrics.true_peak_dbfs:.1f} dBFS"
             )
-            if metrics:
-                return _create_success_response(
-                    f"Track {track_index} loudness: {metrics.integrated_lufs:.1f} LUFS, "
-                    f"LRA: {metrics.lra:.1f} LU, True Peak: {metrics.true_peak_dbfs:.1f} dBFS"
-                )
-            else:
-                return _create_error_response("Failed to measure track loudness")
-        except Exception as e:
-            logger.error(f"Failed to measure track loudness: {e}")
-            return _create_error_response(f"Failed to measure track loudness: {str(e)}")
+        else:
+            return _create_error_response("Failed to measure track loudness")
 
     @mcp.tool("loudness_measure_master")
+    @_tool_errors("Failed to measure master loudness")
     def loudness_measure_master(
         ctx: Context, 
         window_sec: float = 30.0, 
@@ -1712,28 +2110,24 @@ def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
             window_sec: Measurement window in seconds
             gate_enabled: Enable gating per ITU-R BS.1770-4
         """
-        try:
-            metrics = controller.analysis.loudness.loudness_measure_master(
-                window_sec, gate_enabled
+        metrics = loudness_controller.loudness_measure_master(window_sec, gate_enabled)
+        if metrics is not None:
+            return _create_success_response(
+                f"Master loudness: {metrics.integrated_lufs:.1f} LUFS, "
+                f"LRA: {metrics.lra:.1f} LU, True Peak: {metrics.true_peak_dbfs:.1f} dBFS"
             )
-            if metrics:
-                return _create_success_response(
-                    f"Master loudness: {metrics.integrated_lufs:.1f} LUFS, "
-                    f"LRA: {metrics.lra:.1f} LU, True Peak: {metrics.true_peak_dbfs:.1f} dBFS"
-                )
-            else:
-                return _create_error_response("Failed to measure master loudness")
-        except Exception as e:
-            logger.error(f"Failed to measure master loudness: {e}")
-            return _create_error_response(f"Failed to measure master loudness: {str(e)}")
+        else:
+            return _create_error_response("Failed to measure master loudness")
 
     @mcp.tool("spectrum_analyzer_track")
+    @_tool_errors("Failed to analyze track spectrum")
     def spectrum_analyzer_track(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         window_size: float = 1.0,
         fft_size: int = 8192,
-        weighting: str = "none"
+        weighting: str = "none",
+        include_bins: bool = False
     ) -> Dict[str, Any]:
         """
         Perform FFT spectrum analysis on a track.
@@ -1743,36 +2137,77 @@ def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
             window_size: Analysis window in seconds
             fft_size: FFT size (power of 2)
             weighting: Frequency weighting (A, C, Z, or none)
+            include_bins: Also return per-bin magnitudes as base64 int16 millibels
         """
-        try:
-            from controllers.analysis.spectrum_controller import WeightingType
-            
-            weight_map = {
-                "none": WeightingType.NONE,
-                "A": WeightingType.A_WEIGHTING,
-                "C": WeightingType.C_WEIGHTING,
-                "Z": WeightingType.Z_WEIGHTING
-            }
-            weighting_type = weight_map.get(weighting, WeightingType.NONE)
-            
-            spectrum = controller.analysis.spectrum.spectrum_analyzer_track(
+        weighting_type = _WEIGHT_MAP.get(weighting, WeightingType.NONE)
+
+        spectrum = _ANALYSIS_CACHE.get_or_compute(
+            ("spectrum_analyzer_track", track_index, window_size, fft_size, weighting_type),
+            lambda: spectrum_controller.spectrum_analyzer_track(
                 track_index, window_size, fft_size, weighting_type
+            ),
+        )
+        if spectrum is not None:
+            response = _create_success_response(
+                f"Track {track_index} spectrum analyzed: {len(spectrum.frequencies)} frequency bins, "
+                f"SR: {spectrum.sample_rate}Hz, Weighting: {weighting}"
             )
-            if spectrum:
-                return _create_success_response(
-                    f"Track {track_index} spectrum analyzed: {len(spectrum.frequencies)} frequency bins, "
-                    f"SR: {spectrum.sample_rate}Hz, Weighting: {weighting}"
-                )
-            else:
-                return _create_error_response("Failed to analyze track spectrum")
-        except Exception as e:
-            logger.error(f"Failed to analyze track spectrum: {e}")
-            return _create_error_response(f"Failed to analyze track spectrum: {str(e)}")
+            if include_bins:
+                response["data"] = _spectrum_bins_data(spectrum)
+            return response
+        else:
+            return _create_error_response("Failed to analyze track spectrum")
+
+    @mcp.tool("spectrum_analyzer_track_batch")
+    @_tool_errors("Failed to analyze track spectra")
+    def spectrum_analyzer_track_batch(
+        ctx: Context,
+        track_indices: List[int],
+        window_size: float = 1.0,
+        fft_size: int = 8192,
+        weighting: str = "none",
+        include_bins: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Perform spectrum analysis on several tracks in one call.
+        
+        Args:
+            track_indices: Indices of tracks to analyze
+            window_size: Analysis window in seconds
+            fft_size: FFT size (power of 2)
+            weighting: Frequency weighting (A, C, Z, or none)
+            include_bins: Also return per-bin magnitudes as base64 int16 millibels
+        """
+        weighting_type = _WEIGHT_MAP.get(weighting, WeightingType.NONE)
+
+        spectra = spectrum_controller.spectrum_analyzer_tracks(
+            track_indices, window_size, fft_size, weighting_type
+        )
+        if not spectra:
+            return _create_error_response("Failed to analyze track spectra")
+
+        return {
+            "status": "success",
+            "message": f"Analyzed spectrum of {len(spectra)} of {len(track_indices)} tracks, "
+            f"Weighting: {weighting}",
+            "data": {
+                "tracks": {
+                    track_index: (
+                        _spectrum_bins_data(spectrum)
+                        if include_bins
+                        else {"bin_count": len(spectrum.magnitudes_db)}
+                    )
+                    for track_index, spectrum in spectra.items()
+                },
+                "failed": [i for i in track_indices if i not in spectra],
+            },
+        }
 
     @mcp.tool("phase_correlation")
+    @_tool_errors("Failed to measure phase correlation")
     def phase_correlation(
         ctx: Context, 
-        track_index: int, 
+        track_index: TrackIndex, 
         window_sec: float = 1.0
     ) -> Dict[str, Any]:
         """
@@ -1782,22 +2217,22 @@ def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
             track_index: Index of track to analyze
             window_sec: Analysis window in seconds
         """
-        try:
-            correlation = controller.analysis.spectrum.phase_correlation(track_index, window_sec)
-            if correlation is not None:
-                return _create_success_response(
-                    f"Track {track_index} phase correlation: {correlation:.3f}"
-                )
-            else:
-                return _create_error_response("Failed to measure phase correlation")
-        except Exception as e:
-            logger.error(f"Failed to measure phase correlation: {e}")
-            return _create_error_response(f"Failed to measure phase correlation: {str(e)}")
+        correlation = _ANALYSIS_CACHE.get_or_compute(
+            ("phase_correlation", track_index, window_sec),
+            lambda: spectrum_controller.phase_correlation(track_index, window_sec),
+        )
+        if correlation is not None:
+            return _create_success_response(
+                f"Track {track_index} phase correlation: {correlation:.3f}"
+            )
+        else:
+            return _create_error_response("Failed to measure phase correlation")
 
     @mcp.tool("stereo_image_metrics")
+    @_tool_errors("Failed to analyze stereo image")
     def stereo_image_metrics(
         ctx: Context, 
-        track_index: int, 
+        track_index: TrackIndex, 
         window_sec: float = 1.0
     ) -> Dict[str, Any]:
         """
@@ -1807,24 +2242,24 @@ def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
             track_index: Index of track to analyze
             window_sec: Analysis window in seconds
         """
-        try:
-            metrics = controller.analysis.spectrum.stereo_image_metrics(track_index, window_sec)
-            if metrics:
-                return _create_success_response(
-                    f"Track {track_index} stereo: Correlation: {metrics.correlation:.3f}, "
-                    f"Width: {metrics.width:.2f}, Mid: {metrics.mid_level_db:.1f}dB, "
-                    f"Side: {metrics.side_level_db:.1f}dB"
-                )
-            else:
-                return _create_error_response("Failed to analyze stereo image")
-        except Exception as e:
-            logger.error(f"Failed to analyze stereo image: {e}")
-            return _create_error_response(f"Failed to analyze stereo image: {str(e)}")
+        metrics = _ANALYSIS_CACHE.get_or_compute(
+            ("stereo_image_metrics", track_index, window_sec),
+            lambda: spectrum_controller.stereo_image_metrics(track_index, window_sec),
+        )
+        if metrics is not None:
+            return _create_success_response(
+                f"Track {track_index} stereo: Correlation: {metrics.correlation:.3f}, "
+                f"Width: {metrics.width:.2f}, Mid: {metrics.mid_level_db:.1f}dB, "
+                f"Side: {metrics.side_level_db:.1f}dB"
+            )
+        else:
+            return _create_error_response("Failed to analyze stereo image")
 
     @mcp.tool("crest_factor_track")
+    @_tool_errors("Failed to calculate crest factor")
     def crest_factor_track(
         ctx: Context, 
-        track_index: int, 
+        track_index: TrackIndex, 
         window_sec: float = 1.0
     ) -> Dict[str, Any]:
         """
@@ -1834,115 +2269,23 @@ def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
             track_index: Index of track to analyze
             window_sec: Analysis window in seconds
         """
-        try:
-            crest = controller.analysis.spectrum.crest_factor_track(track_index, window_sec)
-            if crest:
-                return _create_success_response(
-                    f"Track {track_index} crest factor: {crest.crest_factor_db:.1f}dB "
-                    f"(Peak: {crest.peak_db:.1f}dB, RMS: {crest.rms_db:.1f}dB)"
-                )
-            else:
-                return _create_error_response("Failed to calculate crest factor")
-        except Exception as e:
-            logger.error(f"Failed to calculate crest factor: {e}")
-            return _create_error_response(f"Failed to calculate crest factor: {str(e)}")
-
-    @mcp.tool("normalize_track_lufs")
-    def normalize_track_lufs(
-        ctx: Context,
-        track_index: int,
-        target_lufs: float = -23.0,
-        true_peak_ceiling: float = -1.0
-    ) -> Dict[str, Any]:
-        """
-        Normalize track to target LUFS with true peak ceiling.
-        
-        Args:
-            track_index: Index of track to normalize
-            target_lufs: Target LUFS level
-            true_peak_ceiling: Maximum true peak in dBFS
-        """
-        return _handle_controller_operation(
-            f"Normalize track {track_index} to {target_lufs} LUFS",
-            controller.analysis.loudness.normalize_track_lufs,
-            track_index,
-            target_lufs,
-            true_peak_ceiling
-        )
-
-    @mcp.tool("match_loudness_between_tracks")
-    def match_loudness_between_tracks(
-        ctx: Context,
-        source_track: int,
-        target_track: int,
-        mode: str = "lufs"
-    ) -> Dict[str, Any]:
-        """
-        Match loudness between two tracks.
-        
-        Args:
-            source_track: Track index to adjust
-            target_track: Track index to match
-            mode: Matching mode (lufs or spectrum)
-        """
-        return _handle_controller_operation(
-            f"Match loudness of track {source_track} to track {target_track}",
-            controller.analysis.loudness.match_loudness_between_tracks,
-            source_track,
-            target_track,
-            mode
-        )
-
-    @mcp.tool("write_volume_automation_to_target_lufs")
-    def write_volume_automation_to_target_lufs(
-        ctx: Context,
-        track_index: int,
-        target_lufs: float = -23.0,
-        smoothing_ms: float = 100.0
-    ) -> Dict[str, Any]:
-        """
-        Generate volume automation to achieve target LUFS without clipping.
-        
-        Args:
-            track_index: Index of track to automate
-            target_lufs: Target LUFS level
-            smoothing_ms: Automation smoothing time in milliseconds
-        """
-        return _handle_controller_operation(
-            f"Write volume automation for track {track_index} to {target_lufs} LUFS",
-            controller.analysis.write_volume_automation_to_target_lufs,
-            track_index,
-            target_lufs,
-            smoothing_ms
-        )
-
-    @mcp.tool("clip_gain_adjust")
-    def clip_gain_adjust(
-        ctx: Context,
-        track_index: int,
-        item_id: int,
-        gain_db: float
-    ) -> Dict[str, Any]:
-        """
-        Adjust clip gain on an audio item without affecting track fader.
-        
-        Args:
-            track_index: Index of track containing the item
-            item_id: ID of the item to adjust
-            gain_db: Gain adjustment in dB
-        """
-        return _handle_controller_operation(
-            f"Adjust clip gain on track {track_index} item {item_id} by {gain_db:+.1f}dB",
-            controller.analysis.clip_gain_adjust,
-            track_index,
-            item_id,
-            gain_db
+        crest = _ANALYSIS_CACHE.get_or_compute(
+            ("crest_factor_track", track_index, window_sec),
+            lambda: spectrum_controller.crest_factor_track(track_index, window_sec),
         )
+        if crest is not None:
+            return _create_success_response(
+                f"Track {track_index} crest factor: {crest.crest_factor_db:.1f}dB "
+                f"(Peak: {crest.peak_db:.1f}dB, RMS: {crest.rms_db:.1f}dB)"
+            )
+        else:
+            return _create_error_response("Failed to calculate crest factor")
 
     @mcp.tool("comprehensive_track_analysis")
+    @_tool_errors("Failed to perform comprehensive analysis")
     def comprehensive_track_analysis(
         ctx: Context,
-        track_index: int,
+        track_index: TrackIndex,
         window_sec: float = 5.0
     ) -> Dict[str, Any]:
         """
@@ -1952,44 +2295,146 @@ def _setup_analysis_tools(mcp: FastMCP, controller) -> None:
             track_index: Index of track to analyze
             window_sec: Analysis window in seconds
         """
-        try:
-            analysis = controller.analysis.comprehensive_track_analysis(track_index, window_sec)
-            if analysis:
-                return _create_success_response(f"Comprehensive analysis for track {track_index}: {analysis}")
-            else:
-                return _create_error_response("Failed to perform comprehensive analysis")
-        except Exception as e:
-            logger.error(f"Failed to perform comprehensive analysis: {e}")
-            return _create_error_response(f"Failed to perform comprehensive analysis: {str(e)}")
+        analysis = _ANALYSIS_CACHE.get_or_compute(
+            ("comprehensive_track_analysis", track_index, window_sec),
+            lambda: analysis_controller.comprehensive_track_analysis(
+                track_index, window_sec
+            ),
+        )
+        if analysis is not None:
+            return {
+                "status": "success",
+                "message": f"Comprehensive analysis for track {track_index}",
+                "data": analysis,
+            }
+        else:
+            return _create_error_response("Failed to perform comprehensive analysis")
 
     @mcp.tool("master_chain_analysis")
+    @_tool_errors("Failed to analyze master chain")
     def master_chain_analysis(
         ctx: Context,
-        window_sec: float = 10.0
+        window_sec: float = 10.0,
+        what: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Analyze master chain for broadcast/streaming compliance and quality.
         
         Args:
             window_sec: Analysis window in seconds
-        """
-        try:
-            analysis = controller.analysis.master_chain_analysis(window_sec)
-            if analysis:
-                return _create_success_response(f"Master chain analysis: {analysis}")
-            else:
-                return _create_error_response("Failed to analyze master chain")
-        except Exception as e:
-            logger.error(f"Failed to analyze master chain: {e}")
-            return _create_error_response(f"Failed to analyze master chain: {str(e)}")
+            what: Sections to compute: loudness (or lufs, lra, true_peak),
+                spectrum, dynamics. Omit for all; use ["lufs"] for a quick
+                compliance check that skips the spectrum analysis.
+        """
+        sections = tuple(sorted(what)) if what is not None else None
+        analysis = _ANALYSIS_CACHE.get_or_compute(
+            ("master_chain_analysis", window_sec, sections),
+            lambda: analysis_controller.master_chain_analysis(window_sec, what),
+        )
+        if analysis is not None:
+            return {
+                "status": "success",
+                "message": "Master chain analysis",
+                "data": analysis,
+            }
+        else:
+            return _create_error_response("Failed to analyze master chain")
+
+
+_ADVANCED_ITEM_OPERATION_TOOLS = (
+    _OperationTool(
+        name="fade_in",
+        method="advanced_items.fade_in",
+        params=(
+            ("track_index", TrackIndex),
+            ("item_index", int),
+            ("fade_length", float),
+            ("fade_curve", int, 0),
+        ),
+        message=(
+            "Add {fade_length}s fade-in to item {item_index} on track {track_index}"
+        ),
+        doc="""
+        Add a fade-in to an item.
+
+        Args:
+            track_index (int): Index of the track containing the item
+            item_index (int): Index of the item to add fade-in to
+            fade_length (float): Length of the fade-in in seconds (use number, not string)
+            fade_curve (int): Fade curve shape (0-6, default 0: linear)
+        """,
+    ),
+    _OperationTool(
+        name="fade_out",
+        method="advanced_items.fade_out",
+        params=(
+            ("track_index", TrackIndex),
+            ("item_index", int),
+            ("fade_length", float),
+            ("fade_curve", int, 0),
+        ),
+        message=(
+            "Add {fade_length}s fade-out to item {item_index} on track {track_index}"
+        ),
+        doc="""
+        Add a fade-out to an item.
+
+        Args:
+            track_index (int): Index of the track containing the item
+            item_index (int): Index of the item to add fade-out to
+            fade_length (float): Length of the fade-out in seconds (use number, not string)
+            fade_curve (int): Fade curve shape (0-6, default 0: linear)
+        """,
+    ),
+    _OperationTool(
+        name="crossfade_items",
+        method="advanced_items.crossfade_items",
+        params=(
+            ("track_index", TrackIndex),
+            ("item1_index", int),
+            ("item2_index", int),
+            ("crossfade_length", float),
+        ),
+        message=(
+            "Create {crossfade_length}s crossfade between items {item1_index} and "
+            "{item2_index}"
+        ),
+        doc="""
+        Create a crossfade between two items.
+
+        Args:
+            track_index (int): Index of the track containing the items
+            item1_index (int): Index of the first item
+            item2_index (int): Index of the second item
+            crossfade_length (float): Length of the crossfade in seconds (use number, not string)
+        """,
+    ),
+    _OperationTool(
+        name="reverse_item",
+        method="advanced_items.reverse_item",
+        params=(("track_index", TrackIndex), ("item_index", int)),
+        message="Reverse item {item_index} on track {track_index}",
+        doc="""
+        Reverse an item.
+
+        Args:
+            track_index (int): Index of the track containing the item
+            item_index (int): Index of the item to reverse
+        """,
+    ),
+)
 
 
 def _setup_advanced_item_tools(mcp: FastMCP, controller) -> None:
     """Setup advanced item operations MCP tools."""
+    _register_operation_tools(mcp, controller, _ADVANCED_ITEM_OPERATION_TOOLS)
+
+    advanced_items = getattr(controller, "advanced_items", None)
 
     @mcp.tool("split_item")
+    @_tool_errors("Failed to split item")
     def split_item(
-        ctx: Context, track_index: int, item_index: int, split_time: float
+        ctx: Context, track_index: TrackIndex, item_index: int, split_time: float
     ) -> Dict[str, Any]:
         """
         Split an item at a specific time.
@@ -1999,20 +2444,20 @@ def _setup_advanced_item_tools(mcp: FastMCP, controller) -> None:
             item_index (int): Index of the item to split
             split_time (float): Time position in seconds to split the item (use number, not string)
         """
-        try:
-            new_items = controller.advanced_items.split_item(
-                track_index, item_index, split_time
-            )
-            return _create_success_response(
-                f"Split item {item_index} at {split_time}s, created {len(new_items)} new items: {new_items}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to split item: {str(e)}")
-            return _create_error_response(f"Failed to split item: {str(e)}")
+        new_items = advanced_items.split_item(track_index, item_index, split_time)
+        return {
+            "status": "success",
+            "message": (
+                f"Split item {item_index} at {split_time}s, "
+                f"created {len(new_items)} new items"
+            ),
+            "data": {"new_items": new_items},
+        }
 
     @mcp.tool("glue_items")
+    @_tool_errors("Failed to glue items")
     def glue_items(
-        ctx: Context, track_index: int, item_indices: List[int]
+        ctx: Context, track_index: TrackIndex, item_indices: List[int]
     ) -> Dict[str, Any]:
         """
         Glue multiple items together into a single item.
@@ -2023,141 +2468,400 @@ def _setup_advanced_item_tools(mcp: FastMCP, controller) -> None:
         """
         return _handle_controller_operation(
             f"Glue {len(item_indices)} items on track {track_index}",
-            controller.advanced_items.glue_items,
+            advanced_items.glue_items,
             track_index,
             item_indices,
         )
 
-    @mcp.tool("fade_in")
-    def fade_in(
-        ctx: Context,
-        track_index: int,
-        item_index: int,
-        fade_length: float,
-        fade_curve: int = 0,
-    ) -> Dict[str, Any]:
+    @mcp.tool("bulk_item_ops")
+    @_tool_errors("Failed to run item operations")
+    def bulk_item_ops(ctx: Context, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Add a fade-in to an item.
+        Run several item edits in one call and one undo step.
 
         Args:
-            track_index (int): Index of the track containing the item
-            item_index (int): Index of the item to add fade-in to
-            fade_length (float): Length of the fade-in in seconds (use number, not string)
-            fade_curve (int): Fade curve shape (0-6, default 0: linear)
+            ops (List[Dict[str, Any]]): Operations to run in order. Each entry has
+                an "op" key (split, glue, fade_in, fade_out, crossfade, reverse)
+                plus the arguments of the matching tool, e.g.
+                {"op": "fade_in", "track_index": 0, "item_index": 1, "fade_length": 0.5}
         """
-        return _handle_controller_operation(
-            f"Add {fade_length}s fade-in to item {item_index} on track {track_index}",
-            controller.advanced_items.fade_in,
-            track_index,
-            item_index,
-            fade_length,
-            fade_curve,
-        )
+        results = advanced_items.bulk_item_ops(ops)
+        failed = [
+            i for i, result in enumerate(results)
+            if result is None or result is False or result == -1 or result == []
+        ]
+        if len(results) < len(ops):
+            failed.extend(range(len(results), len(ops)))
+        return {
+            "status": "success" if not failed else "error",
+            "message": f"Ran {len(ops) - len(failed)} of {len(ops)} item operations",
+            "data": {"results": results, "failed": failed},
+        }
 
-    @mcp.tool("fade_out")
-    def fade_out(
-        ctx: Context,
-        track_index: int,
-        item_index: int,
-        fade_length: float,
-        fade_curve: int = 0,
+    @mcp.tool("get_item_fade_info")
+    @_tool_errors("Failed to get item fade info")
+    def get_item_fade_info(
+        ctx: Context, track_index: TrackIndex, item_index: int
     ) -> Dict[str, Any]:
         """
-        Add a fade-out to an item.
+        Get fade information for an item.
 
         Args:
             track_index (int): Index of the track containing the item
-            item_index (int): Index of the item to add fade-out to
-            fade_length (float): Length of the fade-out in seconds (use number, not string)
-            fade_curve (int): Fade curve shape (0-6, default 0: linear)
+            item_index (int): Index of the item to get fade info for
         """
-        return _handle_controller_operation(
-            f"Add {fade_length}s fade-out to item {item_index} on track {track_index}",
-            controller.advanced_items.fade_out,
-            track_index,
-            item_index,
-            fade_length,
-            fade_curve,
-        )
+        fade_info = advanced_items.get_item_fade_info(track_index, item_index)
+        return {
+            "status": "success",
+            "message": f"Fade info for item {item_index} on track {track_index}",
+            "data": fade_info,
+        }
+
+
+def _tool_description(fn, limit: int = MAX_TOOL_DESCRIPTION_LENGTH) -> str:
+    """Dedent a tool docstring and cap its length for list_tools."""
+    description = inspect.cleandoc(fn.__doc__ or "")
+    if len(description) > limit:
+        description = description[: limit - 3].rstrip() + "..."
+    return description
+
+
+def _compact_schema(schema: Any) -> Any:
+    """
+    Drop the generated "title" annotations from a JSON schema.
+
+    Pydantic titles every model and property ("Track Index" for
+    track_index); clients already show the property names, so the titles
+    only add to the tool list every session has to load.
+    """
+    if isinstance(schema, list):
+        return [_compact_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    compact = {}
+    for key, value in schema.items():
+        if key == "title":
+            continue
+        if key in ("properties", "$defs") and isinstance(value, dict):
+            compact[key] = {name: _compact_schema(sub) for name, sub in value.items()}
+        else:
+            compact[key] = _compact_schema(value)
+    return compact
+
+
+class ReaperMCP(FastMCP):
+    """
+    FastMCP server that keeps REAPER calls off the event loop.
+
+    Tools are written as plain functions; on registration each one is
+    wrapped in a coroutine that runs it on the reapy worker thread, so a
+    slow REAPER call no longer stalls other requests (pings, listings,
+    cancellations) while REAPER calls themselves stay serialised.
+
+    Tool descriptions are dedented and capped, and schemas are listed
+    without generated titles, to keep the tool list small. Tools in
+    READ_ONLY_TOOLS are annotated as read-only so clients may run them
+    in parallel. The compacted tool list is built once and reused until
+    a tool is added or removed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listed_tools: Optional[List[types.Tool]] = None
+
+    def add_tool(self, *args, **kwargs) -> None:
+        super().add_tool(*args, **kwargs)
+        self._listed_tools = None
+
+    def remove_tool(self, name: str) -> None:
+        super().remove_tool(name)
+        self._listed_tools = None
+
+    def tool(self, name: Optional[str] = None, **kwargs):
+        if name in READ_ONLY_TOOLS:
+            kwargs.setdefault(
+                "annotations",
+                types.ToolAnnotations(readOnlyHint=True, idempotentHint=True),
+            )
 
-    @mcp.tool("crossfade_items")
-    def crossfade_items(
-        ctx: Context,
-        track_index: int,
-        item1_index: int,
-        item2_index: int,
-        crossfade_length: float,
-    ) -> Dict[str, Any]:
-        """
-        Create a crossfade between two items.
+        def decorator(fn):
+            kwargs.setdefault("description", _tool_description(fn))
+            register = super(ReaperMCP, self).tool(name, **kwargs)
+            if inspect.iscoroutinefunction(fn):
+                return register(fn)
+
+            @functools.wraps(fn)
+            async def run_on_reapy_thread(*args, **kw):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    _REAPY_EXECUTOR, functools.partial(fn, *args, **kw)
+                )
 
-        Args:
-            track_index (int): Index of the track containing the items
-            item1_index (int): Index of the first item
-            item2_index (int): Index of the second item
-            crossfade_length (float): Length of the crossfade in seconds (use number, not string)
-        """
-        return _handle_controller_operation(
-            f"Create {crossfade_length}s crossfade between items {item1_index} and {item2_index}",
-            controller.advanced_items.crossfade_items,
-            track_index,
-            item1_index,
-            item2_index,
-            crossfade_length,
-        )
+            register(run_on_reapy_thread)
+            return fn
+
+        return decorator
+
+    async def list_tools(self) -> List[types.Tool]:
+        if self._listed_tools is None:
+            tools = await super().list_tools()
+            for tool in tools:
+                tool.inputSchema = _compact_schema(tool.inputSchema)
+                if tool.outputSchema is not None:
+                    tool.outputSchema = _compact_schema(tool.outputSchema)
+            self._listed_tools = tools
+        return list(self._listed_tools)
+
+
+class _RecordingMCP:
+    """Forwards tool registration to a server while recording each tool by name."""
+
+    def __init__(self, mcp: FastMCP, registry: Dict[str, Any]):
+        self._mcp = mcp
+        self._registry = registry
+
+    def tool(self, name: str, **kwargs):
+        register = self._mcp.tool(name, **kwargs)
+
+        def decorator(fn):
+            self._registry[name] = fn
+            return register(fn)
+
+        return decorator
+
+
+# Tools that only read project state
+READ_ONLY_TOOLS = frozenset(
+    {
+        "test_connection",
+        "get_track_color",
+        "get_track_count",
+        "get_track_volume",
+        "get_track_pan",
+        "get_track_mute",
+        "get_track_solo",
+        "get_track_arm",
+        "get_tempo",
+        "get_fx_param",
+        "get_fx_param_list",
+        "get_fx_list",
+        "get_fx_list_bulk",
+        "get_available_fx_list",
+        "get_track_peak_level",
+        "get_master_peak_level",
+        "get_master_track",
+        "get_midi_notes",
+        "find_midi_notes_by_pitch",
+        "get_selected_midi_item",
+        "get_item_properties",
+        "get_items_in_time_range",
+        "get_items_in_time_range_bulk",
+        "get_selected_items",
+        "get_sends",
+        "get_receives",
+        "debug_track_routing",
+        "get_track_routing_info",
+        "get_track_folder_depth",
+        "get_track_children",
+        "sidechain_route_analyzer",
+        "get_automation_points",
+        "get_automation_mode",
+        "get_item_fade_info",
+        "loudness_measure_track",
+        "loudness_measure_master",
+        "spectrum_analyzer_track",
+        "spectrum_analyzer_track_batch",
+        "phase_correlation",
+        "stereo_image_metrics",
+        "crest_factor_track",
+        "comprehensive_track_analysis",
+        "master_chain_analysis",
+    }
+)
 
-    @mcp.tool("reverse_item")
-    def reverse_item(ctx: Context, track_index: int, item_index: int) -> Dict[str, Any]:
-        """
-        Reverse an item.
+# Read-only tools whose answer changes without project edits (live meters)
+_LIVE_READ_TOOLS = frozenset({"get_track_peak_level", "get_master_peak_level"})
 
-        Args:
-            track_index (int): Index of the track containing the item
-            item_index (int): Index of the item to reverse
-        """
-        return _handle_controller_operation(
-            f"Reverse item {item_index} on track {track_index}",
-            controller.advanced_items.reverse_item,
-            track_index,
-            item_index,
-        )
 
-    @mcp.tool("get_item_fade_info")
-    def get_item_fade_info(
-        ctx: Context, track_index: int, item_index: int
+def _batch_read_key(tool_name: str, args: Dict[str, Any]) -> Optional[str]:
+    """Key under which a repeated read in one batch can share its result."""
+    if tool_name not in READ_ONLY_TOOLS or tool_name in _LIVE_READ_TOOLS:
+        return None
+    return json.dumps([tool_name, args], sort_keys=True, default=str)
+
+
+def _setup_batch_tools(mcp: FastMCP, registry: Dict[str, Any]) -> None:
+    """Setup the tool that runs several other tools in one request."""
+
+    @mcp.tool("batch_tool_call")
+    def batch_tool_call(
+        ctx: Context, calls: List[Dict[str, Any]], stop_on_error: bool = False
     ) -> Dict[str, Any]:
         """
-        Get fade information for an item.
+        Run several tools in one request, in order.
+
+        Args:
+            calls (List[Dict]): Tool calls, each {"tool": name, "args": {...}}
+            stop_on_error (bool): Skip the remaining calls after the first
+                failure. By default a failing call does not stop the ones after it.
+        """
+        results = []
+        failed = []
+        # Results of reads since the last write, so repeated reads run once
+        reads: Dict[str, Dict[str, Any]] = {}
+        # Only runs of read-only calls share a held reapy connection. Other
+        # tools may sleep (item creation, tempo retries), and a held
+        # connection would block REAPER's main loop while they do.
+        with contextlib.ExitStack() as held:
+            holding = False
+            for index, call in enumerate(calls):
+                tool_name = call.get("tool")
+                args = call.get("args", {})
+                handler = registry.get(tool_name)
+                if tool_name in READ_ONLY_TOOLS and not holding:
+                    held.enter_context(inside_reaper())
+                    holding = True
+                elif tool_name not in READ_ONLY_TOOLS and holding:
+                    held.close()
+                    holding = False
+                read_key = _batch_read_key(tool_name, args)
+                if handler is None:
+                    result = _create_error_response(f"Unknown tool: {tool_name}")
+                elif read_key in reads:
+                    result = reads[read_key]
+                else:
+                    try:
+                        result = handler(ctx, **args)
+                    except Exception as e:
+                        logger.error("Batch call to %s failed: %s", tool_name, e)
+                        result = _create_error_response(
+                            f"Failed to run {tool_name}: {str(e)}"
+                        )
+                    if read_key is None:
+                        reads.clear()
+                    else:
+                        reads[read_key] = result
+                results.append(result)
+                if not (isinstance(result, dict) and result.get("status") == "success"):
+                    failed.append(index)
+                    if stop_on_error:
+                        break
+
+        status = "error" if failed else "success"
+        return {
+            "status": status,
+            "message": f"Ran {len(results) - len(failed)} of {len(calls)} tool calls",
+            "data": {"results": results, "failed": failed},
+        }
+
+
+# Tool groups that can be registered independently, in registration order
+TOOL_GROUPS = {
+    "core": (
+        _setup_connection_tools,
+        _setup_track_tools,
+        _setup_project_tools,
+        _setup_marker_tools,
+        _setup_master_tools,
+    ),
+    "fx": (_setup_fx_tools,),
+    "midi": (_setup_midi_tools,),
+    "media": (_setup_audio_tools, _setup_advanced_item_tools),
+    "routing": (
+        _setup_routing_tools,
+        _setup_advanced_routing_tools,
+        _setup_sidechain_tools,
+    ),
+    "automation": (_setup_automation_tools,),
+    "analysis": (_setup_analysis_tools,),
+}
+
+# Named group sets accepted in REAPY_MCP_TOOL_GROUPS
+TOOL_GROUP_PRESETS = {
+    "all": tuple(TOOL_GROUPS),
+    "lean": ("core", "fx", "routing", "automation", "analysis"),
+}
+
+# Comma-separated group or preset names; unset registers every group
+TOOL_GROUPS_ENV = "REAPY_MCP_TOOL_GROUPS"
+
+
+def _setup_tool_group_tools(
+    mcp: FastMCP, recorder: _RecordingMCP, controller, enabled: Set[str]
+) -> None:
+    """Setup the tool that registers a tool group left out at startup."""
+
+    @mcp.tool("enable_tool_group")
+    async def enable_tool_group(ctx: Context, group: str) -> Dict[str, Any]:
+        """
+        Register the tools of a group that was not enabled at startup.
+
+        Args:
+            group (str): One of core, fx, midi, media, routing, automation, analysis
+        """
+        if group not in TOOL_GROUPS:
+            return _create_error_response(f"Unknown tool group: {group}")
+        if group in enabled:
+            return _create_success_response(f"Tool group {group} is already enabled")
+
+        for setup in TOOL_GROUPS[group]:
+            setup(recorder, controller)
+        enabled.add(group)
 
-        Args:
-            track_index (int): Index of the track containing the item
-            item_index (int): Index of the item to get fade info for
-        """
         try:
-            fade_info = controller.advanced_items.get_item_fade_info(
-                track_index, item_index
-            )
-            return _create_success_response(
-                f"Fade info for item {item_index} on track {track_index}: {fade_info}"
+            session = ctx.session
+        except (AttributeError, ValueError):
+            # Called outside a client request, nobody to notify
+            session = None
+        if session is not None:
+            await session.send_tool_list_changed()
+        return _create_success_response(f"Enabled tool group {group}")
+
+
+def _tool_groups_from_env() -> Set[str]:
+    """Resolve the tool groups selected by REAPY_MCP_TOOL_GROUPS."""
+    value = os.environ.get(TOOL_GROUPS_ENV, "").strip()
+    if not value:
+        return set(TOOL_GROUPS)
+
+    groups = set()
+    for name in (part.strip() for part in value.split(",")):
+        if name in TOOL_GROUP_PRESETS:
+            groups.update(TOOL_GROUP_PRESETS[name])
+        elif name in TOOL_GROUPS:
+            groups.add(name)
+        elif name:
+            logger.warning(
+                "Ignoring unknown tool group in %s: %s", TOOL_GROUPS_ENV, name
             )
-        except Exception as e:
-            logger.error(f"Failed to get item fade info: {str(e)}")
-            return _create_error_response(f"Failed to get item fade info: {str(e)}")
-
-
-def setup_mcp_tools(mcp: FastMCP, controller) -> None:
-    """Setup MCP tools for Reaper control."""
-    _setup_connection_tools(mcp, controller)
-    _setup_track_tools(mcp, controller)
-    _setup_project_tools(mcp, controller)
-    _setup_fx_tools(mcp, controller)
-    _setup_marker_tools(mcp, controller)
-    _setup_master_tools(mcp, controller)
-    _setup_midi_tools(mcp, controller)
-    _setup_audio_tools(mcp, controller)
-    _setup_routing_tools(mcp, controller)
-    _setup_advanced_routing_tools(mcp, controller)
-    _setup_sidechain_tools(mcp, controller)
-    _setup_automation_tools(mcp, controller)
-    _setup_advanced_item_tools(mcp, controller)
-    _setup_analysis_tools(mcp, controller)
+    return groups
+
+
+def setup_mcp_tools(
+    mcp: FastMCP, controller, groups: Optional[Set[str]] = None
+) -> None:
+    """
+    Setup MCP tools for Reaper control.
+
+    Args:
+        mcp: Server to register the tools on
+        controller: ReaperController the tools call into
+        groups: Names from TOOL_GROUPS to register. Defaults to the
+            REAPY_MCP_TOOL_GROUPS selection, or every group when unset.
+    """
+    if groups is None:
+        groups = _tool_groups_from_env()
+
+    # Every tool registered below can also be called through batch_tool_call
+    registry: Dict[str, Any] = {}
+    recorder = _RecordingMCP(mcp, registry)
+
+    enabled = set()
+    for group, setups in TOOL_GROUPS.items():
+        if group in groups:
+            for setup in setups:
+                setup(recorder, controller)
+            enabled.add(group)
+    _setup_batch_tools(mcp, registry)
+    if enabled != set(TOOL_GROUPS):
+        _setup_tool_group_tools(mcp, recorder, controller, enabled)
@@ -7,7 +7,8 @@ import os
 import requests
 import logging
 from pathlib import Path
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +18,24 @@ SAMPLES_DIR = Path("samples")
 SAMPLE_FILENAME = "sample.mp3"
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 30  # seconds
-CHUNK_SIZE = 8192
+CHUNK_SIZE = 1 << 20  # 1 MiB
 PROGRESS_LOG_INTERVAL = 10  # percentage
 RETRY_WAIT_MULTIPLIER = 5  # seconds
 PERCENTAGE_BASE = 100  # Base for percentage calculations
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Shared session so retries and repeated downloads reuse the open connection
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_WAIT_MULTIPLIER,
+            status_forcelist=RETRY_STATUS_CODES,
+        )
+    ),
+)
 
 
 def ensure_sample_file() -> str:
@@ -42,7 +57,7 @@ def ensure_sample_file() -> str:
 
         # Download if file doesn't exist
         if not local_path.exists():
-            logger.info(f"Downloading sample audio file from {SAMPLE_URL}")
+            logger.info("Downloading sample audio file from %s", SAMPLE_URL)
             _download_sample_file(local_path)
 
         if not local_path.exists():
@@ -51,56 +66,43 @@ def ensure_sample_file() -> str:
         return str(local_path)
 
     except Exception as e:
-        logger.error(f"Failed to ensure sample audio file: {e}")
+        logger.error("Failed to ensure sample audio file: %s", e)
         raise
 
 
 def _download_sample_file(local_path: Path) -> None:
-    """Download the sample audio file with retry logic."""
-    session = requests.Session()
-
-    for attempt in range(MAX_RETRIES):
+    """Download the sample audio file, retrying transient failures."""
+    with _SESSION.get(SAMPLE_URL, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
         try:
-            response = session.get(SAMPLE_URL, stream=True, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-
             _save_downloaded_file(response, local_path)
-            logger.info(f"Sample audio file downloaded to {local_path}")
-            break  # Success, exit retry loop
-
-        except requests.exceptions.RequestException as e:
-            if attempt < MAX_RETRIES - 1:  # Don't sleep on the last attempt
-                wait_time = (attempt + 1) * RETRY_WAIT_MULTIPLIER
-                logger.warning(
-                    f"Download attempt {attempt + 1} failed: {e}. Retrying in {wait_time} seconds..."
-                )
-                time.sleep(wait_time)
-            else:
-                raise  # Re-raise the last exception if all retries failed
+        except Exception:
+            # Don't leave a partial file behind to be mistaken for the sample
+            local_path.unlink(missing_ok=True)
+            raise
+    logger.info("Sample audio file downloaded to %s", local_path)
 
 
 def _save_downloaded_file(response: requests.Response, local_path: Path) -> None:
     """Save the downloaded file with progress tracking."""
     # Get total file size if available
     total_size = int(response.headers.get("content-length", 0))
+    # Bytes between progress reports, 0 if the size is unknown
+    report_step = total_size * PROGRESS_LOG_INTERVAL // PERCENTAGE_BASE
+    next_report = report_step
 
+    downloaded = 0
     with open(local_path, "wb") as f:
-        if total_size == 0:
-            # If we can't get the total size, just write the content
-            f.write(response.content)
-        else:
-            # Download with progress tracking
-            downloaded = 0
-            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    _log_download_progress(downloaded, total_size)
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            f.write(chunk)
+            downloaded += len(chunk)
+            if report_step and downloaded >= next_report:
+                _log_download_progress(downloaded, total_size)
+                next_report = (downloaded // report_step + 1) * report_step
 
 
 def _log_download_progress(downloaded: int, total_size: int) -> None:
-    """Log download progress at regular intervals."""
-    if total_size > 0:
-        progress = (downloaded / total_size) * PERCENTAGE_BASE
-        if int(progress) % PROGRESS_LOG_INTERVAL == 0:
-            logger.info(f"Download progress: {progress:.1f}%")
+    """Log download progress."""
+    logger.info(
+        "Download progress: %.1f%%", downloaded / total_size * PERCENTAGE_BASE
+    )
@@ -5,30 +5,147 @@ This module provides organized access to REAPER functionality through
 specialized controllers rather than a monolithic facade pattern.
 """
 
+import errno
+import importlib
 import os
+import select
+import socket
 import sys
 import logging
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Iterable, Optional
 
 # Add necessary paths for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
 repo_root = os.path.dirname(script_dir)
-sys.path.insert(0, script_dir)  # Add script directory to path
-
-# Import controllers using relative imports to avoid circular imports
-from controllers.track.track_controller import TrackController
-from controllers.fx.fx_controller import FXController
-from controllers.marker.marker_controller import MarkerController
-from controllers.midi.midi_controller import MIDIController
-from controllers.audio.audio_controller import AudioController
-from controllers.master.master_controller import MasterController
-from controllers.project.project_controller import ProjectController
-from controllers.routing.routing_controller import RoutingController
-from controllers.routing.advanced_routing_controller import AdvancedRoutingController
-from controllers.routing.sidechain_controller import SidechainController
-from controllers.automation.automation_controller import AutomationController
-from controllers.audio.advanced_item_controller import AdvancedItemController
-from controllers.analysis.analysis_controller import AnalysisController
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)  # Add script directory to path
+
+if TYPE_CHECKING:
+    from src.controllers.track.track_controller import TrackController
+    from src.controllers.fx.fx_controller import FXController
+    from src.controllers.marker.marker_controller import MarkerController
+    from src.controllers.midi.midi_controller import MIDIController
+    from src.controllers.audio.audio_controller import AudioController
+    from src.controllers.master.master_controller import MasterController
+    from src.controllers.project.project_controller import ProjectController
+    from src.controllers.routing.routing_controller import RoutingController
+    from src.controllers.routing.advanced_routing_controller import AdvancedRoutingController
+    from src.controllers.routing.sidechain_controller import SidechainController
+    from src.controllers.automation.automation_controller import AutomationController
+    from src.controllers.audio.advanced_item_controller import AdvancedItemController
+    from src.controllers.analysis.analysis_controller import AnalysisController
+
+
+# connect_ex results meaning a non-blocking connect is still in progress
+_CONNECT_PENDING = {
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    getattr(errno, "WSAEWOULDBLOCK", -1),
+}
+
+
+def _find_listening_port(
+    ports: Iterable[int], timeout: float = 1.0, host: str = "localhost"
+) -> Optional[int]:
+    """
+    Probe several ports at once and return one that accepts connections.
+
+    All connects are started non-blocking and awaited together, so the probe
+    takes at most one timeout instead of one timeout per port.
+
+    Args:
+        ports: Ports to probe
+        timeout: Seconds to wait for any of the connects to complete
+        host: Host to probe
+
+    Returns:
+        A port with a listening server, or None if none answered in time
+    """
+    pending = {}
+    try:
+        for port in ports:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            result = sock.connect_ex((host, port))
+            if result == 0:
+                sock.close()
+                return port
+            if result in _CONNECT_PENDING:
+                pending[sock] = port
+            else:
+                sock.close()
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Windows reports failed connects in the exceptional set
+            _, writable, failed = select.select(
+                [], list(pending), list(pending), remaining
+            )
+            for sock in set(writable) | set(failed):
+                port = pending.pop(sock)
+                error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                sock.close()
+                if error == 0 and sock in writable:
+                    return port
+        return None
+    finally:
+        for sock in pending:
+            sock.close()
+
+
+# Controller modules are imported on first use, so tool groups that are
+# never enabled do not pay for importing their controllers
+_CONTROLLER_MODULES = {
+    "track": ("src.controllers.track.track_controller", "TrackController"),
+    "fx": ("src.controllers.fx.fx_controller", "FXController"),
+    "marker": ("src.controllers.marker.marker_controller", "MarkerController"),
+    "midi": ("src.controllers.midi.midi_controller", "MIDIController"),
+    "audio": ("src.controllers.audio.audio_controller", "AudioController"),
+    "master": ("src.controllers.master.master_controller", "MasterController"),
+    "project": (
+        "src.controllers.project.project_controller",
+        "ProjectController",
+    ),
+    "routing": (
+        "src.controllers.routing.routing_controller",
+        "RoutingController",
+    ),
+    "advanced_routing": (
+        "src.controllers.routing.advanced_routing_controller",
+        "AdvancedRoutingController",
+    ),
+    "sidechain": (
+        "src.controllers.routing.sidechain_controller",
+        "SidechainController",
+    ),
+    "automation": (
+        "src.controllers.automation.automation_controller",
+        "AutomationController",
+    ),
+    "advanced_items": (
+        "src.controllers.audio.advanced_item_controller",
+        "AdvancedItemController",
+    ),
+    "analysis": (
+        "src.controllers.analysis.analysis_controller",
+        "AnalysisController",
+    ),
+}
+_controller_classes = {}
+
+
+def _load_controller_class(controller_type: str):
+    """Import and return the controller class for controller_type."""
+    controller_class = _controller_classes.get(controller_type)
+    if controller_class is None:
+        module_name, class_name = _CONTROLLER_MODULES[controller_type]
+        controller_class = getattr(importlib.import_module(module_name), class_name)
+        _controller_classes[controller_type] = controller_class
+    return controller_class
 
 
 class ReaperControllerFactory:
@@ -51,8 +168,9 @@ class ReaperControllerFactory:
         if debug:
             self.logger.setLevel(logging.INFO)
 
-        # Connection status
+        # Connection status and when it was last checked
         self._connection_verified = None
+        self._connection_checked_at = 0.0
 
         # Initialize controllers lazily
         self._controllers = {}
@@ -61,22 +179,7 @@ class ReaperControllerFactory:
         """Get or create a controller instance with error handling."""
         if controller_type not in self._controllers:
             try:
-                controller_class = {
-                    "track": TrackController,
-                    "fx": FXController,
-                    "marker": MarkerController,
-                    "midi": MIDIController,
-                    "audio": AudioController,
-                    "master": MasterController,
-                    "project": ProjectController,
-                    "routing": RoutingController,
-                    "advanced_routing": AdvancedRoutingController,
-                    "sidechain": SidechainController,
-                    "automation": AutomationController,
-                    "advanced_items": AdvancedItemController,
-                    "analysis": AnalysisController,
-                }[controller_type]
-
+                controller_class = _load_controller_class(controller_type)
                 self._controllers[controller_type] = controller_class(debug=self.debug)
 
             except Exception as e:
@@ -97,108 +200,118 @@ class ReaperControllerFactory:
             def __init__(self, name: str):
                 self.name = name
                 self.logger = logging.getLogger(f"Placeholder{name}")
+                self._warned = set()
 
             def __getattr__(self, method_name: str):
+                if method_name.startswith("__"):
+                    raise AttributeError(method_name)
+
                 def method(*args, **kwargs):
-                    self.logger.warning(
-                        f"REAPER not connected. {self.name}.{method_name}() unavailable."
-                    )
+                    # Warn once per method, repeated calls only at debug level
+                    if method_name in self._warned:
+                        self.logger.debug(
+                            "REAPER not connected. %s.%s() unavailable.",
+                            self.name,
+                            method_name,
+                        )
+                    else:
+                        self._warned.add(method_name)
+                        self.logger.warning(
+                            f"REAPER not connected. {self.name}.{method_name}() unavailable."
+                        )
                     return None
 
+                # Cache on the instance so later lookups skip __getattr__
+                self.__dict__[method_name] = method
                 return method
 
         return PlaceholderController(controller_type.title() + "Controller")
 
     @property
-    def track(self) -> TrackController:
+    def track(self) -> "TrackController":
         """Get the track controller for track operations."""
         return self._get_controller("track")
 
     @property
-    def fx(self) -> FXController:
+    def fx(self) -> "FXController":
         """Get the FX controller for effects operations."""
         return self._get_controller("fx")
 
     @property
-    def marker(self) -> MarkerController:
+    def marker(self) -> "MarkerController":
         """Get the marker controller for timeline operations."""
         return self._get_controller("marker")
 
     @property
-    def midi(self) -> MIDIController:
+    def midi(self) -> "MIDIController":
         """Get the MIDI controller for MIDI operations."""
         return self._get_controller("midi")
 
     @property
-    def audio(self) -> AudioController:
+    def audio(self) -> "AudioController":
         """Get the audio controller for audio item operations."""
         return self._get_controller("audio")
 
     @property
-    def master(self) -> MasterController:
+    def master(self) -> "MasterController":
         """Get the master controller for master track operations."""
         return self._get_controller("master")
 
     @property
-    def project(self) -> ProjectController:
+    def project(self) -> "ProjectController":
         """Get the project controller for project-level operations."""
         return self._get_controller("project")
 
     @property
-    def routing(self) -> RoutingController:
+    def routing(self) -> "RoutingController":
         """Get the routing controller for send/receive operations."""
         return self._get_controller("routing")
 
     @property
-    def advanced_routing(self) -> AdvancedRoutingController:
+    def advanced_routing(self) -> "AdvancedRoutingController":
         """Get the advanced routing controller for complex routing operations."""
         return self._get_controller("advanced_routing")
 
     @property
-    def sidechain(self) -> SidechainController:
+    def sidechain(self) -> "SidechainController":
         """Get the sidechain controller for sidechain and bus routing operations."""
         return self._get_controller("sidechain")
 
     @property
-    def automation(self) -> AutomationController:
+    def automation(self) -> "AutomationController":
         """Get the automation controller for automation operations."""
         return self._get_controller("automation")
 
     @property
-    def advanced_items(self) -> AdvancedItemController:
+    def advanced_items(self) -> "AdvancedItemController":
         """Get the advanced items controller for complex item operations."""
         return self._get_controller("advanced_items")
 
     @property
-    def analysis(self) -> AnalysisController:
+    def analysis(self) -> "AnalysisController":
         """Get the analysis controller for loudness and spectrum analysis."""
         return self._get_controller("analysis")
 
     def verify_connection(self) -> bool:
-        """Verify connection to REAPER."""
-        if self._connection_verified is not None:
+        """Verify connection to REAPER, reusing a result younger than the TTL."""
+        from constants import CONNECTION_CHECK_TTL
+
+        now = time.monotonic()
+        if (
+            self._connection_verified is not None
+            and now - self._connection_checked_at < CONNECTION_CHECK_TTL
+        ):
             return self._connection_verified
 
+        self._connection_checked_at = now
         try:
-            import socket
             from constants import REAPER_DEFAULT_PORTS
 
-            ports_to_try = REAPER_DEFAULT_PORTS
-
-            for port in ports_to_try:
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(1.0)
-                    result = sock.connect_ex(("localhost", port))
-                    sock.close()
-
-                    if result == 0:
-                        self.logger.info(f"REAPER server found on port {port}")
-                        self._connection_verified = True
-                        return True
-
-                except Exception:
-                    continue
+            port = _find_listening_port(REAPER_DEFAULT_PORTS)
+            if port is not None:
+                self.logger.info(f"REAPER server found on port {port}")
+                self._connection_verified = True
+                return True
 
             self.logger.warning(
                 "REAPER connection failed: No server found on common ports (2306-2309)"
@@ -2,28 +2,28 @@ import logging
 import os
 import sys
 
-from mcp.server.fastmcp import FastMCP
-
 # Add necessary paths for imports - handle both direct execution and module execution
 script_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(script_dir)
-sys.path.insert(0, script_dir)  # Add script directory to path
-sys.path.insert(0, parent_dir)  # Add parent directory to path
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)  # Add script directory to path
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)  # Add parent directory to path
 
 # Try importing with different approaches for module vs direct execution
 try:
     # Try relative imports first (when run as module)
     from .reaper_controller import ReaperController
-    from .mcp_tools import setup_mcp_tools
+    from .mcp_tools import ReaperMCP, setup_mcp_tools
 except ImportError:
     try:
         # Try absolute imports from src package
         from src.reaper_controller import ReaperController
-        from src.mcp_tools import setup_mcp_tools
+        from src.mcp_tools import ReaperMCP, setup_mcp_tools
     except ImportError:
         # Fall back to direct imports (when run directly)
         from reaper_controller import ReaperController
-        from mcp_tools import setup_mcp_tools
+        from mcp_tools import ReaperMCP, setup_mcp_tools
 
 
 def main():
@@ -40,7 +40,7 @@ def main():
         controller = ReaperController(debug=False)
 
         # Create MCP server
-        mcp = FastMCP("Reaper Control")
+        mcp = ReaperMCP("Reaper Control")
 
         # Setup MCP tools
         setup_mcp_tools(mcp, controller)
@@ -8,6 +8,7 @@ import logging
 from typing import Optional, Union, Tuple, Dict
 
 from ..core.reapy_bridge import get_reapy, get_rpr
+from ..core.write_shadow import project_change_count
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,10 @@ DEFAULT_BPM = 120.0
 DEFAULT_TIME_SIG_NUM = 4
 DEFAULT_TIME_SIG_DEN = 4
 
+# Last (beats per measure, tempo) read from REAPER and the project state
+# change count it was read at
+_time_map_cache = {"token": None, "value": None}
+
 
 def parse_position(position_input: Union[str, float]) -> Optional[float]:
     """
@@ -99,17 +104,12 @@ def time_to_measure_beat(time_seconds: float) -> Tuple[int, float, float]:
         Tuple[int, float, float]: (measure, beat, beat_fraction)
     """
     try:
-        reapy = get_reapy()
-        project = reapy.Project()
-
-        # Get time signature info
-        time_signature = project.time_signature
-        beats_per_measure = time_signature[0] / time_signature[1]
+        beats_per_measure, tempo = _project_time_map()
 
         # Convert time to beats
         from constants import SECONDS_PER_MINUTE
 
-        beats = time_seconds * project.tempo / SECONDS_PER_MINUTE
+        beats = time_seconds * tempo / SECONDS_PER_MINUTE
 
         # Calculate measure and beat
         measure = int(beats / beats_per_measure) + 1
@@ -123,6 +123,24 @@ def time_to_measure_beat(time_seconds: float) -> Tuple[int, float, float]:
         return 1, 1, 0.0
 
 
+def _project_time_map() -> Tuple[float, float]:
+    """
+    Get the project's beats per measure and tempo.
+
+    The values are reused until the project state change count moves, so
+    repeated conversions cost one query instead of re-reading the time map.
+    """
+    token = project_change_count()
+    if token is not None and token == _time_map_cache["token"]:
+        return _time_map_cache["value"]
+
+    project = get_reapy().Project()
+    time_signature = project.time_signature
+    value = (time_signature[0] / time_signature[1], project.tempo)
+    _time_map_cache.update(token=token, value=value)
+    return value
+
+
 def measure_beat_to_time(measure: int, beat: float) -> float:
     """
     Convert measure:beat format to time in seconds.
@@ -135,12 +153,7 @@ def measure_beat_to_time(measure: int, beat: float) -> float:
         float: Time in seconds
     """
     try:
-        reapy = get_reapy()
-        project = reapy.Project()
-
-        # Get time signature info
-        time_signature = project.time_signature
-        beats_per_measure = time_signature[0] / time_signature[1]
+        beats_per_measure, tempo = _project_time_map()
 
         # Calculate total beats
         total_beats = (measure - 1) * beats_per_measure + (beat - 1)
@@ -148,7 +161,7 @@ def measure_beat_to_time(measure: int, beat: float) -> float:
         # Convert beats to time
         from constants import SECONDS_PER_MINUTE
 
-        time_seconds = total_beats * SECONDS_PER_MINUTE / project.tempo
+        time_seconds = total_beats * SECONDS_PER_MINUTE / tempo
 
         return time_seconds
 
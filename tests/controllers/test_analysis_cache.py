@@ -0,0 +1,115 @@
+"""
+Tests for the project-state keyed analysis result cache.
+"""
+
+from types import SimpleNamespace
+
+from src.controllers.analysis import analysis_cache
+from src.controllers.analysis.analysis_cache import AnalysisCache
+
+
+class CountingCompute:
+    def __init__(self, result="result"):
+        self.calls = 0
+        self.result = result
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+def test_hit_within_same_project_state():
+    cache = AnalysisCache(state_token=lambda: 7)
+    compute = CountingCompute()
+
+    assert cache.get_or_compute(("phase_correlation", 0, 1.0), compute) == "result"
+    assert cache.get_or_compute(("phase_correlation", 0, 1.0), compute) == "result"
+    assert compute.calls == 1
+
+
+def test_project_edit_invalidates():
+    state = {"count": 1}
+    cache = AnalysisCache(state_token=lambda: state["count"])
+    compute = CountingCompute()
+
+    cache.get_or_compute(("crest_factor_track", 0, 1.0), compute)
+    state["count"] = 2
+    cache.get_or_compute(("crest_factor_track", 0, 1.0), compute)
+    assert compute.calls == 2
+
+
+def test_bypassed_without_state_token():
+    cache = AnalysisCache(state_token=lambda: None)
+    compute = CountingCompute()
+
+    cache.get_or_compute(("stereo_image_metrics", 0, 1.0), compute)
+    cache.get_or_compute(("stereo_image_metrics", 0, 1.0), compute)
+    assert compute.calls == 2
+    assert len(cache) == 0
+
+
+def test_failed_results_not_cached():
+    cache = AnalysisCache(state_token=lambda: 1)
+    compute = CountingCompute(result=None)
+
+    cache.get_or_compute(("master_chain_analysis", 10.0), compute)
+    cache.get_or_compute(("master_chain_analysis", 10.0), compute)
+    assert compute.calls == 2
+
+
+def test_least_recently_used_entry_evicted():
+    cache = AnalysisCache(maxsize=2, state_token=lambda: 1)
+    first = CountingCompute()
+
+    cache.get_or_compute(("a",), first)
+    cache.get_or_compute(("b",), CountingCompute())
+    cache.get_or_compute(("a",), first)
+    cache.get_or_compute(("c",), CountingCompute())
+
+    assert len(cache) == 2
+    cache.get_or_compute(("a",), first)
+    assert first.calls == 1
+
+
+def test_discard_drops_key_under_any_state():
+    state = {"count": 1}
+    cache = AnalysisCache(state_token=lambda: state["count"])
+    compute = CountingCompute()
+
+    cache.get_or_compute(("track_loudness", 0), compute)
+    state["count"] = 2
+    cache.get_or_compute(("track_loudness", 0), compute)
+    cache.get_or_compute(("track_loudness", 1), compute)
+
+    cache.discard(("track_loudness", 0))
+    assert len(cache) == 1
+    cache.get_or_compute(("track_loudness", 0), compute)
+    assert compute.calls == 4
+
+
+def _fake_rpr(play_state=0, tracks=()):
+    """RPR stand-in; tracks holds (rec_arm, rec_mon) per track."""
+    info = {"I_RECARM": 0, "I_RECMON": 1}
+    return SimpleNamespace(
+        GetPlayState=lambda: play_state,
+        GetProjectStateChangeCount=lambda proj: 42,
+        CountTracks=lambda proj: len(tracks),
+        GetTrack=lambda proj, i: tracks[i],
+        GetMediaTrackInfo_Value=lambda track, name: track[info[name]],
+    )
+
+
+def test_state_token_skipped_while_armed_track_monitors(monkeypatch):
+    rpr = _fake_rpr(tracks=((0, 1), (1, 0)))
+    monkeypatch.setattr(analysis_cache, "get_rpr", lambda: rpr)
+    assert analysis_cache.project_state_token() == 42
+
+    rpr = _fake_rpr(tracks=((0, 1), (1, 2)))
+    monkeypatch.setattr(analysis_cache, "get_rpr", lambda: rpr)
+    assert analysis_cache.project_state_token() is None
+
+
+def test_state_token_skipped_while_playing(monkeypatch):
+    rpr = _fake_rpr(play_state=analysis_cache.PLAY_STATE_PLAYING)
+    monkeypatch.setattr(analysis_cache, "get_rpr", lambda: rpr)
+    assert analysis_cache.project_state_token() is None
@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import math
 
+from src.controllers.analysis.analysis_cache import AnalysisCache
 from src.controllers.analysis.analysis_controller import AnalysisController
 from src.controllers.analysis.loudness_controller import LoudnessController, LoudnessMetrics
 from src.controllers.analysis.spectrum_controller import (
@@ -126,6 +127,24 @@ class TestLoudnessController:
         assert result is None
 
 
+    def test_gain_change_invalidates_measurement(self):
+        """Test normalizing after matching re-measures the track whose gain changed."""
+        controller = LoudnessController()
+        controller._metrics_cache = AnalysisCache(state_token=lambda: 1)
+        project = Mock(n_tracks=2, tracks=[Mock(volume=1.0), Mock(volume=1.0)])
+        metrics = LoudnessMetrics(-20.0, -18.0, -19.0, 4.0, -6.0)
+
+        with patch('src.controllers.analysis.loudness_controller.get_reapy') as get_reapy, \
+                patch.object(controller, 'measure_track_loudness', return_value=metrics) as measure:
+            get_reapy.return_value.Project.return_value = project
+            assert controller.match_loudness_between_tracks(0, 1) is True
+            assert controller.normalize_track_lufs(0, target_lufs=-20.0) is True
+            assert controller.normalize_track_lufs(1, target_lufs=-20.0) is True
+
+        # Track 0 is measured again after match changed its gain; the
+        # untouched target track 1 reuses its measurement
+        assert measure.call_count == 3
+
 class TestSpectrumController:
     """Test spectrum analysis and stereo imaging."""
     
@@ -210,6 +229,15 @@ class TestSpectrumController:
         c_weight_1k = controller._c_weighting_db(1000.0)
         assert -2.0 < c_weight_1k < 2.0
 
+    def test_spectrum_context_is_cached(self):
+        """Test frequency bins and weighting curves are shared between calls."""
+        first = SpectrumController._get_spectrum_context(48000.0, 1024, WeightingType.A_WEIGHTING)
+        second = SpectrumController._get_spectrum_context(48000.0, 1024, WeightingType.A_WEIGHTING)
+
+        assert first is second
+        assert len(first.frequencies) == len(first.weight_curve) == 513
+        assert first.weight_curve[0] == -60.0
+
 
 class TestAnalysisController:
     """Test main analysis controller integration."""
@@ -312,6 +340,36 @@ class TestAnalysisController:
         assert 'spotify' in streaming
         assert 'apple_music' in streaming
 
+    def test_master_chain_analysis_subset_skips_spectrum(self):
+        """Test requesting only loudness skips spectrum and dynamics analysis."""
+        controller = AnalysisController()
+        controller.loudness = Mock()
+        controller.spectrum = Mock()
+        controller.loudness.loudness_measure_master.return_value = LoudnessMetrics(
+            integrated_lufs=-23.0,
+            short_term_lufs=-21.0,
+            momentary_lufs=-22.0,
+            lra=4.0,
+            true_peak_dbfs=-2.0,
+            gate_enabled=True,
+            measurement_time=10.0,
+        )
+
+        result = controller.master_chain_analysis(what=["lufs", "true_peak"])
+
+        assert list(result) == ['loudness']
+        assert result['loudness']['broadcast_compliant']['ebu_r128']
+        controller.spectrum.spectrum_analyzer_master.assert_not_called()
+        controller.spectrum.crest_factor_master.assert_not_called()
+
+    def test_master_chain_analysis_rejects_unknown_section(self):
+        """Test unknown section names fail instead of silently running nothing."""
+        controller = AnalysisController()
+        controller.loudness = Mock()
+
+        assert controller.master_chain_analysis(what=["bogus"]) is None
+        controller.loudness.loudness_measure_master.assert_not_called()
+
     def test_frequency_band_energy_calculation(self):
         """Test frequency band energy calculation."""
         controller = AnalysisController(debug=True)
@@ -371,4 +429,4 @@ class TestAnalysisController:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
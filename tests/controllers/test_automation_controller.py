@@ -0,0 +1,65 @@
+"""
+Tests for bulk automation point insertion.
+"""
+
+import contextlib
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.controllers.automation.automation_controller import AutomationController
+
+MODULE = "src.controllers.automation.automation_controller"
+
+
+@pytest.fixture
+def controller_and_rpr():
+    rpr = Mock()
+    rpr.GetTrackEnvelopeByName.return_value = "(TrackEnvelope*)0x1"
+    rpr.InsertEnvelopePoint.return_value = True
+    # Like reapy 0.10's Track: no volume_envelope/pan_envelope attributes
+    project = Mock(tracks=[Mock(spec=["id"], id="(MediaTrack*)0x2")])
+    reapy = Mock(reascript_api=rpr)
+    reapy.Project.return_value = project
+
+    with patch(f"{MODULE}.get_reapy", return_value=reapy), \
+            patch(f"{MODULE}.inside_reaper", contextlib.nullcontext):
+        yield AutomationController(), rpr
+
+
+def test_add_automation_points_resolves_envelope_by_name(controller_and_rpr):
+    controller, rpr = controller_and_rpr
+
+    added = controller.add_automation_points(0, "volume", [(0.0, 0.5, 0), (1.0, 1.0, 1)])
+
+    assert added == 2
+    rpr.GetTrackEnvelopeByName.assert_called_once_with("(MediaTrack*)0x2", "VOLENV")
+    assert rpr.InsertEnvelopePoint.call_count == 2
+    rpr.Envelope_SortPoints.assert_called_once_with("(TrackEnvelope*)0x1")
+
+
+def test_add_automation_points_counts_only_inserted_points(controller_and_rpr):
+    controller, rpr = controller_and_rpr
+    rpr.InsertEnvelopePoint.side_effect = [True, False, True]
+
+    added = controller.add_automation_points(
+        0, "pan", [(0.0, 0.0, 0), (1.0, 0.5, 0), (2.0, 1.0, 0)]
+    )
+
+    assert added == 2
+
+
+def test_add_automation_points_missing_envelope(controller_and_rpr):
+    controller, rpr = controller_and_rpr
+    rpr.GetTrackEnvelopeByName.return_value = -1
+
+    assert controller.add_automation_points(0, "volume", [(0.0, 0.5, 0)]) == -1
+    rpr.InsertEnvelopePoint.assert_not_called()
+
+
+def test_add_automation_points_unknown_envelope(controller_and_rpr):
+    controller, rpr = controller_and_rpr
+
+    assert controller.add_automation_points(0, "tempo", [(0.0, 0.5, 0)]) == -1
+    rpr.GetTrackEnvelopeByName.assert_not_called()
+    rpr.InsertEnvelopePoint.assert_not_called()
@@ -0,0 +1,29 @@
+"""
+Tests for the parallel REAPER port probe.
+"""
+
+import socket
+import time
+
+from src.reaper_controller import _find_listening_port
+
+
+def _unused_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_finds_the_listening_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+
+        assert _find_listening_port([_unused_port(), port], host="127.0.0.1") == port
+
+
+def test_returns_none_when_nothing_listens():
+    start = time.monotonic()
+    assert _find_listening_port([_unused_port(), _unused_port()], host="127.0.0.1") is None
+    assert time.monotonic() - start < 1.0
@@ -0,0 +1,39 @@
+"""
+Tests for reuse of the installed-FX catalog between calls.
+"""
+
+import os
+
+from src.controllers.fx.fx_controller import FXController
+
+
+def _write_plugin_db(tmp_path, names):
+    reaper_dir = tmp_path / "REAPER"
+    reaper_dir.mkdir(exist_ok=True)
+    db = reaper_dir / "reaper-vstplugins64.ini"
+    db.write_text(
+        "[vstcache]\n"
+        + "".join(f"plugin{i}.dll=00,{i},{name}\n" for i, name in enumerate(names))
+    )
+    return db
+
+
+def test_catalog_reused_until_plugin_db_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    db = _write_plugin_db(tmp_path, ["ReaComp", "ReaEQ", "ReaComp"])
+    controller = FXController()
+    parsed = []
+    parse = controller._parse_plugin_file
+    monkeypatch.setattr(
+        controller, "_parse_plugin_file", lambda path: parsed.append(path) or parse(path)
+    )
+
+    assert controller.get_available_fx_list() == ["ReaComp", "ReaEQ"]
+    assert controller.get_available_fx_list() == ["ReaComp", "ReaEQ"]
+    assert len(parsed) == 1
+
+    _write_plugin_db(tmp_path, ["ReaLimit"])
+    stat = db.stat()
+    os.utime(db, (stat.st_atime, stat.st_mtime + 10))
+    assert controller.get_available_fx_list() == ["ReaLimit"]
+    assert len(parsed) == 2
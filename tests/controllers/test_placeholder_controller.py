@@ -0,0 +1,18 @@
+"""
+Tests for the placeholder used when a controller cannot be created.
+"""
+
+import logging
+
+from src.reaper_controller import ReaperControllerFactory
+
+
+def test_placeholder_methods_are_cached_and_warn_once(caplog):
+    placeholder = ReaperControllerFactory()._create_placeholder_controller("track")
+
+    with caplog.at_level(logging.WARNING):
+        assert placeholder.create_track("Drums") is None
+        assert placeholder.create_track("Bass") is None
+
+    assert placeholder.create_track is placeholder.create_track
+    assert len(caplog.records) == 1
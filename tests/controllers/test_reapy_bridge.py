@@ -0,0 +1,56 @@
+"""
+Tests for the held-connection helper in the reapy bridge.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import reapy_bridge
+
+
+class RecordingContext:
+    def __init__(self):
+        self.exits = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.exits.append(exc_type)
+        return False
+
+
+@pytest.fixture
+def held():
+    context = RecordingContext()
+    reapy_bridge._reapy_instance = SimpleNamespace(inside_reaper=lambda: context)
+    yield context
+    reapy_bridge.reset_instances()
+
+
+def test_held_context_exits_cleanly(held):
+    with reapy_bridge.inside_reaper():
+        pass
+    assert held.exits == [None]
+
+
+def test_held_context_sees_the_error(held):
+    with pytest.raises(ValueError):
+        with reapy_bridge.inside_reaper():
+            raise ValueError("boom")
+    assert held.exits == [ValueError]
+
+
+def test_block_runs_when_connection_cannot_be_held():
+    def unavailable():
+        raise ConnectionError("REAPER not reachable")
+
+    reapy_bridge._reapy_instance = SimpleNamespace(inside_reaper=unavailable)
+    try:
+        ran = []
+        with reapy_bridge.inside_reaper():
+            ran.append(True)
+        assert ran == [True]
+    finally:
+        reapy_bridge.reset_instances()
@@ -0,0 +1,29 @@
+"""
+Tests for the project-state keyed time map used by position conversions.
+"""
+
+from types import SimpleNamespace
+
+import src.time.conversion as conversion
+
+
+def test_time_map_read_once_per_project_state(monkeypatch):
+    state = {"count": 1, "reads": 0}
+
+    def make_project():
+        state["reads"] += 1
+        return SimpleNamespace(time_signature=(4, 4), tempo=120.0)
+
+    monkeypatch.setattr(conversion, "project_change_count", lambda: state["count"])
+    monkeypatch.setattr(
+        conversion, "get_reapy", lambda: SimpleNamespace(Project=make_project)
+    )
+    monkeypatch.setattr(conversion, "_time_map_cache", {"token": None, "value": None})
+
+    assert conversion.measure_beat_to_time(2, 1) == 0.5
+    assert conversion.measure_beat_to_time(3, 1) == 1.0
+    assert state["reads"] == 1
+
+    state["count"] = 2
+    conversion.measure_beat_to_time(2, 1)
+    assert state["reads"] == 2
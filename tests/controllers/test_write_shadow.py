@@ -0,0 +1,38 @@
+"""
+Tests for the project-state keyed shadow of written settings.
+"""
+
+from src.core.write_shadow import WriteShadow
+
+
+def test_repeated_write_is_noop_within_same_project_state():
+    shadow = WriteShadow(state_token=lambda: 3)
+
+    assert not shadow.is_current("tempo", 120.0)
+    shadow.record("tempo", 120.0)
+    assert shadow.is_current("tempo", 120.0)
+    assert not shadow.is_current("tempo", 90.0)
+
+
+def test_project_edit_invalidates():
+    state = {"count": 1}
+    shadow = WriteShadow(state_token=lambda: state["count"])
+
+    shadow.record("volume", 0.5)
+    state["count"] = 2
+    assert not shadow.is_current("volume", 0.5)
+
+
+def test_bypassed_without_state_token():
+    shadow = WriteShadow(state_token=lambda: None)
+
+    shadow.record("pan", 0.0)
+    assert not shadow.is_current("pan", 0.0)
+
+
+def test_forget_drops_value():
+    shadow = WriteShadow(state_token=lambda: 1)
+
+    shadow.record("mute", True)
+    shadow.forget("mute")
+    assert not shadow.is_current("mute", True)
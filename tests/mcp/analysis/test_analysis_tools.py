@@ -0,0 +1,102 @@
+import base64
+import pytest
+from array import array
+from types import SimpleNamespace
+from src.mcp_tools import setup_mcp_tools, FastMCP
+
+class DummyMCP(FastMCP):
+    def __init__(self):
+        super().__init__("reaper-reapy-mcp")
+        self.tools = {}
+    def tool(self, name):
+        def decorator(fn):
+            self.tools[name] = fn
+            return fn
+        return decorator
+
+@pytest.fixture
+def mcp_and_controller():
+    metrics = SimpleNamespace(integrated_lufs=-18.0, lra=4.0, true_peak_dbfs=-1.5)
+    spectrum = SimpleNamespace(
+        frequencies=[0.0, 6000.0, 12000.0, 18000.0],
+        magnitudes_db=[-200.0, -12.345, 0.0, 30.0],
+        sample_rate=48000.0,
+        fft_size=8,
+    )
+    controller = SimpleNamespace(
+        analysis=SimpleNamespace(
+            loudness=SimpleNamespace(
+                loudness_measure_track=lambda t, w, g: metrics,
+                loudness_measure_master=lambda w, g: metrics,
+                normalize_track_lufs=lambda t, l, c: True,
+                match_loudness_between_tracks=lambda s, t, m: True,
+            ),
+            spectrum=SimpleNamespace(
+                spectrum_analyzer_track=lambda t, w, f, wt: spectrum,
+                spectrum_analyzer_tracks=lambda ts, w, f, wt: {t: spectrum for t in ts if t < 2},
+                phase_correlation=lambda t, w: 0.9,
+                stereo_image_metrics=lambda t, w: SimpleNamespace(
+                    correlation=0.9, width=1.2, mid_level_db=-12.0, side_level_db=-24.0
+                ),
+                crest_factor_track=lambda t, w: SimpleNamespace(
+                    crest_factor_db=14.0, peak_db=-6.0, rms_db=-20.0
+                ),
+            ),
+            write_volume_automation_to_target_lufs=lambda t, l, s: True,
+            clip_gain_adjust=lambda t, i, g: True,
+            comprehensive_track_analysis=lambda t, w: {"loudness": {}},
+            master_chain_analysis=lambda w, what: {"loudness": {}},
+        )
+    )
+    mcp = DummyMCP()
+    setup_mcp_tools(mcp, controller)
+    return mcp, controller
+
+@pytest.mark.parametrize("tool,kwargs", [
+    ("loudness_measure_track", {"track_index": 0}),
+    ("loudness_measure_master", {}),
+    ("spectrum_analyzer_track", {"track_index": 0, "weighting": "A"}),
+    ("spectrum_analyzer_track_batch", {"track_indices": [0, 1]}),
+    ("phase_correlation", {"track_index": 0}),
+    ("stereo_image_metrics", {"track_index": 0}),
+    ("crest_factor_track", {"track_index": 0}),
+    ("normalize_track_lufs", {"track_index": 0}),
+    ("match_loudness_between_tracks", {"source_track": 0, "target_track": 1}),
+    ("write_volume_automation_to_target_lufs", {"track_index": 0}),
+    ("clip_gain_adjust", {"track_index": 0, "item_id": 0, "gain_db": 1.0}),
+    ("comprehensive_track_analysis", {"track_index": 0}),
+    ("master_chain_analysis", {}),
+    ("master_chain_analysis", {"what": ["lufs", "true_peak"]}),
+])
+def test_analysis_tools_success(mcp_and_controller, tool, kwargs):
+    mcp, _ = mcp_and_controller
+    fn = mcp.tools[tool]
+    res = fn(None, **kwargs)
+    assert isinstance(res, dict)
+    assert res.get("status") in {"success", "error"}
+    assert "message" in res
+
+def test_spectrum_bins_are_packed_as_millibels(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["spectrum_analyzer_track"](None, track_index=0, include_bins=True)
+    data = res["data"]
+    assert data["bin_count"] == 4
+    assert data["bin_hz"] == 6000.0
+    millibels = array("h")
+    millibels.frombytes(base64.b64decode(data["magnitudes"]))
+    assert list(millibels) == [-12000, -1234, 0, 1200]
+
+def test_spectrum_bins_are_opt_in(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["spectrum_analyzer_track"](None, track_index=0)
+    assert "data" not in res
+
+def test_spectrum_batch_reports_missing_tracks(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["spectrum_analyzer_track_batch"](
+        None, track_indices=[0, 1, 5], include_bins=True
+    )
+    assert res["status"] == "success"
+    assert sorted(res["data"]["tracks"]) == [0, 1]
+    assert res["data"]["tracks"][0]["bin_count"] == 4
+    assert res["data"]["failed"] == [5]
@@ -0,0 +1,57 @@
+import pytest
+from types import SimpleNamespace
+from src.mcp_tools import setup_mcp_tools, FastMCP
+
+class DummyMCP(FastMCP):
+    def __init__(self):
+        super().__init__("reaper-reapy-mcp")
+        self.tools = {}
+    def tool(self, name):
+        def decorator(fn):
+            self.tools[name] = fn
+            return fn
+        return decorator
+
+@pytest.fixture
+def mcp_and_controller():
+    controller = SimpleNamespace(
+        advanced_items=SimpleNamespace(
+            split_item=lambda t, i, st: [0, 1],
+            glue_items=lambda t, ii: 0,
+            fade_in=lambda t, i, fl, fc: True,
+            fade_out=lambda t, i, fl, fc: True,
+            crossfade_items=lambda t, i1, i2, cl: True,
+            reverse_item=lambda t, i: True,
+            get_item_fade_info=lambda t, i: {"fade_in_length": 0.5},
+            bulk_item_ops=lambda ops: [True for _ in ops],
+        )
+    )
+    mcp = DummyMCP()
+    setup_mcp_tools(mcp, controller)
+    return mcp, controller
+
+@pytest.mark.parametrize("tool,kwargs", [
+    ("split_item", {"track_index": 0, "item_index": 0, "split_time": 1.0}),
+    ("glue_items", {"track_index": 0, "item_indices": [0, 1]}),
+    ("fade_in", {"track_index": 0, "item_index": 0, "fade_length": 0.5}),
+    ("fade_out", {"track_index": 0, "item_index": 0, "fade_length": 0.5}),
+    ("crossfade_items", {"track_index": 0, "item1_index": 0, "item2_index": 1, "crossfade_length": 0.2}),
+    ("reverse_item", {"track_index": 0, "item_index": 0}),
+    ("get_item_fade_info", {"track_index": 0, "item_index": 0}),
+    ("bulk_item_ops", {"ops": [{"op": "reverse", "track_index": 0, "item_index": 0}]}),
+])
+def test_advanced_item_tools_success(mcp_and_controller, tool, kwargs):
+    mcp, _ = mcp_and_controller
+    fn = mcp.tools[tool]
+    res = fn(None, **kwargs)
+    assert isinstance(res, dict)
+    assert res.get("status") in {"success", "error"}
+    assert "message" in res
+
+def test_bulk_item_ops_reports_failed_entries(mcp_and_controller):
+    mcp, controller = mcp_and_controller
+    controller.advanced_items.bulk_item_ops = lambda ops: [True, None, False]
+    ops = [{"op": "reverse"}, {"op": "unknown"}, {"op": "fade_in"}]
+    res = mcp.tools["bulk_item_ops"](None, ops=ops)
+    assert res["status"] == "error"
+    assert res["data"]["failed"] == [1, 2]
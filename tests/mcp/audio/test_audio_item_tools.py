@@ -40,6 +40,7 @@ def mcp_and_controller():
     ("set_item_position", {"track_index": 0, "item_id": 5, "position_time": 2.0}),
     ("set_item_length", {"track_index": 0, "item_id": 5, "length": 2.0}),
     ("get_items_in_time_range", {"track_index": 0, "start_time": 0.0, "end_time": 4.0}),
+    ("get_items_in_time_range_bulk", {"track_indices": [0, 1], "end_time": 4.0}),
     ("get_selected_items", {}),
 ])
 def test_audio_item_tools_success(mcp_and_controller, tool, kwargs):
@@ -49,3 +50,16 @@ def test_audio_item_tools_success(mcp_and_controller, tool, kwargs):
     assert isinstance(res, dict)
     assert res.get("status") in {"success", "error"}
     assert "message" in res
+
+def test_items_in_time_range_bulk_keys_by_track(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["get_items_in_time_range_bulk"](None, track_indices=[0, 2])
+    assert res["status"] == "success"
+    assert res["data"]["tracks"] == {0: [1, 2], 2: [1, 2]}
+    assert res["data"]["failed"] == []
+
+def test_items_in_time_range_are_returned_as_data(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["get_items_in_time_range"](None, track_index=0, end_time=4.0)
+    assert res["status"] == "success"
+    assert res["data"]["items"] == [1, 2]
@@ -1,4 +1,35 @@
 import pytest
+from types import SimpleNamespace
+from src.mcp_tools import setup_mcp_tools, FastMCP
+
+class DummyMCP(FastMCP):
+    def __init__(self):
+        super().__init__("reaper-reapy-mcp")
+        self.tools = {}
+    def tool(self, name):
+        def decorator(fn):
+            self.tools[name] = fn
+            return fn
+        return decorator
 
 def test_placeholder():
     assert True
+
+def test_add_automation_points_forwards_one_batch():
+    calls = []
+    controller = SimpleNamespace(
+        automation=SimpleNamespace(
+            add_automation_points=lambda t, env, points: calls.append(points) or len(points),
+        )
+    )
+    mcp = DummyMCP()
+    setup_mcp_tools(mcp, controller)
+
+    res = mcp.tools["add_automation_points"](
+        None,
+        track_index=0,
+        envelope_name="volume",
+        points=[{"time": 0.0, "value": 0.5}, {"time": 1.0, "value": 1.0, "shape": 1}],
+    )
+    assert res["status"] == "success"
+    assert calls == [[(0.0, 0.5, 0), (1.0, 1.0, 1)]]
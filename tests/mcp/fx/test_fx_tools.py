@@ -19,6 +19,7 @@ def mcp_and_controller():
             add_fx=lambda t, name: 0,
             remove_fx=lambda t, i: True,
             set_fx_param=lambda t, i, p, v: True,
+            set_fx_params=lambda t, i, values: {p: p != "Missing" for p in values},
             get_fx_param=lambda t, i, p: 0.5,
             get_fx_param_list=lambda t, i: ["Threshold", "Ratio"],
             get_fx_list=lambda t: [{"name": "ReaComp"}],
@@ -38,9 +39,11 @@ def mcp_and_controller():
     ("add_fx", {"track_index": 0, "fx_name": "ReaComp"}),
     ("remove_fx", {"track_index": 0, "fx_index": 0}),
     ("set_fx_param", {"track_index": 0, "fx_index": 0, "param_name": "Threshold", "value": -12.0}),
+    ("set_fx_params", {"track_index": 0, "fx_index": 0, "params": {"Threshold": -12.0, "Ratio": 4.0}}),
     ("get_fx_param", {"track_index": 0, "fx_index": 0, "param_name": "Threshold"}),
     ("get_fx_param_list", {"track_index": 0, "fx_index": 0}),
     ("get_fx_list", {"track_index": 0}),
+    ("get_fx_list_bulk", {"track_indices": [0, 1]}),
     ("get_available_fx_list", {}),
     ("toggle_fx", {"track_index": 0, "fx_index": 0, "enable": True}),
     ("set_compressor_params", {"track_index": 0, "fx_index": 0, "threshold": -18.0}),
@@ -55,3 +58,30 @@ def test_fx_tools_success(mcp_and_controller, tool, kwargs):
     assert isinstance(res, dict)
     assert res.get("status") in {"success", "error"}
     assert "message" in res
+
+def test_fx_queries_return_structured_data(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["get_fx_param"](None, track_index=0, fx_index=0, param_name="Threshold")
+    assert res["data"] == {"param_name": "Threshold", "value": 0.5}
+    res = mcp.tools["get_fx_list"](None, track_index=0)
+    assert res["data"]["fx"] == [{"name": "ReaComp"}]
+    assert res["message"] == "Found 1 FX on track 0"
+
+def test_available_fx_list_is_paged(mcp_and_controller):
+    mcp, controller = mcp_and_controller
+    controller.fx.get_available_fx_list = lambda: ["ReaComp", "ReaEQ", "ReaLimit", "ReaVerb"]
+    res = mcp.tools["get_available_fx_list"](None, offset=1, limit=2)
+    assert res["data"]["fx"] == ["ReaEQ", "ReaLimit"]
+    assert res["data"]["total"] == 4
+    assert res["data"]["next_offset"] == 3
+    res = mcp.tools["get_available_fx_list"](None, query="eq")
+    assert res["data"]["fx"] == ["ReaEQ"]
+    assert res["data"]["next_offset"] is None
+
+def test_set_fx_params_reports_unknown_names(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["set_fx_params"](
+        None, track_index=0, fx_index=0, params={"Threshold": -12.0, "Missing": 1.0}
+    )
+    assert res["status"] == "error"
+    assert res["data"]["not_found"] == ["Missing"]
@@ -18,6 +18,7 @@ def mcp_and_controller():
         midi=SimpleNamespace(
             create_midi_item=lambda t, st, l: 2,
             add_midi_note=lambda t, i, params: True,
+            add_midi_notes_batch=lambda t, i, notes: len(notes),
             clear_midi_item=lambda t, i: True,
             get_midi_notes=lambda t, i: [{"pitch": 60, "start": 0.0, "len": 1.0}],
             find_midi_notes_by_pitch=lambda lo, hi: [60, 64, 67],
@@ -31,6 +32,7 @@ def mcp_and_controller():
 @pytest.mark.parametrize("tool,kwargs", [
     ("create_midi_item", {"track_index": 0, "start_time": 0.0, "length": 1.0}),
     ("add_midi_note", {"track_index": 0, "item_id": 2, "pitch": 60, "start_time": 0.0, "length": 1.0, "velocity": 96}),
+    ("add_midi_notes_batch", {"track_index": 0, "item_id": 2, "notes": [{"pitch": 60, "start_time": 0.0, "length": 1.0}, {"pitch": 64, "start_time": 0.0, "length": 1.0, "velocity": 80}]}),
     ("clear_midi_item", {"track_index": 0, "item_id": 2}),
     ("get_midi_notes", {"track_index": 0, "item_id": 2}),
     ("find_midi_notes_by_pitch", {"pitch_min": 50, "pitch_max": 80}),
@@ -43,3 +45,12 @@ def test_midi_tools_success(mcp_and_controller, tool, kwargs):
     assert isinstance(res, dict)
     assert res.get("status") in {"success", "error"}
     assert "message" in res
+
+def test_midi_note_listings_are_paged(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["find_midi_notes_by_pitch"](None, offset=1, limit=1)
+    assert res["data"]["notes"] == [64]
+    assert res["data"]["total"] == 3
+    assert res["data"]["next_offset"] == 2
+    res = mcp.tools["get_midi_notes"](None, track_index=0, item_id=2)
+    assert res["data"]["next_offset"] is None
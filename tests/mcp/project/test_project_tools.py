@@ -47,3 +47,79 @@ def test_project_tools_success(mcp_and_controller, tool, kwargs):
     assert isinstance(res, dict)
     assert res.get("status") in {"success", "error"}
     assert "message" in res
+
+def test_batch_tool_call_runs_calls_in_order(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    calls = [
+        {"tool": "set_tempo", "args": {"bpm": 128.0}},
+        {"tool": "no_such_tool", "args": {}},
+        {"tool": "create_marker", "args": {"time": 1.0, "name": "Hit"}},
+    ]
+    res = mcp.tools["batch_tool_call"](None, calls=calls)
+    assert res["status"] == "error"
+    assert [r["status"] for r in res["data"]["results"]] == ["success", "error", "success"]
+    assert res["data"]["failed"] == [1]
+
+def test_batch_tool_call_stops_on_error(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    calls = [
+        {"tool": "set_tempo", "args": {"bpm": 128.0}},
+        {"tool": "no_such_tool", "args": {}},
+        {"tool": "create_marker", "args": {"time": 1.0, "name": "Hit"}},
+    ]
+    res = mcp.tools["batch_tool_call"](None, calls=calls, stop_on_error=True)
+    assert len(res["data"]["results"]) == 2
+    assert res["message"] == "Ran 1 of 3 tool calls"
+
+def test_batch_tool_call_shares_repeated_reads_until_a_write(mcp_and_controller):
+    mcp, controller = mcp_and_controller
+    reads = []
+    controller.project.get_tempo = lambda: reads.append(1) or 120.0
+    calls = [
+        {"tool": "get_tempo"},
+        {"tool": "get_tempo"},
+        {"tool": "set_tempo", "args": {"bpm": 90.0}},
+        {"tool": "get_tempo"},
+    ]
+    res = mcp.tools["batch_tool_call"](None, calls=calls)
+    assert res["status"] == "success"
+    assert len(res["data"]["results"]) == 4
+    assert len(reads) == 2
+
+def test_get_tempo_returns_structured_data(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["get_tempo"](None)
+    assert res["data"]["tempo"] == 120.0
+
+def test_batch_tool_call_holds_connection_only_across_reads(
+    mcp_and_controller, monkeypatch
+):
+    import contextlib
+    import src.mcp_tools as mcp_tools
+
+    mcp, controller = mcp_and_controller
+    depth = [0]
+    seen = []
+
+    @contextlib.contextmanager
+    def fake_inside_reaper():
+        depth[0] += 1
+        try:
+            yield
+        finally:
+            depth[0] -= 1
+
+    monkeypatch.setattr(mcp_tools, "inside_reaper", fake_inside_reaper)
+    controller.project.get_tempo = lambda: seen.append(("read", depth[0])) or 120.0
+    controller.project.set_tempo = lambda bpm: seen.append(("write", depth[0])) or True
+    calls = [
+        {"tool": "get_tempo"},
+        {"tool": "set_tempo", "args": {"bpm": 90.0}},
+        {"tool": "get_tempo"},
+    ]
+    res = mcp.tools["batch_tool_call"](None, calls=calls)
+    assert res["status"] == "success"
+    assert [kind for kind, _ in seen] == ["read", "write", "read"]
+    assert seen[0][1] >= 1 and seen[2][1] >= 1
+    assert seen[1][1] == 0
+    assert depth[0] == 0
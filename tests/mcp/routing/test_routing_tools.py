@@ -18,8 +18,8 @@ def mcp_and_controller():
         routing=SimpleNamespace(
             add_send=lambda *a, **k: 1,
             remove_send=lambda *a, **k: True,
-            get_sends=lambda t: [{"dest": 1}],
-            get_receives=lambda t: [{"src": 0}],
+            get_sends=lambda t: [SimpleNamespace(dest=1)],
+            get_receives=lambda t: [SimpleNamespace(src=0)],
             set_send_volume=lambda *a, **k: True,
             set_send_pan=lambda *a, **k: True,
             toggle_send_mute=lambda *a, **k: True,
@@ -53,3 +53,9 @@ def test_routing_tools_success(mcp_and_controller, tool, kwargs):
     assert isinstance(res, dict)
     assert res.get("status") in {"success", "error"}
     assert "message" in res
+
+def test_sends_are_returned_as_data(mcp_and_controller):
+    mcp, _ = mcp_and_controller
+    res = mcp.tools["get_sends"](None, track_index=0)
+    assert res["status"] == "success"
+    assert res["data"]["sends"] == [{"dest": 1}]
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict
+from src.mcp_tools import ReaperMCP, setup_mcp_tools
+
+def test_sync_tool_runs_on_reapy_thread():
+    mcp = ReaperMCP("reaper-reapy-mcp")
+    threads = []
+
+    @mcp.tool("probe")
+    def probe(track_index: int) -> Dict[str, Any]:
+        threads.append(threading.current_thread().name)
+        return {"status": "success", "message": f"track {track_index}"}
+
+    _, result = asyncio.run(mcp.call_tool("probe", {"track_index": 3}))
+    assert result["result"]["message"] == "track 3"
+    assert threads[0].startswith("reapy")
+    # The decorator hands back the plain function for direct calls
+    assert probe(4)["message"] == "track 4"
+
+def test_setup_tools_dispatch_through_reaper_mcp():
+    controller = SimpleNamespace(
+        track=SimpleNamespace(set_track_volume=lambda t, v: True)
+    )
+    mcp = ReaperMCP("reaper-reapy-mcp")
+    setup_mcp_tools(mcp, controller)
+    _, result = asyncio.run(
+        mcp.call_tool("set_track_volume", {"track_index": 0, "volume_db": -6.0})
+    )
+    assert result["result"]["status"] == "success"
+
+def test_tool_groups_limit_registration(monkeypatch):
+    monkeypatch.setenv("REAPY_MCP_TOOL_GROUPS", "lean")
+    mcp = ReaperMCP("reaper-reapy-mcp")
+    setup_mcp_tools(mcp, SimpleNamespace())
+    names = {t.name for t in asyncio.run(mcp.list_tools())}
+    assert {"set_track_volume", "add_fx", "batch_tool_call"} <= names
+    assert "add_midi_note" not in names
+    assert "insert_audio_item" not in names
+
+def test_enable_tool_group_registers_left_out_tools():
+    mcp = ReaperMCP("reaper-reapy-mcp")
+    setup_mcp_tools(mcp, SimpleNamespace(), groups={"core"})
+    assert "add_midi_note" not in {t.name for t in asyncio.run(mcp.list_tools())}
+    _, result = asyncio.run(mcp.call_tool("enable_tool_group", {"group": "midi"}))
+    assert result["result"]["status"] == "success"
+    names = {t.name for t in asyncio.run(mcp.list_tools())}
+    assert "add_midi_note" in names
+    assert "insert_audio_item" not in names
+
+def test_enable_tool_group_only_offered_when_groups_left_out():
+    mcp = ReaperMCP("reaper-reapy-mcp")
+    setup_mcp_tools(mcp, SimpleNamespace())
+    names = {t.name for t in asyncio.run(mcp.list_tools())}
+    assert "enable_tool_group" not in names
+
+def test_tool_list_is_compact():
+    mcp = ReaperMCP("reaper-reapy-mcp")
+    setup_mcp_tools(mcp, SimpleNamespace())
+    for tool in asyncio.run(mcp.list_tools()):
+        assert len(tool.description) <= 2048
+        assert not tool.description.startswith((" ", "\n"))
+        assert "title" not in tool.inputSchema
+        for prop in tool.inputSchema.get("properties", {}).values():
+            assert "title" not in prop
+
+def test_read_only_tools_are_annotated():
+    mcp = ReaperMCP("reaper-reapy-mcp")
+    setup_mcp_tools(mcp, SimpleNamespace())
+    tools = {t.name: t for t in asyncio.run(mcp.list_tools())}
+    assert tools["get_fx_list"].annotations.readOnlyHint is True
+    assert tools["set_tempo"].annotations is None
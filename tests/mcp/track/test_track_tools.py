@@ -18,6 +18,7 @@ def mcp_and_controller():
     controller = SimpleNamespace(
         track=SimpleNamespace(
             create_track=lambda name=None: 1,
+            create_tracks=lambda names: list(range(2, 2 + len(names))),
             rename_track=lambda idx, new: True,
             set_track_color=lambda idx, color: True,
             get_track_color=lambda idx: "#ff0000",
@@ -42,6 +43,7 @@ def mcp_and_controller():
 
 @pytest.mark.parametrize("tool,kwargs", [
     ("create_track", {"name": "Vox"}),
+    ("create_tracks_bulk", {"names": ["Drums", "Bass", None]}),
     ("rename_track", {"track_index": 0, "new_name": "Guitar"}),
     ("set_track_color", {"track_index": 0, "color": "#00ff00"}),
     ("get_track_color", {"track_index": 0}),